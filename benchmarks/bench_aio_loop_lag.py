@@ -0,0 +1,92 @@
+"""
+Benchmark the event loop lag while producing pUUIDs in an asyncio application.
+
+A ticker task sleeps for a fixed interval and records how late it wakes up while
+a consumer takes IDs in chunks, either generated inline on the loop or reserved
+from an `AsyncPUUIDSource`.
+
+Run with:
+
+    uv run python benchmarks/bench_aio_loop_lag.py [total] [chunk_size]
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Literal
+
+from puuid import PUUIDv7
+from puuid.aio import AsyncPUUIDSource
+
+EventUUID = PUUIDv7[Literal["event"]]
+
+TICK_INTERVAL = 0.001
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK_INTERVAL)
+        lags.append(time.perf_counter() - start - TICK_INTERVAL)
+
+
+async def _inline(chunk_size: int) -> list[EventUUID]:
+    return EventUUID.factory_many(chunk_size)
+
+
+async def _produce(
+    take: Callable[[int], Awaitable[list[EventUUID]]], total: int, chunk_size: int
+) -> None:
+    for _ in range(total // chunk_size):
+        _ = await take(chunk_size)
+        await asyncio.sleep(0)  # hand the loop to other tasks, like a request would
+
+
+async def _measure(
+    take: Callable[[int], Awaitable[list[EventUUID]]], total: int, chunk_size: int
+) -> tuple[float, list[float]]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    start = time.perf_counter()
+    await _produce(take, total, chunk_size)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return elapsed, lags
+
+
+def _report(name: str, total: int, elapsed: float, lags: list[float]) -> None:
+    p50 = statistics.median(lags)
+    p99 = statistics.quantiles(lags, n=100, method="inclusive")[98]
+    print(
+        f"{name:<22}{total / elapsed:>14,.0f} ids/s{len(lags):>8}"
+        f"{p50 * 1000:>10.2f} ms{p99 * 1000:>10.2f} ms{max(lags) * 1000:>10.2f} ms"
+    )
+
+
+async def _main(total: int, chunk_size: int) -> None:
+    print(f"total: {total:,}, chunk size: {chunk_size:,}, tick: {TICK_INTERVAL}s")
+    print(
+        f"{'producer':<22}{'throughput':>20}{'ticks':>8}"
+        f"{'p50 lag':>13}{'p99 lag':>13}{'max lag':>13}"
+    )
+    _report("inline factory_many", total, *await _measure(_inline, total, chunk_size))
+    async with AsyncPUUIDSource(EventUUID, batch_size=4 * chunk_size) as source:
+        _report(
+            "AsyncPUUIDSource",
+            total,
+            *await _measure(source.reserve, total, chunk_size),
+        )
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    asyncio.run(_main(total, chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark the string codecs against the `uuid.UUID` string conversion.
+
+For every codec the bare `decode`/`encode` of the UUID value is compared with
+`UUID(str)`/`str(UUID)` of the canonical form, followed by the full `from_string`
+and `to_string` round trip of a pUUID class using the codec.
+
+Run with:
+
+    uv run python benchmarks/bench_codecs.py [count]
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Literal
+from uuid import UUID
+
+from puuid import PUUIDBase, PUUIDv7
+from puuid.codec import CODECS, CodecName
+
+REPEAT = 5
+
+
+class Base32UUID(PUUIDv7[Literal["user"]], codec="base32"): ...
+
+
+class Base58UUID(PUUIDv7[Literal["user"]], codec="base58"): ...
+
+
+class Base62UUID(PUUIDv7[Literal["user"]], codec="base62"): ...
+
+
+class HexUUID(PUUIDv7[Literal["user"]], codec="hex"): ...
+
+
+_CLASSES: dict[CodecName, type[PUUIDBase[str]]] = {
+    "canonical": PUUIDv7[Literal["user"]],
+    "hex": HexUUID,
+    "base32": Base32UUID,
+    "base58": Base58UUID,
+    "base62": Base62UUID,
+}
+
+
+def _ns_per_item(stmt: Callable[[], object], count: int) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT)) / count * 1e9
+
+
+def _bench_codec(name: CodecName, uuids: list[UUID]) -> tuple[float, float]:
+    codec = CODECS[name]
+    values = [uuid.int for uuid in uuids]
+    bodies = [codec.encode(value) for value in values]
+    decode = _ns_per_item(lambda: [codec.decode(body) for body in bodies], len(uuids))
+    encode = _ns_per_item(lambda: [codec.encode(value) for value in values], len(uuids))
+    return decode, encode
+
+
+def _bench_class(
+    puuid_cls: type[PUUIDBase[str]], uuids: list[UUID]
+) -> tuple[float, float]:
+    serials = [puuid_cls._from_uuid(uuid).to_string() for uuid in uuids]
+    parse = _ns_per_item(
+        lambda: [puuid_cls.from_string(serial) for serial in serials], len(uuids)
+    )
+    format_ = _ns_per_item(
+        lambda: [puuid_cls._from_uuid(uuid).to_string() for uuid in uuids], len(uuids)
+    )
+    return parse, format_
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    uuids = [puuid.uuid for puuid in PUUIDv7[Literal["user"]].factory_many(count)]
+    canonical = [str(uuid) for uuid in uuids]
+    uuid_parse = _ns_per_item(lambda: [UUID(serial) for serial in canonical], count)
+    uuid_format = _ns_per_item(lambda: [str(uuid) for uuid in uuids], count)
+
+    print(f"ids: {count:,}, best of {REPEAT}, ns per id")
+    print(f"{'UUID(str)':<12}{uuid_parse:>10.0f}{'str(UUID)':>24}{uuid_format:>10.0f}")
+    print(
+        f"{'codec':<12}{'length':>8}{'decode':>10}{'vs UUID':>9}{'encode':>10}"
+        f"{'from_string':>13}{'to_string':>11}"
+    )
+    for name, puuid_cls in _CLASSES.items():
+        decode, encode = _bench_codec(name, uuids)
+        parse, format_ = _bench_class(puuid_cls, uuids)
+        print(
+            f"{name:<12}{CODECS[name].length:>8}{decode:>10.0f}"
+            f"{uuid_parse / decode:>8.1f}x{encode:>10.0f}{parse:>13.0f}{format_:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark deduplication and joins of pUUIDs with `set`/`dict` and the int-keyed
+`PUUIDSet`/`PUUIDDict`.
+
+Run with:
+
+    uv run python benchmarks/bench_containers.py [count]
+"""
+
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Literal
+
+from puuid import PUUIDDict, PUUIDSet, PUUIDv7
+
+EventUUID = PUUIDv7[Literal["event"]]
+REPEAT = 5
+
+
+def _best_of(stmt: Callable[[], object]) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    ids = EventUUID.factory_many(count)
+    duplicated = random.sample(ids + ids[: count // 2], count + count // 2)
+    serials = [event_id.to_string() for event_id in duplicated]
+    builtin_set, puuid_set = set(ids), PUUIDSet(EventUUID, ids)
+    probes = EventUUID.factory_many(count // 2) + ids[: count // 2]
+
+    print(f"ids: {count:,}, best of {REPEAT}")
+    for name, stmt in (
+        ("dedup set()", lambda: set(duplicated)),
+        ("dedup PUUIDSet", lambda: PUUIDSet(EventUUID, duplicated)),
+        ("strings set(from_string)", lambda: set(map(EventUUID.from_string, serials))),
+        ("strings PUUIDSet", lambda: PUUIDSet.from_strings(EventUUID, serials)),
+        ("membership set", lambda: sum(probe in builtin_set for probe in probes)),
+        ("membership PUUIDSet", lambda: sum(probe in puuid_set for probe in probes)),
+        ("intersect set", lambda: builtin_set & set(probes)),
+        ("intersect PUUIDSet", lambda: puuid_set & PUUIDSet(EventUUID, probes)),
+        ("join dict", lambda: dict(zip(duplicated, range(len(duplicated))))),
+        (
+            "join PUUIDDict",
+            lambda: PUUIDDict(EventUUID, zip(duplicated, range(len(duplicated)))),
+        ),
+    ):
+        print(f"{name:<28}{_best_of(stmt) * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark `factory_many` against calling `factory` in a loop.
+
+Run with:
+
+    uv run python benchmarks/bench_factory_many.py [batch_size]
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Literal
+
+from puuid import PUUIDBase, PUUIDv1, PUUIDv4, PUUIDv6, PUUIDv7, PUUIDv8
+
+REPEAT = 5
+
+
+def _best_of(stmt: Callable[[], object]) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT))
+
+
+def bench(puuid_cls: type[PUUIDBase[str]], batch_size: int) -> None:
+    loop = _best_of(lambda: [puuid_cls.factory() for _ in range(batch_size)])
+    batch = _best_of(lambda: puuid_cls.factory_many(batch_size))
+
+    print(
+        f"{puuid_cls.__name__:<16}"
+        f"{batch_size / loop:>14,.0f} ops/s"
+        f"{batch_size / batch:>14,.0f} ops/s"
+        f"{loop / batch:>10.2f}x"
+    )
+
+
+def main() -> None:
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"batch size: {batch_size:,}, best of {REPEAT}")
+    print(f"{'class':<16}{'factory()':>20}{'factory_many()':>20}{'speedup':>11}")
+    for generic_cls in (PUUIDv1, PUUIDv4, PUUIDv6, PUUIDv7, PUUIDv8):
+        bench(generic_cls[Literal["bench"]], batch_size)
+
+
+if __name__ == "__main__":
+    main()
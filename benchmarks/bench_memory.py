@@ -0,0 +1,97 @@
+"""
+Measure the memory footprint per pUUID instance.
+
+Compares the current layout (128-bit integer and serial cache in `__slots__`) with
+stand-ins of the former layouts holding a `uuid.UUID` object and the serial cache,
+first in a per-instance `__dict__` (before pUUID switched to `__slots__`) and then
+in `__slots__` (before the UUID object was created lazily).
+
+Each instance is built from its own 16 bytes, so everything it references (dict,
+UUID object, integer, string) is counted once per instance.
+
+Run with:
+
+    uv run python benchmarks/bench_memory.py [count]
+"""
+
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Literal
+from uuid import UUID, uuid7
+
+from puuid import PUUIDv7
+
+UserUUID = PUUIDv7[Literal["user"]]
+
+
+class DictLayoutUUID:
+    """Attributes of the original layout, stored in a per-instance `__dict__`."""
+
+    def __init__(self, uuid: UUID) -> None:
+        self._uuid = uuid
+        self._serial: str | None = None
+
+    def to_string(self) -> str:
+        if self._serial is None:
+            self._serial = f"user_{self._uuid}"
+        return self._serial
+
+
+class SlottedUUIDLayout:
+    """Attributes of the original layout, stored in `__slots__`."""
+
+    __slots__ = ("_serial", "_uuid")
+
+    def __init__(self, uuid: UUID) -> None:
+        self._uuid = uuid
+        self._serial: str | None = None
+
+    def to_string(self) -> str:
+        if self._serial is None:
+            self._serial = f"user_{self._uuid}"
+        return self._serial
+
+
+type Layout = Callable[[UUID], DictLayoutUUID | SlottedUUIDLayout | UserUUID]
+
+
+def traced_bytes_per_item(layout: Layout, raws: list[bytes], serialize: bool) -> float:
+    tracemalloc.start()
+    items = [layout(UUID(bytes=raw)) for raw in raws]
+    if serialize:
+        for item in items:
+            _ = item.to_string()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # do not count the list holding the items
+    return (size - sys.getsizeof(items)) / len(items)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    raws = [uuid7().bytes for _ in range(count)]
+    layouts: list[tuple[str, Layout]] = [
+        ("__dict__ + UUID", DictLayoutUUID),
+        ("__slots__ + UUID", SlottedUUIDLayout),
+        ("__slots__ + int", UserUUID),
+    ]
+
+    print(f"instances: {count:,}, bytes per instance")
+    print(f"{'layout':<20}{'instance':>12}{'serialized':>12}{'change':>16}")
+    baseline: tuple[float, float] | None = None
+    for name, layout in layouts:
+        sizes = (
+            traced_bytes_per_item(layout, raws, serialize=False),
+            traced_bytes_per_item(layout, raws, serialize=True),
+        )
+        baseline = baseline or sizes
+        changes = [size / base - 1 for size, base in zip(sizes, baseline)]
+        print(
+            f"{name:<20}{sizes[0]:>10.0f} B{sizes[1]:>10.0f} B"
+            f"{changes[0]:>+9.0%}{changes[1]:>+7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the vectorized NumPy parsing/formatting against the per-object path.
+
+Run with:
+
+    uv run python benchmarks/bench_numpy.py [count]
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from typing import Literal
+
+import numpy as np
+
+from puuid import PUUIDv7
+from puuid.numpy import format_strings, parse_strings
+
+UserUUID = PUUIDv7[Literal["user"]]
+REPEAT = 5
+
+
+def _best_of(stmt: Callable[[], object]) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    ids = UserUUID.factory_many(count)
+    serial_list = [user_id.to_string() for user_id in ids]
+    serials = np.array(serial_list)
+    uuids = parse_strings(serials, UserUUID).uuids
+
+    parse_objects = _best_of(lambda: [UserUUID.from_string(s) for s in serial_list])
+    parse_vectorized = _best_of(lambda: parse_strings(serials, UserUUID))
+    format_objects = _best_of(
+        lambda: [UserUUID._from_uuid(i.uuid).to_string() for i in ids]
+    )
+    format_vectorized = _best_of(lambda: format_strings(uuids, UserUUID))
+
+    print(f"rows: {count:,}, best of {REPEAT}")
+    print(f"{'':<8}{'per object':>16}{'vectorized':>16}{'speedup':>10}")
+    for name, objects, vectorized in (
+        ("parse", parse_objects, parse_vectorized),
+        ("format", format_objects, format_vectorized),
+    ):
+        print(
+            f"{name:<8}{count / objects:>12,.0f} /s{count / vectorized:>12,.0f} /s"
+            f"{objects / vectorized:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
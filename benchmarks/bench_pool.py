@@ -0,0 +1,57 @@
+"""
+Benchmark the per-call latency of `PUUIDPool.take` against `factory`.
+
+Run with:
+
+    uv run python benchmarks/bench_pool.py [calls]
+"""
+
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from typing import Literal
+
+from puuid import PUUIDBase, PUUIDv4, PUUIDv7
+from puuid.pool import PUUIDPool
+
+PERCENTILES = (50, 99, 99.9)
+
+
+def _latencies_ns(stmt: Callable[[], object], calls: int) -> list[int]:
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter_ns()
+        stmt()
+        latencies.append(time.perf_counter_ns() - start)
+    return latencies
+
+
+def _percentiles(latencies: list[int]) -> list[float]:
+    quantiles = statistics.quantiles(latencies, n=1000)
+    return [quantiles[int(percentile * 10) - 1] for percentile in PERCENTILES]
+
+
+def bench(puuid_cls: type[PUUIDBase[str]], calls: int) -> None:
+    with PUUIDPool(puuid_cls, size=4096) as pool:
+        rows = {
+            "factory()": _latencies_ns(puuid_cls.factory, calls),
+            "pool.take()": _latencies_ns(pool.take, calls),
+        }
+    for name, latencies in rows.items():
+        values = "".join(f"{value:>12,.0f}" for value in _percentiles(latencies))
+        print(f"{puuid_cls.__name__:<16}{name:<14}{values}")
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    print(f"calls: {calls:,}, latency in ns")
+    header = "".join(f"{f'p{percentile}':>12}" for percentile in PERCENTILES)
+    print(f"{'class':<16}{'call':<14}{header}")
+    for generic_cls in (PUUIDv4, PUUIDv7):
+        bench(generic_cls[Literal["bench"]], calls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark sorting and merging of time-ordered pUUIDs.
+
+Compares the former `key=lambda p: p.uuid` idiom with the rich comparisons and
+the integer `sort_key`.
+
+Run with:
+
+    uv run python benchmarks/bench_sort.py [count]
+"""
+
+import heapq
+import random
+import sys
+import timeit
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Literal
+
+from puuid import PUUIDv7
+
+EventUUID = PUUIDv7[Literal["event"]]
+REPEAT = 5
+RUNS = 8
+
+
+def _best_of(stmt: Callable[[], object]) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    ids = EventUUID.factory_many(count)
+    shuffled = random.sample(ids, count)
+    runs = [ids[offset::RUNS] for offset in range(RUNS)]
+    sort_key = attrgetter("sort_key")
+
+    print(f"ids: {count:,}, best of {REPEAT}")
+    for name, stmt in (
+        ("sorted(key=.uuid)", lambda: sorted(shuffled, key=lambda p: p.uuid)),
+        ("sorted()", lambda: sorted(shuffled)),
+        ("sorted(key=sort_key)", lambda: sorted(shuffled, key=sort_key)),
+        ("merge(key=.uuid)", lambda: list(heapq.merge(*runs, key=lambda p: p.uuid))),
+        ("merge()", lambda: list(heapq.merge(*runs))),
+        ("merge(key=sort_key)", lambda: list(heapq.merge(*runs, key=sort_key))),
+    ):
+        print(f"{name:<24}{_best_of(stmt) * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Benchmark suite of the hot paths of pUUID with a stored baseline.
+
+Measures ops/sec and the peak bytes allocated per operation of the factory,
+parsing, serialization, hashing, equality, class specialization, pydantic
+validation/serialization and the `SqlPUUID` round trip against SQLite. Benchmarks
+of missing optional dependencies are skipped.
+
+A run can be saved as JSON baseline and later runs compared against it. The
+comparison exits with status 1 if a benchmark is slower or allocates more than the
+thresholds allow, so performance changes are measured instead of guessed. Compare
+only baselines taken on the same machine and Python build.
+
+Run with:
+
+    uv run python benchmarks/suite.py [--filter NAME]
+    uv run python benchmarks/suite.py --save [--baseline PATH]
+    uv run python benchmarks/suite.py --compare [--threshold 0.1] [--alloc-threshold 0.1]
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Literal, NamedTuple
+
+from puuid import PUUIDBase, PUUIDv4, PUUIDv7
+
+type Benchmark = tuple[str, Callable[[], object]]
+
+UserUUID = PUUIDv7[Literal["user"]]
+TokenUUID = PUUIDv4[Literal["tok"]]
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+REPEAT = 5
+ALLOC_RUNS = 100
+# allocation differences below this are noise, e.g. from interpreter caches
+ALLOC_SLACK_BYTES = 64
+
+
+class Result(NamedTuple):
+    ops_per_sec: float
+    alloc_bytes: int
+
+
+def uncached_to_string(puuid: PUUIDBase[str]) -> str:
+    puuid._serial = None  # time the formatting, not the cached string
+    return puuid.to_string()
+
+
+def core_benchmarks() -> list[Benchmark]:
+    user_id = UserUUID.factory()
+    same_id = UserUUID.from_string(user_id.to_string())
+    serial = user_id.to_string()
+    return [
+        ("factory.v7", UserUUID.factory),
+        ("factory.v4", TokenUUID.factory),
+        ("from_string", lambda: UserUUID.from_string(serial)),
+        ("from_string.trusted", lambda: UserUUID.from_string(serial, trusted=True)),
+        ("to_string", lambda: uncached_to_string(user_id)),
+        ("hash", lambda: hash(user_id)),
+        ("eq", lambda: user_id == same_id),
+        ("class_getitem", lambda: PUUIDv7[Literal["user"]]),
+    ]
+
+
+def pydantic_benchmarks() -> list[Benchmark]:
+    from pydantic import TypeAdapter
+
+    adapter = TypeAdapter(UserUUID)
+    user_id = UserUUID.factory()
+    serial = user_id.to_string()
+    return [
+        ("pydantic.validate", lambda: adapter.validate_python(serial)),
+        ("pydantic.validate_json", lambda: adapter.validate_json(f'"{serial}"')),
+        ("pydantic.dump_json", lambda: adapter.dump_json(user_id)),
+    ]
+
+
+def sqlalchemy_benchmarks() -> list[Benchmark]:
+    from sqlalchemy import Column, MetaData, Table, create_engine, insert, select
+
+    from puuid.sqlalchemy import SqlPUUID
+
+    table = Table(
+        "users",
+        MetaData(),
+        Column("id", SqlPUUID(UserUUID), primary_key=True),
+        Column("binary_id", SqlPUUID(UserUUID, binary=True)),
+        Column("trusted_id", SqlPUUID(UserUUID, trusted=True)),
+    )
+    connection = create_engine("sqlite://").connect()
+    table.metadata.create_all(connection)
+    user_id = UserUUID.factory()
+    _ = connection.execute(
+        insert(table), {"id": user_id, "binary_id": user_id, "trusted_id": user_id}
+    )
+    by_id = select(table.c.id).where(table.c.id == user_id)
+    by_binary_id = select(table.c.binary_id).where(table.c.binary_id == user_id)
+    by_trusted_id = select(table.c.trusted_id).where(table.c.trusted_id == user_id)
+    return [
+        ("sqlalchemy.roundtrip", lambda: connection.execute(by_id).scalar_one()),
+        (
+            "sqlalchemy.roundtrip_binary",
+            lambda: connection.execute(by_binary_id).scalar_one(),
+        ),
+        (
+            "sqlalchemy.roundtrip_trusted",
+            lambda: connection.execute(by_trusted_id).scalar_one(),
+        ),
+    ]
+
+
+def all_benchmarks() -> list[Benchmark]:
+    benchmarks = core_benchmarks()
+    if importlib.util.find_spec("pydantic") is not None:
+        benchmarks += pydantic_benchmarks()
+    if importlib.util.find_spec("sqlalchemy") is not None:
+        benchmarks += sqlalchemy_benchmarks()
+    return benchmarks
+
+
+def ops_per_sec(stmt: Callable[[], object]) -> float:
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=REPEAT, number=number))
+
+
+def alloc_bytes(stmt: Callable[[], object]) -> int:
+    """Peak of the memory traced while running `stmt`, i.e. bytes of one operation."""
+    _ = stmt()  # warm up caches
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(ALLOC_RUNS):
+            _ = stmt()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def run(name_filter: str) -> dict[str, Result]:
+    results: dict[str, Result] = {}
+    for name, stmt in all_benchmarks():
+        if name_filter in name:
+            results[name] = Result(ops_per_sec(stmt), alloc_bytes(stmt))
+            print(
+                f"{name:<32}{results[name].ops_per_sec:>14,.0f} ops/s"
+                f"{results[name].alloc_bytes:>10,} B"
+            )
+    return results
+
+
+def save(path: Path, results: dict[str, Result]) -> None:
+    baseline = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": {name: result._asdict() for name, result in results.items()},
+    }
+    _ = path.write_text(json.dumps(baseline, indent=2) + "\n")
+    print(f"baseline written to {path}")
+
+
+def load(path: Path) -> dict[str, Result]:
+    baseline = json.loads(path.read_text())
+    if baseline["python"] != sys.version:
+        print(f"warning: baseline was taken with Python {baseline['python']}")
+    return {name: Result(**values) for name, values in baseline["results"].items()}
+
+
+def is_regression(
+    current: Result, previous: Result, threshold: float, alloc_threshold: float
+) -> bool:
+    slower = current.ops_per_sec < previous.ops_per_sec * (1 - threshold)
+    alloc_limit = max(
+        previous.alloc_bytes * (1 + alloc_threshold),
+        previous.alloc_bytes + ALLOC_SLACK_BYTES,
+    )
+    return slower or current.alloc_bytes > alloc_limit
+
+
+def compare(
+    results: dict[str, Result],
+    baseline: dict[str, Result],
+    threshold: float,
+    alloc_threshold: float,
+) -> list[str]:
+    """Print the changes against the baseline and return the regressed benchmarks."""
+    print(f"\n{'benchmark':<32}{'speed':>10}{'alloc':>12}")
+    regressions: list[str] = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<32}{'new':>10}")
+            continue
+        speed = current.ops_per_sec / previous.ops_per_sec - 1
+        alloc = current.alloc_bytes - previous.alloc_bytes
+        regressed = is_regression(current, previous, threshold, alloc_threshold)
+        if regressed:
+            regressions.append(name)
+        marker = "  REGRESSION" if regressed else ""
+        print(f"{name:<32}{speed:>+10.1%}{alloc:>+10,} B{marker}")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    mode = parser.add_mutually_exclusive_group()
+    _ = mode.add_argument("--save", action="store_true", help="write the baseline")
+    _ = mode.add_argument(
+        "--compare", action="store_true", help="compare against the baseline"
+    )
+    _ = parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    _ = parser.add_argument(
+        "--threshold", type=float, default=0.1, help="tolerated slowdown (0.1 = 10%%)"
+    )
+    _ = parser.add_argument(
+        "--alloc-threshold",
+        type=float,
+        default=0.1,
+        help="tolerated growth of the allocated bytes (0.1 = 10%%)",
+    )
+    _ = parser.add_argument(
+        "--filter", default="", help="only run benchmarks containing this string"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    print(f"Python {platform.python_version()}, best of {REPEAT}")
+    results = run(args.filter)
+    if args.save:
+        save(args.baseline, results)
+        return 0
+    if not args.compare:
+        return 0
+    baseline = load(args.baseline)
+    regressions = compare(results, baseline, args.threshold, args.alloc_threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,7 +18,11 @@ from puuid.base import (
     PUUIDv6,
     PUUIDv7,
     PUUIDv8,
+    register_puuid,
 )
+from puuid.containers import PUUIDArray, PUUIDDict, PUUIDSet
+from puuid.generator import PUUIDv7Generator
+from puuid.pool import PUUIDPool
 
 PUUID = PUUIDBase  # backwards compatibility
 
@@ -32,4 +36,10 @@ __all__ = [
     "PUUIDv7",
     "PUUIDv8",
     "PUUIDError",
+    "PUUIDArray",
+    "PUUIDSet",
+    "PUUIDDict",
+    "PUUIDv7Generator",
+    "PUUIDPool",
+    "register_puuid",
 ]
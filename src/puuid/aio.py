@@ -0,0 +1,188 @@
+"""
+pUUID asyncio Support.
+
+Provides an ID source for asyncio applications that generates pUUIDs in an
+executor, so the event loop never blocks on entropy reads or clock handling.
+"""
+
+import asyncio
+import contextlib
+from collections import deque
+from concurrent.futures import Executor
+from contextlib import AbstractAsyncContextManager
+from types import TracebackType
+from typing import Self, override
+
+from puuid.base import ERR_MSG, PUUIDBase, PUUIDError, _check_batch_size
+
+
+class AsyncPUUIDSource[T: PUUIDBase[str]]:
+    """
+    Awaitable source of pUUIDs with prefetching.
+
+    IDs are handed out from a buffer. Once the buffer drops below half of
+    `batch_size`, the next `factory_many` batch is generated in an executor while
+    the buffered IDs are consumed.
+
+    Parameters
+    ----------
+    puuid_cls : type[T]
+        The pUUID class to generate, must support `factory_many` (v1, v4, v6, v7
+        and v8).
+    batch_size : int, optional
+        Number of IDs generated per executor job.
+    limit : asyncio.Semaphore | None, optional
+        Back-pressure limit acquired around every executor job. Share one
+        semaphore between sources to cap the number of concurrent jobs.
+    executor : Executor | None, optional
+        Executor running the generation, defaults to the loop's default executor.
+
+    Raises
+    ------
+    PUUIDError
+        If `puuid_cls` does not support `factory_many` or `batch_size` is not
+        positive.
+    """
+
+    def __init__(
+        self,
+        puuid_cls: type[T],
+        batch_size: int = 1024,
+        *,
+        limit: asyncio.Semaphore | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        if (
+            isinstance(batch_size, bool)
+            or not isinstance(batch_size, int)
+            or batch_size < 1
+        ):
+            raise PUUIDError(
+                ERR_MSG.INVALID_SOURCE_BATCH_SIZE.format(
+                    classname=type(self).__name__, batch_size=batch_size
+                )
+            )
+        _ = puuid_cls.factory_many(0)  # raises for classes without bulk generation
+        self._puuid_cls = puuid_cls
+        self._batch_size = batch_size
+        self._low_watermark = batch_size // 2
+        self._limit: AbstractAsyncContextManager[None] = (
+            contextlib.nullcontext() if limit is None else limit
+        )
+        self._executor = executor
+        self._buffer: deque[T] = deque()
+        self._refill_task: asyncio.Task[None] | None = None
+
+    @property
+    def puuid_cls(self) -> type[T]:
+        """
+        Return the pUUID class of the source.
+
+        Returns
+        -------
+        type[T]
+            The pUUID class.
+        """
+        return self._puuid_cls
+
+    async def _generate(self, n: int) -> list[T]:
+        loop = asyncio.get_running_loop()
+        async with self._limit:
+            return await loop.run_in_executor(
+                self._executor, self._puuid_cls.factory_many, n
+            )
+
+    async def _refill(self) -> None:
+        self._buffer.extend(await self._generate(self._batch_size))
+
+    def _start_refill(self) -> asyncio.Task[None]:
+        """Return the running refill task, start one if there is none."""
+        task = self._refill_task
+        if task is None or task.done():
+            task = asyncio.create_task(self._refill())
+            self._refill_task = task
+        return task
+
+    def _prefetch(self) -> None:
+        if len(self._buffer) < self._low_watermark:
+            _ = self._start_refill()
+
+    async def next(self) -> T:
+        """
+        Return the next pUUID.
+
+        Waits for the executor only if the buffer is empty.
+
+        Returns
+        -------
+        T
+            A pUUID that has not been handed out before.
+        """
+        while not self._buffer:
+            await asyncio.shield(self._start_refill())
+        item = self._buffer.popleft()
+        self._prefetch()
+        return item
+
+    async def reserve(self, n: int) -> list[T]:
+        """
+        Reserve `n` pUUIDs at once.
+
+        Buffered IDs are used first, the rest is generated in a single executor
+        job.
+
+        Parameters
+        ----------
+        n : int
+            Number of pUUIDs to reserve.
+
+        Returns
+        -------
+        list[T]
+            The reserved pUUIDs.
+
+        Raises
+        ------
+        PUUIDError
+            If `n` is negative.
+        """
+        _check_batch_size(n)
+        buffer = self._buffer
+        reserved = [buffer.popleft() for _ in range(min(n, len(buffer)))]
+        if len(reserved) < n:
+            reserved.extend(await self._generate(n - len(reserved)))
+        self._prefetch()
+        return reserved
+
+    async def aclose(self) -> None:
+        """Cancel a pending refill and discard the buffered pUUIDs."""
+        task = self._refill_task
+        if task is not None and not task.done():
+            _ = task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._buffer.clear()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> T:
+        return await self.next()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self._puuid_cls.__name__}, "
+            f"batch_size={self._batch_size})"
+        )
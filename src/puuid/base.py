@@ -5,7 +5,13 @@ Provides the abstract base class and version-specific implementations for Prefix
 """
 
 import annotationlib
+import datetime as dt
+import os
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from types import GenericAlias
 from typing import (
     TYPE_CHECKING,
@@ -23,38 +29,86 @@ from typing import (
     overload,
     override,
 )
-from uuid import UUID, uuid1, uuid3, uuid4, uuid5, uuid6, uuid7, uuid8
+from uuid import UUID, getnode, uuid1, uuid3, uuid4, uuid5, uuid6, uuid7, uuid8
 
+from puuid.cache import CacheInfo, InternCache
+from puuid.codec import CANONICAL, CODECS, CodecName, PUUIDCodec
+
+# pydantic is imported on first use by the schema hooks, which keeps it out of the
+# import time of `puuid` for processes that never validate with pydantic
 if TYPE_CHECKING:
-    from pydantic import GetCoreSchemaHandler
+    from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+    from pydantic.json_schema import JsonSchemaValue
     from pydantic_core import core_schema
 
-    _PYDANTIC_AVAILABLE = True
-else:
-    try:
-        from pydantic import GetCoreSchemaHandler
-        from pydantic_core import core_schema
-
-        _PYDANTIC_AVAILABLE = True
-    except ModuleNotFoundError:
-        _PYDANTIC_AVAILABLE = False
-
-        class GetCoreSchemaHandler: ...
-
-        class _CoreSchema: ...
-
-        @final
-        class core_schema:
-            CoreSchema = _CoreSchema
-
 
 @final
 class ERR_MSG:
     UUID_VERSION_MISMATCH = "Expected 'UUID' with version '{expected}', got '{actual}'"
     FACTORY_UNSUPPORTED = "'PUUID.factory' is only supported for 'PUUIDv1', 'PUUIDv4', 'PUUIDv6', 'PUUIDv7' and 'PUUIDv8'!"
+    FACTORY_MANY_UNSUPPORTED = "'PUUID.factory_many' is only supported for 'PUUIDv1', 'PUUIDv4', 'PUUIDv6', 'PUUIDv7' and 'PUUIDv8'!"
+    MISSING_PREFIX_SEPARATOR = (
+        "Unable to find the prefix separator '_' in '{serial_puuid}'!"
+    )
+    UNKNOWN_PREFIX = (
+        "No pUUID class is registered for prefix '{prefix}' of '{serial_puuid}'!"
+    )
+    UNKNOWN_PREFIX_VERSION = "No pUUID class with UUID version '{version}' is registered for prefix '{prefix}' of '{serial_puuid}'!"
+    PREFIX_ALREADY_REGISTERED = "Prefix '{prefix}' with UUID version '{version}' is already registered for '{registered}', unable to register '{classname}'!"
+    PARSE_ANY_CLASS_MISMATCH = "'{serial_puuid}' belongs to '{registered}', which is not a subclass of '{classname}'!"
+    INVALID_BATCH_SIZE = "Batch size must be a non-negative integer, got '{n}'!"
+    ARRAY_ITEM_TYPE_MISMATCH = "'{classname}' of '{expected}' can not hold '{actual}'!"
+    ARRAY_VIEW_NOT_RESIZABLE = (
+        "'{classname}' slices are fixed-size views and can not be resized!"
+    )
+    ARRAY_BUFFER_LENGTH = (
+        "Buffer length '{length}' is not a multiple of '{item_size}' bytes!"
+    )
+    ARRAY_BUFFER_VERSION_MISMATCH = (
+        "Buffer item at index '{index}' is not a valid UUID with version '{version}'!"
+    )
+    GENERATOR_CLASS_MISMATCH = (
+        "'{generator}' requires a '{expected}' class, got '{classname}'!"
+    )
+    INVALID_SNOWFLAKE_LAYOUT = "Snowflake layout requires a positive timestamp width and at most 122 bits in total, got '{timestamp_bits}' timestamp, '{shard_bits}' shard and '{sequence_bits}' sequence bits!"
+    INVALID_SHARD = "Shard '{shard}' does not fit into '{shard_bits}' bits!"
+    SNOWFLAKE_TIMESTAMP_OVERFLOW = "Timestamp '{timestamp_ms}' ms does not fit into '{timestamp_bits}' bits after epoch '{epoch_ms}' ms!"
+    UNKNOWN_GENERATOR_OPTION = (
+        "Unknown {option} '{value}' for '{generator}', expected one of {choices}!"
+    )
+    INVALID_COUNTER_BITS = "Counter width for method '{method}' must be in range [{low}, {high}], got '{counter_bits}'!"
+    CLOCK_REGRESSION = (
+        "Clock moved backwards by '{delta_ms}' ms while generating '{classname}'!"
+    )
+    INVALID_POOL_SIZE = "Pool size must be positive and the low watermark in range [0, size), got size '{size}' and low watermark '{low_watermark}'!"
+    INVALID_SOURCE_BATCH_SIZE = (
+        "Batch size of '{classname}' must be a positive integer, got '{batch_size}'!"
+    )
+    POOL_CLOSED = "'{classname}' of '{puuid_cls}' is closed!"
     PREFIX_DESERIALIZATION_ERROR = "Unable to deserialize prefix '{prefix}', separator '_' or UUID for '{classname}' from '{serial_puuid}'!"
-    INVALID_TYPE_FOR_SERIAL_PUUID = "'{classname}' can not be created from invalid type '{type}' with value '{value}'!"
     EMPTY_PREFIX_DISALLOWED = "Empty prefix is not allowed for '{classname}'!"
+    BYTES_TOO_SHORT = (
+        "Unable to read '{needed}' bytes at offset '{offset}' from '{length}' bytes!"
+    )
+    BYTES_VERSION_MISMATCH = "Bytes at offset '{offset}' are not a UUID with version '{version}' for '{classname}'!"
+    INVALID_BYTES_TAG = (
+        "Invalid pUUID tag at offset '{offset}', the prefix is not valid UTF-8!"
+    )
+    UNKNOWN_BYTES_TAG = "No pUUID class with UUID version '{version}' is registered for prefix '{prefix}'!"
+    INVALID_CACHE_SIZE = (
+        "Cache size of '{classname}' must be a positive integer, got '{maxsize}'!"
+    )
+    TAGGED_CLASS_MISMATCH = "Tagged pUUID with prefix '{prefix}' belongs to '{registered}', which is not a subclass of '{classname}'!"
+    PREFIX_TOO_LONG_FOR_TAG = "Prefix of '{classname}' has '{length}' bytes, tagged bytes support at most 255!"
+    UNKNOWN_CODEC = (
+        "Unknown codec '{codec}' for '{classname}', expected one of {codecs}!"
+    )
+    CODEC_UNSUPPORTED = "'{function}' only supports the 'canonical' codec, '{classname}' uses '{codec}'!"
+    TIMESTAMP_OUT_OF_RANGE = (
+        "Timestamp '{timestamp_ns}' ns is out of the range of '{classname}'!"
+    )
+    TIME_RANGE_UNSUPPORTED = "'{function}' requires a column of 'PUUIDv6' or 'PUUIDv7' IDs, got '{classname}'!"
+    TIMESTAMP_UNSUPPORTED = "'{function}' only supports 'PUUIDv1', 'PUUIDv6' and 'PUUIDv7', got '{classname}'!"
     INVALID_PUUIDv1_ARGS = "Invalid 'PUUIDv1' arguments: Provide either 'node' and 'clock_seq' or a 'uuid'!"
     INVALID_PUUIDv3_ARGS = "Invalid 'PUUIDv3' arguments: Provide either 'namespace' and 'name' or a 'uuid'!"
     INVALID_PUUIDv5_ARGS = "Invalid 'PUUIDv5' arguments: Provide either 'namespace' and 'name' or a 'uuid'!"
@@ -85,6 +139,16 @@ type _ClassGetItemReturn = GenericAlias | _PUUIDClass
 type _SpecializationCacheKey = tuple[_PUUIDClass, str]
 _SPECIALIZATION_CACHE: dict[_SpecializationCacheKey, _PUUIDClass] = {}
 
+# front cache of `__class_getitem__` keyed by the identity of the subscription item
+# (e.g. `Literal["user"]`), each entry keeps its item alive so the id is not reused
+type _SubscriptionCacheKey = tuple[_PUUIDClass, int]
+_SUBSCRIPTION_CACHE: dict[_SubscriptionCacheKey, tuple[object, _PUUIDClass]] = {}
+_SUBSCRIPTION_CACHE_MAXSIZE = 4096
+
+# serializes the creation of specializations and registry updates, lookups are
+# lock-free as both only ever publish complete entries
+_SPECIALIZATION_LOCK = threading.RLock()
+
 
 def _evaluate_type_alias(value: object) -> object:
     """
@@ -164,6 +228,7 @@ def _build_specialized_puuid_class(
         new_name,
         (cls,),
         {
+            "__slots__": (),
             "_prefix": prefix,
             "__doc__": cls.__doc__,
             "__module__": cls.__module__,
@@ -187,9 +252,66 @@ def _get_or_create_specialization(
     if cached is not None:
         return cached
 
-    specialized = _build_specialized_puuid_class(cls, args_tuple, prefix)
-    _SPECIALIZATION_CACHE[key] = specialized
-    return specialized
+    with _SPECIALIZATION_LOCK:
+        # another thread may have created it while this one waited for the lock
+        cached = _SPECIALIZATION_CACHE.get(key)
+        if cached is not None:
+            return cached
+        specialized = _build_specialized_puuid_class(cls, args_tuple, prefix)
+        _register_puuid_class(specialized, strict=False)
+        _SPECIALIZATION_CACHE[key] = specialized
+        return specialized
+
+
+def _remember_subscription(
+    cls: _PUUIDClass, item: object, specialized: _PUUIDClass
+) -> None:
+    if _is_object_tuple(item):
+        return  # `C[(X,)]` creates a new tuple per subscription
+    if len(_SUBSCRIPTION_CACHE) >= _SUBSCRIPTION_CACHE_MAXSIZE:
+        _SUBSCRIPTION_CACHE.clear()
+    _SUBSCRIPTION_CACHE[(cls, id(item))] = (item, specialized)
+
+
+def _reset_specialization_lock_after_fork() -> None:
+    # a lock held by another thread while forking would never be released
+    global _SPECIALIZATION_LOCK
+    _SPECIALIZATION_LOCK = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_specialization_lock_after_fork)
+
+
+def _resolve_codec(cls: type, codec: CodecName | PUUIDCodec) -> PUUIDCodec:
+    if isinstance(codec, PUUIDCodec):
+        return codec
+    resolved = CODECS.get(codec)
+    if resolved is None:
+        raise PUUIDError(
+            ERR_MSG.UNKNOWN_CODEC.format(
+                codec=codec, classname=cls.__name__, codecs=list(CODECS)
+            )
+        )
+    return resolved
+
+
+def _specialization_origin(cls: _PUUIDClass) -> _PUUIDClass | None:
+    """Return the class `cls` was specialized from by subscription, if any."""
+    for origin in cls.__bases__:
+        if (
+            _is_puuid_class(origin)
+            and _SPECIALIZATION_CACHE.get((origin, cls._prefix)) is cls
+        ):
+            return origin
+    return None
+
+
+def _unpickle_specialized(origin: _PUUIDClass, prefix: str, raw: bytes) -> object:
+    """Restore a pickled instance of the specialization `origin[Literal[prefix]]`."""
+    args_tuple: _SubscriptionArgs = (Literal[prefix],)
+    specialized = _get_or_create_specialization(origin, args_tuple, prefix)
+    return specialized.from_bytes(raw)
 
 
 def _puuid_class_getitem_runtime(cls: _PUUIDClass, item: object) -> _ClassGetItemReturn:
@@ -212,7 +334,287 @@ def _puuid_class_getitem_runtime(cls: _PUUIDClass, item: object) -> _ClassGetIte
     if not prefix:
         raise PUUIDError(ERR_MSG.EMPTY_PREFIX_DISALLOWED.format(classname=cls.__name__))
 
-    return _get_or_create_specialization(cls, args_tuple, prefix)
+    specialized = _get_or_create_specialization(cls, args_tuple, prefix)
+    _remember_subscription(cls, item, specialized)
+    return specialized
+
+
+################################################################################
+#### prefix registry
+################################################################################
+
+type _RegisteredVersions = dict[int | None, _PUUIDClass]
+_PREFIX_REGISTRY: dict[str, _RegisteredVersions] = {}
+
+
+def _register_puuid_class(cls: _PUUIDClass, *, strict: bool = True) -> None:
+    """
+    Register `cls` for its prefix and UUID version.
+
+    The most derived class wins: a subclass of the registered class replaces it
+    and a base class of it is ignored. An unrelated class raises a `PUUIDError` if
+    `strict`, otherwise the registered class is kept. Automatic registration by
+    subscription is not strict, so e.g. `Scoped[Literal["user"]]` of an unrelated
+    generic subclass works even if `PUUIDv7[Literal["user"]]` exists.
+    """
+    with _SPECIALIZATION_LOCK:
+        versions = _PREFIX_REGISTRY.get(cls._prefix, {})
+        registered = versions.get(cls._version)
+
+        if registered is None or issubclass(cls, registered):
+            # replaced instead of mutated, so lookups never iterate a changing dict
+            _PREFIX_REGISTRY[cls._prefix] = {**versions, cls._version: cls}
+        elif strict and not issubclass(registered, cls):
+            raise PUUIDError(
+                ERR_MSG.PREFIX_ALREADY_REGISTERED.format(
+                    prefix=cls._prefix,
+                    version=cls._version,
+                    registered=registered.__name__,
+                    classname=cls.__name__,
+                )
+            )
+
+
+def register_puuid[T: _PUUIDClass](cls: T) -> T:
+    """
+    Register a pUUID class for `PUUIDBase.parse_any`.
+
+    Specializations like `PUUIDv7[Literal["user"]]` are registered automatically
+    unless an unrelated class already holds their prefix and version. Explicit
+    registration is needed for subclasses of them, which then take precedence
+    over the specialization they derive from. Can be used as a class decorator.
+
+    Parameters
+    ----------
+    cls : T
+        The pUUID class to register.
+
+    Returns
+    -------
+    T
+        The registered class.
+
+    Raises
+    ------
+    PUUIDError
+        If the class has an empty prefix, or an unrelated class is already
+        registered for the same prefix and UUID version.
+    """
+    if not cls._prefix:
+        raise PUUIDError(ERR_MSG.EMPTY_PREFIX_DISALLOWED.format(classname=cls.__name__))
+    _register_puuid_class(cls)
+    return cls
+
+
+def _peek_prefix(serial_puuid: str) -> str:
+    # the serialized UUID never contains '_', prefixes may
+    prefix, separator, _ = serial_puuid.rpartition("_")
+    if not separator:
+        raise PUUIDError(
+            ERR_MSG.MISSING_PREFIX_SEPARATOR.format(serial_puuid=serial_puuid)
+        )
+    return prefix
+
+
+def _peek_version(serial_puuid: str) -> int | None:
+    _, _, serialized_uuid = serial_puuid.rpartition("_")
+    try:
+        return UUID(serialized_uuid).version
+    except ValueError:
+        return None
+
+
+def _lookup_registered_class(serial_puuid: str) -> _PUUIDClass:
+    prefix = _peek_prefix(serial_puuid)
+    versions = _PREFIX_REGISTRY.get(prefix)
+    if not versions:
+        raise PUUIDError(
+            ERR_MSG.UNKNOWN_PREFIX.format(prefix=prefix, serial_puuid=serial_puuid)
+        )
+    if len(versions) == 1:
+        return next(iter(versions.values()))
+    for registered in versions.values():
+        if registered._decode_serial(serial_puuid) is not None:
+            return registered
+
+    version = _peek_version(serial_puuid)
+    registered = versions.get(version)
+    if registered is None:
+        raise PUUIDError(
+            ERR_MSG.UNKNOWN_PREFIX_VERSION.format(
+                version=version, prefix=prefix, serial_puuid=serial_puuid
+            )
+        )
+    return registered
+
+
+################################################################################
+#### binary format
+################################################################################
+
+_UUID_BYTES = 16
+_MAX_TAG_PREFIX_BYTES = 255
+
+
+def _encode_bytes_tag(prefix: str) -> bytes | None:
+    """Length-prefixed UTF-8 prefix, None if it is too long for a one byte length."""
+    encoded = prefix.encode()
+    if len(encoded) > _MAX_TAG_PREFIX_BYTES:
+        return None
+    return bytes([len(encoded)]) + encoded
+
+
+def _byte_view(data: bytes | bytearray | memoryview) -> memoryview:
+    view = memoryview(data)
+    return view if view.format == "B" else view.cast("B")
+
+
+def _check_available(view: memoryview, offset: int, needed: int) -> None:
+    if offset < 0 or len(view) - offset < needed:
+        raise PUUIDError(
+            ERR_MSG.BYTES_TOO_SHORT.format(
+                needed=needed, offset=offset, length=len(view)
+            )
+        )
+
+
+def _read_bytes_tag(view: memoryview, offset: int) -> tuple[str, int]:
+    """Read the prefix tag at `offset`, return the prefix and the UUID offset."""
+    _check_available(view, offset, 1)
+    start = offset + 1 + view[offset]
+    _check_available(view, offset, start - offset + _UUID_BYTES)
+    try:
+        return str(view[offset + 1 : start], "utf-8"), start
+    except UnicodeDecodeError as err:
+        raise PUUIDError(ERR_MSG.INVALID_BYTES_TAG.format(offset=offset)) from err
+
+
+def _lookup_tagged_class(prefix: str, version: int) -> _PUUIDClass:
+    registered = _PREFIX_REGISTRY.get(prefix, {}).get(version)
+    if registered is None:
+        raise PUUIDError(
+            ERR_MSG.UNKNOWN_BYTES_TAG.format(version=version, prefix=prefix)
+        )
+    return registered
+
+
+################################################################################
+#### bulk generation
+################################################################################
+
+_UUID_LENGTH = 36
+_RFC_4122_VARIANT_FLAGS = 0x8000 << 48
+_VERSION_VARIANT_MASK = (0xF000 << 64) | (0xC000 << 48)
+_CLEAR_VERSION_VARIANT = ~_VERSION_VARIANT_MASK & ((1 << 128) - 1)
+
+# 100-ns intervals between the Gregorian epoch (1582-10-15) and the Unix epoch
+_GREGORIAN_OFFSET = 0x01B21DD213814000
+_V7_COUNTER_BITS = 42
+_V7_SEED_BYTES = 6
+
+_BATCH_TICK_LOCK = threading.Lock()
+_LAST_BATCH_TICK: dict[int, int] = {}
+
+
+def _version_flags(version: int) -> int:
+    return (version << 76) | _RFC_4122_VARIANT_FLAGS
+
+
+def _spread_payload(payload: int) -> int:
+    """Place 122 custom bits around the version and variant bits (UUIDv8 layout)."""
+    return (
+        (payload >> 74) << 80
+        | ((payload >> 62) & 0x0FFF) << 64
+        | payload & 0x3FFF_FFFF_FFFF_FFFF
+    )
+
+
+def _gather_payload(value: int) -> int:
+    """Inverse of `_spread_payload`, drop the version and variant bits."""
+    return (
+        (value >> 80) << 74
+        | ((value >> 64) & 0x0FFF) << 62
+        | value & 0x3FFF_FFFF_FFFF_FFFF
+    )
+
+
+def _check_batch_size(n: int) -> None:
+    if isinstance(n, bool) or not isinstance(n, int) or n < 0:
+        raise PUUIDError(ERR_MSG.INVALID_BATCH_SIZE.format(n=n))
+
+
+def _reserve_ticks(version: int, tick: int, n: int) -> int:
+    """
+    Reserve `n` consecutive ticks for a batch of `version` UUIDs.
+
+    Batches never overlap, even if they are created within the same tick.
+    """
+    with _BATCH_TICK_LOCK:
+        first = max(tick, _LAST_BATCH_TICK.get(version, -1) + 1)
+        _LAST_BATCH_TICK[version] = first + n - 1
+    return first
+
+
+def _random_uuid_ints(n: int, version: int) -> list[int]:
+    """Build `n` random UUID integers (v4/v8 layout) from a single entropy read."""
+    _check_batch_size(n)
+    flags = _version_flags(version)
+    words = iter(memoryview(os.urandom(16 * n)).cast("Q"))
+    return [
+        ((high << 64 | low) & _CLEAR_VERSION_VARIANT) | flags
+        for high, low in zip(words, words)
+    ]
+
+
+def _gregorian_uuid_ints(n: int, version: Literal[1, 6]) -> list[int]:
+    """Build `n` time-based UUID integers (v1/v6 layout) with consecutive ticks."""
+    _check_batch_size(n)
+    flags = _version_flags(version)
+    node = getnode() & 0xFFFF_FFFF_FFFF
+    clock_seq = int.from_bytes(os.urandom(2)) & 0x3FFF
+    low = flags | clock_seq << 48 | node
+    now = time.time_ns() // 100 + _GREGORIAN_OFFSET
+    first = _reserve_ticks(version, now, n)
+    ticks = range(first, first + n)
+
+    if version == 1:
+        return [
+            (tick & 0xFFFF_FFFF) << 96
+            | ((tick >> 32) & 0xFFFF) << 80
+            | ((tick >> 48) & 0x0FFF) << 64
+            | low
+            for tick in ticks
+        ]
+    return [
+        ((tick >> 12) & 0xFFFF_FFFF_FFFF) << 80 | (tick & 0x0FFF) << 64 | low
+        for tick in ticks
+    ]
+
+
+def _v7_uuid_ints(n: int) -> list[int]:
+    """
+    Build `n` strictly increasing UUIDv7 integers from a single entropy read.
+
+    Uses a 42-bit counter (RFC 9562, method 1) seeded randomly with its most
+    significant bit cleared and incremented per UUID. A counter overflow carries
+    into the millisecond timestamp, which keeps the batch ordered.
+    """
+    _check_batch_size(n)
+    flags = _version_flags(7)
+    entropy = os.urandom(_V7_SEED_BYTES + 4 * n)
+    seed = int.from_bytes(entropy[:_V7_SEED_BYTES]) >> 7
+    now = (time.time_ns() // 1_000_000) << _V7_COUNTER_BITS | seed
+    first = _reserve_ticks(7, now, n)
+    tails = memoryview(entropy)[_V7_SEED_BYTES:].cast("I")
+
+    return [
+        ((tick >> _V7_COUNTER_BITS) & 0xFFFF_FFFF_FFFF) << 80
+        | ((tick >> 30) & 0x0FFF) << 64
+        | (tick & 0x3FFF_FFFF) << 32
+        | tail
+        | flags
+        for tick, tail in zip(range(first, first + n), tails)
+    ]
 
 
 ################################################################################
@@ -223,17 +625,85 @@ def _puuid_class_getitem_runtime(cls: _PUUIDClass, item: object) -> _ClassGetIte
 class PUUIDBase[TPrefix: str](ABC):
     """Abstract Generic Base Class for Prefixed UUIDs."""
 
+    # the UUID is kept as int, `UUID` objects are only created on access
+    __slots__ = ("_int", "_serial")
+
     _prefix: ClassVar[str] = ""
+    _version: ClassVar[int | None] = None
     _serial: str | None
-    _uuid: UUID
+    _int: int
+
+    _codec: ClassVar[PUUIDCodec] = CANONICAL
+    _accept_canonical: ClassVar[bool] = True
+
+    # precomputed per class by `__init_subclass__` for the `from_string` fast path
+    _serial_head: ClassVar[str] = "_"
+    _serial_length: ClassVar[int] = len("_") + _UUID_LENGTH
+    _version_bits: ClassVar[int | None] = None
+    _bytes_tag: ClassVar[bytes | None] = None
+    _intern_cache: ClassVar[InternCache[PUUIDBase[str]] | None] = None
 
     @abstractmethod
     def __init__(self, *, uuid: UUID) -> None: ...
 
+    @override
+    def __init_subclass__(
+        cls,
+        *,
+        codec: CodecName | PUUIDCodec | None = None,
+        accept_canonical: bool | None = None,
+        **kwargs: object,
+    ) -> None:
+        """
+        Configure the string codec of a subclass.
+
+        Parameters
+        ----------
+        codec : CodecName | PUUIDCodec | None, optional
+            Codec of the serialized UUID (e.g., `"base62"`), inherited if None.
+        accept_canonical : bool | None, optional
+            Let `from_string` also accept the canonical UUID form, e.g., while
+            migrating existing IDs to a compact codec. Inherited if None.
+
+        Raises
+        ------
+        PUUIDError
+            If the codec is unknown.
+        """
+        super().__init_subclass__(**kwargs)
+        if codec is not None:
+            cls._codec = _resolve_codec(cls, codec)
+            cls._accept_canonical = cls._codec is CANONICAL
+        if accept_canonical is not None:
+            cls._accept_canonical = accept_canonical or cls._codec is CANONICAL
+        cls._serial_head = f"{cls._prefix}_"
+        cls._serial_length = len(cls._serial_head) + cls._codec.length
+        cls._bytes_tag = _encode_bytes_tag(cls._prefix)
+        cls._intern_cache = None  # never shared with the parent class
+        cls._version_bits = (
+            None if cls._version is None else _version_flags(cls._version)
+        )
+
     @classmethod
     def __class_getitem__(cls, item: object) -> object:
+        entry = _SUBSCRIPTION_CACHE.get((cls, id(item)))
+        if entry is not None and entry[0] is item:
+            return entry[1]
         return _puuid_class_getitem_runtime(cls, item)
 
+    @classmethod
+    def _from_int(cls, value: int) -> Self:
+        """Create an instance from a validated UUID integer, skipping `__init__`."""
+        instance = cls.__new__(cls)
+        instance._int = value
+        instance._serial = None
+        return instance
+
+    @classmethod
+    def _from_uuid(cls, uuid: UUID) -> Self:
+        """Create an instance from an already validated UUID, skipping `__init__`."""
+        return cls._from_int(uuid.int)
+
     @classmethod
     def prefix(cls) -> str:
         """
@@ -246,20 +716,36 @@ class PUUIDBase[TPrefix: str](ABC):
         """
         return cls._prefix
 
+    @classmethod
+    def codec(cls) -> PUUIDCodec:
+        """
+        Return the string codec of the class.
+
+        Returns
+        -------
+        PUUIDCodec
+            The codec serializing the UUID after the prefix.
+        """
+        return cls._codec
+
     @property
     def uuid(self) -> UUID:
         """
         Return the underlying UUID object.
 
+        The object is created on access, comparisons, hashing and serialization
+        work on the stored integer.
+
         Returns
         -------
         UUID
             The native UUID instance.
         """
-        return self._uuid
+        return UUID(int=self._int)
 
     def _format_serial(self) -> str:
-        return f"{type(self)._prefix}_{self._uuid}"
+        cls = type(self)
+        return f"{cls._serial_head}{cls._codec.encode(self._int)}"
 
     def to_string(self) -> str:
         """
@@ -268,7 +754,8 @@ class PUUIDBase[TPrefix: str](ABC):
         Returns
         -------
         str
-            The formatted string (e.g., `<prefix>_<uuid-hex-string>`).
+            The formatted string (e.g., `<prefix>_<uuid-hex-string>`), with the UUID
+            serialized by the codec of the class.
         """
         cached = self._serial
         if cached is not None:
@@ -278,6 +765,119 @@ class PUUIDBase[TPrefix: str](ABC):
         self._serial = serial
         return serial
 
+    def to_bytes(self, *, tagged: bool = False) -> bytes:
+        """
+        Return the binary representation of the Prefixed UUID.
+
+        Parameters
+        ----------
+        tagged : bool, optional
+            Prepend the prefix as tag (one length byte and the UTF-8 encoded
+            prefix), so `unpack_tagged` can restore the instance without knowing its
+            class.
+
+        Returns
+        -------
+        bytes
+            The 16 UUID bytes in big-endian order, optionally preceded by the tag.
+
+        Raises
+        ------
+        PUUIDError
+            If `tagged` is set and the prefix is longer than 255 bytes.
+        """
+        raw = self._int.to_bytes(_UUID_BYTES)
+        if not tagged:
+            return raw
+        tag = type(self)._bytes_tag
+        if tag is None:
+            raise PUUIDError(
+                ERR_MSG.PREFIX_TOO_LONG_FOR_TAG.format(
+                    classname=type(self).__name__, length=len(self._prefix.encode())
+                )
+            )
+        return tag + raw
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview, offset: int = 0) -> Self:
+        """
+        Create a pUUID instance from 16 UUID bytes created by `to_bytes`.
+
+        The bytes are read in place, so a `memoryview` of a larger buffer can be
+        decoded without copying.
+
+        Parameters
+        ----------
+        data : bytes | bytearray | memoryview
+            Buffer holding the UUID bytes in big-endian order.
+        offset : int, optional
+            Position of the UUID bytes within `data`.
+
+        Returns
+        -------
+        Self
+            The deserialized pUUID instance.
+
+        Raises
+        ------
+        PUUIDError
+            If `data` is too short or the bytes are not a UUID of the class' version.
+        """
+        view = _byte_view(data)
+        _check_available(view, offset, _UUID_BYTES)
+        value = int.from_bytes(view[offset : offset + _UUID_BYTES])
+        version_bits = cls._version_bits
+        if version_bits is not None and value & _VERSION_VARIANT_MASK != version_bits:
+            raise PUUIDError(
+                ERR_MSG.BYTES_VERSION_MISMATCH.format(
+                    offset=offset, version=cls._version, classname=cls.__name__
+                )
+            )
+        return cls._from_int(value)
+
+    @classmethod
+    def unpack_tagged(
+        cls, data: bytes | bytearray | memoryview, offset: int = 0
+    ) -> tuple[Self, int]:
+        """
+        Create a pUUID instance of the registered class from tagged bytes.
+
+        The tag created by `to_bytes(tagged=True)` holds the prefix, the UUID
+        version selects the class among the ones registered for it (see
+        `parse_any`). The returned offset allows to unpack consecutive pUUIDs from
+        one buffer.
+
+        Parameters
+        ----------
+        data : bytes | bytearray | memoryview
+            Buffer holding the tagged pUUID.
+        offset : int, optional
+            Position of the tag within `data`.
+
+        Returns
+        -------
+        tuple[Self, int]
+            The deserialized pUUID instance and the offset following it.
+
+        Raises
+        ------
+        PUUIDError
+            If the data is malformed or too short, or no matching subclass of the
+            called class is registered.
+        """
+        view = _byte_view(data)
+        prefix, start = _read_bytes_tag(view, offset)
+        registered = _lookup_tagged_class(prefix, view[start + 6] >> 4)
+        if not issubclass(registered, cls):
+            raise PUUIDError(
+                ERR_MSG.TAGGED_CLASS_MISMATCH.format(
+                    prefix=prefix,
+                    registered=registered.__name__,
+                    classname=cls.__name__,
+                )
+            )
+        return registered.from_bytes(view, start), start + _UUID_BYTES
+
     @classmethod
     def factory(cls) -> Self:
         """
@@ -298,14 +898,55 @@ class PUUIDBase[TPrefix: str](ABC):
         raise PUUIDError(ERR_MSG.FACTORY_UNSUPPORTED)
 
     @classmethod
-    def from_string(cls, serial_puuid: str) -> Self:
+    def factory_many(cls, n: int) -> list[Self]:
+        """
+        Create `n` new instances in a single batch.
+
+        The entropy for the whole batch is read at once and the instances are built
+        without running the argument checks of `__init__`, which is considerably
+        faster than calling `factory` in a loop.
+
+        Parameters
+        ----------
+        n : int
+            Number of instances to create.
+
+        Returns
+        -------
+        list[Self]
+            The new pUUID instances.
+
+        Raises
+        ------
+        PUUIDError
+            If the variant does not support parameterless generation or `n` is
+            negative.
+        """
+        raise PUUIDError(ERR_MSG.FACTORY_MANY_UNSUPPORTED)
+
+    @classmethod
+    def from_string(cls, serial_puuid: str, *, trusted: bool = False) -> Self:
         """
         Create a pUUID instance from its string representation.
 
+        The UUID has to be serialized with the codec of the class. Other UUID forms
+        (e.g., canonical, braces, URN) are only accepted for classes using the
+        canonical codec or created with `accept_canonical=True`. If the interning
+        cache of the class is enabled (see `enable_cache`), repeated strings return
+        the same instance.
+
         Parameters
         ----------
         serial_puuid : str
             The prefixed UUID string (e.g., `user_550e8400-e29b...`).
+        trusted : bool, optional
+            Skip the version check of the UUID for strings known to be created by
+            `to_string` of this class, e.g., read back from an own database column.
+            The string is kept as serialized form of the instance. Trusted parses
+            bypass the interning cache, so their unchecked instances are never
+            returned to untrusted callers. Untrusted input must never be passed with
+            `trusted=True`, the result of a string that does not meet this contract
+            is unspecified.
 
         Returns
         -------
@@ -317,18 +958,38 @@ class PUUIDBase[TPrefix: str](ABC):
         PUUIDError
             If the string is malformed or the prefix does not match.
         """
-        try:
-            if "_" not in serial_puuid:
-                raise ValueError("Missing separator")
-
-            prefix, serialized_uuid = serial_puuid.split("_", 1)
+        if trusted:
+            return cls._parse_trusted(serial_puuid)
+        cache = cls._intern_cache
+        if cache is not None:
+            cached = cache.get_or_parse(serial_puuid, cls._parse_string)
+            if isinstance(cached, cls):  # always true, narrows the entry to Self
+                return cached
+        return cls._parse_string(serial_puuid)
 
-            if prefix != cls._prefix:
-                raise ValueError("Prefix mismatch")
+    @classmethod
+    def _parse_trusted(cls, serial_puuid: str) -> Self:
+        """Decode a string created by `to_string` without validating the UUID."""
+        head = cls._serial_head
+        if len(serial_puuid) != cls._serial_length or not serial_puuid.startswith(head):
+            return cls._parse_string(serial_puuid)  # e.g., legacy canonical form
+        try:
+            value = cls._codec.decode(serial_puuid[len(head) :])
+        except ValueError:
+            return cls._parse_string(serial_puuid)  # raises the appropriate error
+        instance = cls.__new__(cls)
+        instance._int = value
+        instance._serial = serial_puuid
+        return instance
 
-            uuid = UUID(serialized_uuid)
-            return cls(uuid=uuid)
+    @classmethod
+    def _parse_string(cls, serial_puuid: str) -> Self:
+        value = cls._decode_serial(serial_puuid)
+        if value is not None:
+            return cls._from_int(value)
 
+        try:
+            return cls(uuid=cls._parse_serial_uuid(serial_puuid))
         except ValueError as err:
             raise PUUIDError(
                 ERR_MSG.PREFIX_DESERIALIZATION_ERROR.format(
@@ -338,20 +999,232 @@ class PUUIDBase[TPrefix: str](ABC):
                 )
             ) from err
 
+    @classmethod
+    def enable_cache(cls, maxsize: int = 1024) -> None:
+        """
+        Enable the interning cache of `from_string` for this class or resize it.
+
+        The bounded, thread-safe LRU cache maps serialized IDs to shared instances,
+        so hot IDs are parsed once. It also serves pydantic validation, `parse_any`
+        and `SqlPUUID` columns. Each class has its own cache, subclasses do not
+        inherit it.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of cached instances. Resizing an enabled cache keeps the
+            most recently used instances.
+
+        Raises
+        ------
+        PUUIDError
+            If `maxsize` is not a positive integer.
+        """
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 1:
+            raise PUUIDError(
+                ERR_MSG.INVALID_CACHE_SIZE.format(
+                    classname=cls.__name__, maxsize=maxsize
+                )
+            )
+        cache = cls._intern_cache
+        if cache is None:
+            cls._intern_cache = InternCache(maxsize)
+        else:
+            cache.resize(maxsize)
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        """Disable the interning cache of this class and drop its instances."""
+        cls._intern_cache = None
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop the instances and statistics of the interning cache, if enabled."""
+        cache = cls._intern_cache
+        if cache is not None:
+            cache.clear()
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo | None:
+        """
+        Return the statistics of the interning cache.
+
+        Returns
+        -------
+        CacheInfo | None
+            Hits, misses, maximum and current size, or None if the cache is
+            disabled.
+        """
+        cache = cls._intern_cache
+        return None if cache is None else cache.info()
+
+    @classmethod
+    def _decode_serial(cls, serial_puuid: str) -> int | None:
+        """
+        Fast path for `<prefix>_<encoded uuid>` strings of the expected version.
+
+        Returns the UUID as integer, or None if the string does not have exactly this
+        form. The general path in `from_string` then takes over and produces the
+        appropriate result or error.
+        """
+        head = cls._serial_head
+        if len(serial_puuid) != cls._serial_length or not serial_puuid.startswith(head):
+            return None
+        try:
+            value = cls._codec.decode(serial_puuid[len(head) :])
+        except ValueError:
+            return None
+        if value & _VERSION_VARIANT_MASK != cls._version_bits:
+            return None
+        return value
+
+    @classmethod
+    def _parse_serial_uuid(cls, serial_puuid: str) -> UUID:
+        """General path accepting all UUID formats of the `UUID` constructor."""
+        if not cls._accept_canonical:
+            raise ValueError(f"Expected the '{cls._codec.name}' codec")
+        if "_" not in serial_puuid:
+            raise ValueError("Missing separator")
+
+        prefix, serialized_uuid = serial_puuid.split("_", 1)
+
+        if prefix != cls._prefix:
+            raise ValueError("Prefix mismatch")
+
+        return UUID(serialized_uuid)
+
+    @staticmethod
+    def peek_prefix(serial_puuid: str) -> str:
+        """
+        Return the prefix of a serialized pUUID without decoding the UUID.
+
+        Parameters
+        ----------
+        serial_puuid : str
+            The prefixed UUID string (e.g., `user_550e8400-e29b...`).
+
+        Returns
+        -------
+        str
+            The prefix (e.g., `user`).
+
+        Raises
+        ------
+        PUUIDError
+            If the string has no prefix separator.
+        """
+        return _peek_prefix(serial_puuid)
+
+    @classmethod
+    def parse_any(cls, serial_puuid: str) -> Self:
+        """
+        Create a pUUID instance of the class registered for the string's prefix.
+
+        The class is found with a single lookup of the prefix. If several UUID
+        versions share the prefix (e.g., `PUUIDv4[Literal["user"]]` and
+        `PUUIDv7[Literal["user"]]`), the UUID version of the string selects the
+        class. When called on a subclass of `PUUIDBase` (e.g., `PUUIDv7.parse_any`),
+        the registered class has to be a subclass of it.
+
+        Parameters
+        ----------
+        serial_puuid : str
+            The prefixed UUID string (e.g., `user_550e8400-e29b...`).
+
+        Returns
+        -------
+        Self
+            The deserialized pUUID instance.
+
+        Raises
+        ------
+        PUUIDError
+            If no matching class is registered or the string is malformed.
+        """
+        registered = _lookup_registered_class(serial_puuid)
+        if not issubclass(registered, cls):
+            raise PUUIDError(
+                ERR_MSG.PARSE_ANY_CLASS_MISMATCH.format(
+                    serial_puuid=serial_puuid,
+                    registered=registered.__name__,
+                    classname=cls.__name__,
+                )
+            )
+        return registered.from_string(serial_puuid)
+
     @override
     def __str__(self) -> str:
         return self.to_string()
 
+    @override
+    def __reduce__(self) -> tuple[Callable[..., object], tuple[object, ...]]:
+        # specializations can not be pickled by reference, their origin class can
+        cls = type(self)
+        origin = _specialization_origin(cls)
+        if origin is None:
+            return cls.from_bytes, (self.to_bytes(),)
+        return _unpickle_specialized, (origin, cls._prefix, self.to_bytes())
+
     @override
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, PUUIDBase):
             return False
 
-        return (self._prefix, self._uuid) == (other._prefix, other._uuid)
+        return self._int == other._int and self._prefix == other._prefix
 
     @override
     def __hash__(self) -> int:
-        return hash((type(self)._prefix, self._uuid))
+        return hash((type(self)._prefix, self._int))
+
+    # only pUUIDs sharing a prefix are ordered, checks are inlined for sorting speed
+    @override
+    def __lt__(self, other: object) -> bool:
+        if type(other) is type(self) or (
+            isinstance(other, PUUIDBase) and other._prefix == self._prefix
+        ):
+            return self._int < other._int
+        return NotImplemented
+
+    @override
+    def __le__(self, other: object) -> bool:
+        if type(other) is type(self) or (
+            isinstance(other, PUUIDBase) and other._prefix == self._prefix
+        ):
+            return self._int <= other._int
+        return NotImplemented
+
+    @override
+    def __gt__(self, other: object) -> bool:
+        if type(other) is type(self) or (
+            isinstance(other, PUUIDBase) and other._prefix == self._prefix
+        ):
+            return self._int > other._int
+        return NotImplemented
+
+    @override
+    def __ge__(self, other: object) -> bool:
+        if type(other) is type(self) or (
+            isinstance(other, PUUIDBase) and other._prefix == self._prefix
+        ):
+            return self._int >= other._int
+        return NotImplemented
+
+    @property
+    def sort_key(self) -> int:
+        """
+        Return the UUID as integer for sorting.
+
+        Instances with the same prefix compare by this key, which follows the
+        creation time for `PUUIDv6` and `PUUIDv7`. For large sorts,
+        `key=operator.attrgetter("sort_key")` avoids a Python level comparison per
+        pair.
+
+        Returns
+        -------
+        int
+            The 128-bit integer value of the UUID.
+        """
+        return self._int
 
     @classmethod
     def __get_pydantic_core_schema__(
@@ -359,48 +1232,254 @@ class PUUIDBase[TPrefix: str](ABC):
         _source_type: object,
         _handler: GetCoreSchemaHandler,
     ) -> core_schema.CoreSchema:
-        if not _PYDANTIC_AVAILABLE:
+        try:
+            from pydantic_core import core_schema
+        except ModuleNotFoundError as err:
             raise ModuleNotFoundError(
                 "pydantic is an optional dependency. Install with: pip install 'pUUID[pydantic]'"
-            )
+            ) from err
 
-        def validate(value: object) -> PUUIDBase[TPrefix]:
-            if isinstance(value, cls):
-                return value
+        serial_schema = cls._pydantic_serial_schema()
+        return core_schema.json_or_python_schema(
+            json_schema=serial_schema,
+            python_schema=core_schema.union_schema(
+                [
+                    (core_schema.is_instance_schema(cls), "instance"),
+                    (serial_schema, "str"),
+                ]
+            ),
+            serialization=core_schema.to_string_ser_schema(when_used="always"),
+        )
 
-            if isinstance(value, str):
-                try:
-                    return cls.from_string(value)
-                except PUUIDError as err:
-                    raise ValueError(str(err)) from err
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls,
+        schema: core_schema.CoreSchema,
+        handler: GetJsonSchemaHandler,
+    ) -> JsonSchemaValue:
+        json_schema = handler(schema)
+        min_length, max_length = cls._serial_length_range()
+        json_schema.update(
+            pattern=cls._serial_pattern(),
+            minLength=min_length,
+            maxLength=max_length,
+        )
+        return json_schema
 
-            raise ValueError(
-                ERR_MSG.INVALID_TYPE_FOR_SERIAL_PUUID.format(
-                    classname=cls.__name__, type=type(value), value=value
-                )
-            )
+    @classmethod
+    def _serial_codecs(cls) -> list[PUUIDCodec]:
+        """Codecs accepted by `from_string` in the pydantic schema."""
+        if cls._accept_canonical and cls._codec is not CANONICAL:
+            return [cls._codec, CANONICAL]
+        return [cls._codec]
 
-        def serialize(value: PUUIDBase[TPrefix]) -> str:
-            return value.to_string()
+    @classmethod
+    def _serial_length_range(cls) -> tuple[int, int]:
+        lengths = [codec.length for codec in cls._serial_codecs()]
+        head_length = len(cls._serial_head)
+        return head_length + min(lengths), head_length + max(lengths)
 
-        return core_schema.no_info_plain_validator_function(
-            validate,
-            serialization=core_schema.plain_serializer_function_ser_schema(
-                serialize,
-                return_schema=core_schema.str_schema(),
-            ),
+    @classmethod
+    def _serial_pattern(cls) -> str:
+        """Regular expression matching the serialization of the class."""
+        bodies = "|".join(codec.pattern(cls._version) for codec in cls._serial_codecs())
+        return f"^{re.escape(cls._serial_head)}(?:{bodies})$"
+
+    @classmethod
+    def _pydantic_serial_schema(cls) -> core_schema.CoreSchema:
+        """
+        Schema for serialized pUUIDs: type, length and format are checked by
+        pydantic-core, Python only runs to report format errors with their input and
+        to construct the validated instance.
+        """
+        from pydantic_core import core_schema
+
+        min_length, max_length = cls._serial_length_range()
+        format_schema = core_schema.str_schema(
+            pattern=cls._serial_pattern(),
+            min_length=min_length,
+            max_length=max_length,
+        )
+        return core_schema.chain_schema(
+            [
+                core_schema.str_schema(),
+                core_schema.no_info_wrap_validator_function(
+                    cls._validate_serial, format_schema
+                ),
+            ]
         )
 
+    @classmethod
+    def _validate_serial(
+        cls, serial_puuid: str, handler: core_schema.ValidatorFunctionWrapHandler
+    ) -> Self:
+        try:
+            _ = handler(serial_puuid)
+        except ValueError as err:
+            from pydantic_core import PydanticCustomError
+
+            raise PydanticCustomError(
+                "puuid_format",
+                ERR_MSG.PREFIX_DESERIALIZATION_ERROR,
+                {
+                    "prefix": cls._prefix,
+                    "classname": cls.__name__,
+                    "serial_puuid": serial_puuid,
+                },
+            ) from err
+        try:
+            return cls.from_string(serial_puuid)
+        except PUUIDError as err:
+            raise ValueError(str(err)) from err
+
+
+################################################################################
+#### time-based pUUIDs
+################################################################################
+
+_UNIX_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.UTC)
+_ONE_MICROSECOND = dt.timedelta(microseconds=1)
+
+
+def _datetime_to_ns(instant: dt.datetime) -> int:
+    """Nanoseconds since the Unix epoch, naive datetimes are local time."""
+    aware = instant if instant.tzinfo is not None else instant.astimezone()
+    return (aware - _UNIX_EPOCH) // _ONE_MICROSECOND * 1000
+
+
+class _TimeBasedPUUID[TPrefix: str](PUUIDBase[TPrefix]):
+    """Shared timestamp accessors of PUUIDv1, PUUIDv6 and PUUIDv7."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def _timestamp_ns(self) -> int:
+        """Extract the embedded timestamp as nanoseconds since the Unix epoch."""
+
+    @property
+    def timestamp(self) -> float:
+        """
+        Return the embedded creation time as POSIX timestamp.
+
+        Returns
+        -------
+        float
+            Seconds since the Unix epoch.
+        """
+        return self._timestamp_ns() / 1_000_000_000
+
+    @property
+    def datetime(self) -> dt.datetime:
+        """
+        Return the embedded creation time.
+
+        The resolution is 1 ms for PUUIDv7 and 1 µs for PUUIDv1 and PUUIDv6.
+
+        Returns
+        -------
+        datetime.datetime
+            Timezone-aware datetime in UTC.
+        """
+        return _UNIX_EPOCH + dt.timedelta(microseconds=self._timestamp_ns() // 1000)
+
+
+class _TimeOrderedPUUID[TPrefix: str](_TimeBasedPUUID[TPrefix]):
+    """
+    Range bounds of PUUIDv6 and PUUIDv7, whose integers sort by creation time.
+
+    PUUIDv1 stores the low bits of its timestamp first, so its integers are not
+    time-ordered and no bounds are provided.
+    """
+
+    __slots__ = ()
+
+    # bits of the UUID integer holding the timestamp
+    _timestamp_mask: ClassVar[int] = 0
+
+    @classmethod
+    @abstractmethod
+    def _timestamp_bits(cls, timestamp_ns: int) -> int:
+        """Place the timestamp at the class resolution into its UUID bits."""
+
+    @classmethod
+    def min_for(cls, instant: dt.datetime) -> Self:
+        """
+        Return the smallest ID created at `instant`.
+
+        Together with `max_for`, this bounds range queries on time-ordered IDs,
+        e.g., `PUUIDv7.min_for(start) <= puuid <= PUUIDv7.max_for(end)`.
+
+        Parameters
+        ----------
+        instant : datetime.datetime
+            The creation time, naive datetimes are interpreted as local time.
+
+        Returns
+        -------
+        Self
+            The ID with all bits except the timestamp, version and variant unset.
+
+        Raises
+        ------
+        PUUIDError
+            If `instant` does not fit into the timestamp of the class.
+        """
+        timestamp_bits = cls._timestamp_bits(_datetime_to_ns(instant))
+        return cls._from_int(timestamp_bits | (cls._version_bits or 0))
+
+    @classmethod
+    def max_for(cls, instant: dt.datetime) -> Self:
+        """
+        Return the largest ID created at `instant`.
+
+        All IDs created within the microsecond of `instant` (within the
+        millisecond for PUUIDv7) are less than or equal to the result.
+
+        Parameters
+        ----------
+        instant : datetime.datetime
+            The creation time, naive datetimes are interpreted as local time.
+
+        Returns
+        -------
+        Self
+            The ID with all bits except the timestamp, version and variant set.
+
+        Raises
+        ------
+        PUUIDError
+            If `instant` does not fit into the timestamp of the class.
+        """
+        # the last nanosecond of the microsecond, the resolution of `datetime`
+        timestamp_bits = cls._timestamp_bits(_datetime_to_ns(instant) + 999)
+        free_bits = _CLEAR_VERSION_VARIANT & ~cls._timestamp_mask
+        return cls._from_int(timestamp_bits | free_bits | (cls._version_bits or 0))
+
+
+def _gregorian_ticks(cls: type, timestamp_ns: int) -> int:
+    """Convert to 100-ns ticks since the Gregorian epoch, checking the 60-bit range."""
+    ticks = timestamp_ns // 100 + _GREGORIAN_OFFSET
+    if not 0 <= ticks < 1 << 60:
+        raise PUUIDError(
+            ERR_MSG.TIMESTAMP_OUT_OF_RANGE.format(
+                timestamp_ns=timestamp_ns, classname=cls.__name__
+            )
+        )
+    return ticks
+
 
 ################################################################################
 #### PUUIDv1
 ################################################################################
 
 
-class PUUIDv1[TPrefix: str](PUUIDBase[TPrefix]):
+class PUUIDv1[TPrefix: str](_TimeBasedPUUID[TPrefix]):
     """Prefixed UUID Version 1 (MAC address and time)."""
 
-    _uuid: UUID
+    __slots__ = ()
+
+    _version: ClassVar[int | None] = 1
+    _int: int
     _serial: str | None
 
     @overload
@@ -437,9 +1516,9 @@ class PUUIDv1[TPrefix: str](PUUIDBase[TPrefix]):
         """
         match node, clock_seq, uuid:
             case int() | None, int() | None, None:
-                self._uuid = uuid1(node, clock_seq)
+                self._int = uuid1(node, clock_seq).int
             case None, None, UUID(version=1):
-                self._uuid = uuid
+                self._int = uuid.int
             case None, None, UUID(version=version):
                 raise PUUIDError(
                     ERR_MSG.UUID_VERSION_MISMATCH.format(expected=1, actual=version)
@@ -462,6 +1541,37 @@ class PUUIDv1[TPrefix: str](PUUIDBase[TPrefix]):
         """
         return cls()
 
+    @override
+    @classmethod
+    def factory_many(cls, n: int) -> list[Self]:
+        """
+        Create `n` new PUUIDv1 instances in a single batch.
+
+        The instances share one random clock sequence and use consecutive
+        timestamps.
+
+        Parameters
+        ----------
+        n : int
+            Number of instances to create.
+
+        Returns
+        -------
+        list[Self]
+            The new pUUID v1 instances.
+        """
+        return [cls._from_int(value) for value in _gregorian_uuid_ints(n, 1)]
+
+    @override
+    def _timestamp_ns(self) -> int:
+        value = self._int
+        tick = (
+            ((value >> 64) & 0x0FFF) << 48
+            | ((value >> 80) & 0xFFFF) << 32
+            | value >> 96
+        )
+        return (tick - _GREGORIAN_OFFSET) * 100
+
 
 ################################################################################
 #### PUUIDv3
@@ -471,7 +1581,10 @@ class PUUIDv1[TPrefix: str](PUUIDBase[TPrefix]):
 class PUUIDv3[TPrefix: str](PUUIDBase[TPrefix]):
     """Prefixed UUID Version 3 (MD5 hash of namespace and name)."""
 
-    _uuid: UUID
+    __slots__ = ()
+
+    _version: ClassVar[int | None] = 3
+    _int: int
     _serial: str | None
 
     @overload
@@ -506,9 +1619,9 @@ class PUUIDv3[TPrefix: str](PUUIDBase[TPrefix]):
         """
         match namespace, name, uuid:
             case UUID(), str() | bytes(), None:
-                self._uuid = uuid3(namespace, name)
+                self._int = uuid3(namespace, name).int
             case None, None, UUID(version=3):
-                self._uuid = uuid
+                self._int = uuid.int
             case None, None, UUID(version=version):
                 raise PUUIDError(
                     ERR_MSG.UUID_VERSION_MISMATCH.format(expected=3, actual=version)
@@ -527,7 +1640,10 @@ class PUUIDv3[TPrefix: str](PUUIDBase[TPrefix]):
 class PUUIDv4[TPrefix: str](PUUIDBase[TPrefix]):
     """Prefixed UUID Version 4 (randomly generated)."""
 
-    _uuid: UUID
+    __slots__ = ()
+
+    _version: ClassVar[int | None] = 4
+    _int: int
     _serial: str | None
 
     def __init__(self, uuid: UUID | None = None) -> None:
@@ -548,7 +1664,7 @@ class PUUIDv4[TPrefix: str](PUUIDBase[TPrefix]):
             raise PUUIDError(
                 ERR_MSG.UUID_VERSION_MISMATCH.format(expected=4, actual=uuid.version)
             )
-        self._uuid = uuid if uuid else uuid4()
+        self._int = (uuid if uuid else uuid4()).int
         self._serial = None
 
     @override
@@ -564,6 +1680,26 @@ class PUUIDv4[TPrefix: str](PUUIDBase[TPrefix]):
         """
         return cls()
 
+    @override
+    @classmethod
+    def factory_many(cls, n: int) -> list[Self]:
+        """
+        Create `n` new PUUIDv4 instances in a single batch.
+
+        The random bits of the whole batch are read from `os.urandom` at once.
+
+        Parameters
+        ----------
+        n : int
+            Number of instances to create.
+
+        Returns
+        -------
+        list[Self]
+            The new pUUID v4 instances.
+        """
+        return [cls._from_int(value) for value in _random_uuid_ints(n, 4)]
+
 
 ################################################################################
 #### PUUIDv5
@@ -573,7 +1709,10 @@ class PUUIDv4[TPrefix: str](PUUIDBase[TPrefix]):
 class PUUIDv5[TPrefix: str](PUUIDBase[TPrefix]):
     """Prefixed UUID Version 5 (SHA-1 hash of namespace and name)."""
 
-    _uuid: UUID
+    __slots__ = ()
+
+    _version: ClassVar[int | None] = 5
+    _int: int
     _serial: str | None
 
     @overload
@@ -608,9 +1747,9 @@ class PUUIDv5[TPrefix: str](PUUIDBase[TPrefix]):
         """
         match namespace, name, uuid:
             case UUID(), str() | bytes(), None:
-                self._uuid = uuid5(namespace, name)
+                self._int = uuid5(namespace, name).int
             case None, None, UUID(version=5):
-                self._uuid = uuid
+                self._int = uuid.int
             case None, None, UUID(version=version):
                 raise PUUIDError(
                     ERR_MSG.UUID_VERSION_MISMATCH.format(expected=5, actual=version)
@@ -626,10 +1765,14 @@ class PUUIDv5[TPrefix: str](PUUIDBase[TPrefix]):
 ################################################################################
 
 
-class PUUIDv6[TPrefix: str](PUUIDBase[TPrefix]):
+class PUUIDv6[TPrefix: str](_TimeOrderedPUUID[TPrefix]):
     """Prefixed UUID Version 6 (reordered v1 for DB locality)."""
 
-    _uuid: UUID
+    __slots__ = ()
+
+    _version: ClassVar[int | None] = 6
+    _timestamp_mask: ClassVar[int] = 0xFFFF_FFFF_FFFF << 80 | 0x0FFF << 64
+    _int: int
     _serial: str | None
 
     @overload
@@ -666,9 +1809,9 @@ class PUUIDv6[TPrefix: str](PUUIDBase[TPrefix]):
         """
         match node, clock_seq, uuid:
             case int() | None, int() | None, None:
-                self._uuid = uuid6(node, clock_seq)
+                self._int = uuid6(node, clock_seq).int
             case None, None, UUID(version=6):
-                self._uuid = uuid
+                self._int = uuid.int
             case None, None, UUID(version=version):
                 raise PUUIDError(
                     ERR_MSG.UUID_VERSION_MISMATCH.format(expected=6, actual=version)
@@ -691,16 +1834,53 @@ class PUUIDv6[TPrefix: str](PUUIDBase[TPrefix]):
         """
         return cls()
 
+    @override
+    @classmethod
+    def factory_many(cls, n: int) -> list[Self]:
+        """
+        Create `n` new PUUIDv6 instances in a single batch.
+
+        The instances share one random clock sequence and use consecutive
+        timestamps, so they are ordered within the batch.
+
+        Parameters
+        ----------
+        n : int
+            Number of instances to create.
+
+        Returns
+        -------
+        list[Self]
+            The new pUUID v6 instances.
+        """
+        return [cls._from_int(value) for value in _gregorian_uuid_ints(n, 6)]
+
+    @override
+    @classmethod
+    def _timestamp_bits(cls, timestamp_ns: int) -> int:
+        tick = _gregorian_ticks(cls, timestamp_ns)
+        return (tick >> 12) << 80 | (tick & 0x0FFF) << 64
+
+    @override
+    def _timestamp_ns(self) -> int:
+        value = self._int
+        tick = (value >> 80) << 12 | (value >> 64) & 0x0FFF
+        return (tick - _GREGORIAN_OFFSET) * 100
+
 
 ################################################################################
 #### PUUIDv7
 ################################################################################
 
 
-class PUUIDv7[TPrefix: str](PUUIDBase[TPrefix]):
+class PUUIDv7[TPrefix: str](_TimeOrderedPUUID[TPrefix]):
     """Prefixed UUID Version 7 (time-ordered)."""
 
-    _uuid: UUID
+    __slots__ = ()
+
+    _version: ClassVar[int | None] = 7
+    _timestamp_mask: ClassVar[int] = 0xFFFF_FFFF_FFFF << 80
+    _int: int
     _serial: str | None
 
     def __init__(self, uuid: UUID | None = None) -> None:
@@ -721,7 +1901,7 @@ class PUUIDv7[TPrefix: str](PUUIDBase[TPrefix]):
             raise PUUIDError(
                 ERR_MSG.UUID_VERSION_MISMATCH.format(expected=7, actual=uuid.version)
             )
-        self._uuid = uuid if uuid else uuid7()
+        self._int = (uuid if uuid else uuid7()).int
         self._serial = None
 
     @override
@@ -737,6 +1917,43 @@ class PUUIDv7[TPrefix: str](PUUIDBase[TPrefix]):
         """
         return cls()
 
+    @override
+    @classmethod
+    def factory_many(cls, n: int) -> list[Self]:
+        """
+        Create `n` new PUUIDv7 instances in a single batch.
+
+        The instances are strictly increasing within the batch and across
+        consecutive batches.
+
+        Parameters
+        ----------
+        n : int
+            Number of instances to create.
+
+        Returns
+        -------
+        list[Self]
+            The new pUUID v7 instances.
+        """
+        return [cls._from_int(value) for value in _v7_uuid_ints(n)]
+
+    @override
+    @classmethod
+    def _timestamp_bits(cls, timestamp_ns: int) -> int:
+        timestamp_ms = timestamp_ns // 1_000_000
+        if not 0 <= timestamp_ms < 1 << 48:
+            raise PUUIDError(
+                ERR_MSG.TIMESTAMP_OUT_OF_RANGE.format(
+                    timestamp_ns=timestamp_ns, classname=cls.__name__
+                )
+            )
+        return timestamp_ms << 80
+
+    @override
+    def _timestamp_ns(self) -> int:
+        return (self._int >> 80) * 1_000_000
+
 
 ################################################################################
 #### PUUIDv8
@@ -746,7 +1963,10 @@ class PUUIDv7[TPrefix: str](PUUIDBase[TPrefix]):
 class PUUIDv8[TPrefix: str](PUUIDBase[TPrefix]):
     """Prefixed UUID Version 8 (custom implementation)."""
 
-    _uuid: UUID
+    __slots__ = ()
+
+    _version: ClassVar[int | None] = 8
+    _int: int
     _serial: str | None
 
     @overload
@@ -786,9 +2006,9 @@ class PUUIDv8[TPrefix: str](PUUIDBase[TPrefix]):
         """
         match a, b, c, uuid:
             case int() | None, int() | None, int() | None, None:
-                self._uuid = uuid8(a, b, c)
+                self._int = uuid8(a, b, c).int
             case None, None, None, UUID(version=8):
-                self._uuid = uuid
+                self._int = uuid.int
             case None, None, None, UUID(version=version):
                 raise PUUIDError(
                     ERR_MSG.UUID_VERSION_MISMATCH.format(expected=8, actual=version)
@@ -810,3 +2030,24 @@ class PUUIDv8[TPrefix: str](PUUIDBase[TPrefix]):
             A new pUUID v8 instance.
         """
         return cls()
+
+    @override
+    @classmethod
+    def factory_many(cls, n: int) -> list[Self]:
+        """
+        Create `n` new PUUIDv8 instances in a single batch.
+
+        The custom bits are filled randomly, equivalent to `uuid8()` without
+        arguments.
+
+        Parameters
+        ----------
+        n : int
+            Number of instances to create.
+
+        Returns
+        -------
+        list[Self]
+            The new pUUID v8 instances.
+        """
+        return [cls._from_int(value) for value in _random_uuid_ints(n, 8)]
@@ -0,0 +1,121 @@
+"""
+pUUID Interning Cache.
+
+Provides the bounded, thread-safe LRU cache that `PUUIDBase.enable_cache` attaches
+to a pUUID class, so hot serialized IDs are parsed once and the instance is shared.
+"""
+
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple, override
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the interning cache of a pUUID class."""
+
+    hits: int
+    """Number of lookups answered from the cache."""
+    misses: int
+    """Number of lookups that parsed the string."""
+    maxsize: int
+    """Maximum number of cached instances."""
+    currsize: int
+    """Current number of cached instances."""
+
+
+class InternCache[T]:
+    """
+    Bounded LRU cache mapping serialized IDs to shared instances.
+
+    Strings are parsed outside of the lock, so a slow or failing parse never blocks
+    other threads. Failed parses are not cached.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached instances, must be positive.
+    """
+
+    __slots__ = ("__weakref__", "_entries", "_hits", "_lock", "_maxsize", "_misses")
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        _CACHES.add(self)
+
+    def get_or_parse(self, key: str, parse: Callable[[str], T]) -> T:
+        """
+        Return the cached instance for `key`, parse and cache it on a miss.
+
+        Parameters
+        ----------
+        key : str
+            The serialized ID.
+        parse : Callable[[str], T]
+            Parser creating the instance, its exceptions propagate.
+
+        Returns
+        -------
+        T
+            The shared instance.
+        """
+        entries = self._entries
+        with self._lock:
+            cached = entries.get(key)
+            if cached is not None:
+                entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+        value = parse(key)
+        with self._lock:
+            entries[key] = value
+            self._evict()
+        return value
+
+    def _evict(self) -> None:
+        entries = self._entries
+        while len(entries) > self._maxsize:
+            _ = entries.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting the least recently used instances."""
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all instances and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._entries)
+            )
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self._maxsize})"
+
+
+_CACHES: weakref.WeakSet[InternCache[object]] = weakref.WeakSet()
+
+
+def _reset_locks_after_fork() -> None:
+    # a lock held by another thread while forking would never be released
+    for cache in _CACHES:
+        cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
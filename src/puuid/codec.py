@@ -0,0 +1,267 @@
+"""
+pUUID String Codecs.
+
+Provides the codecs serializing the 128-bit UUID value of a pUUID after its prefix:
+the canonical dashed form, plain hex and the compact Crockford base32, base58 and
+base62 forms. A codec is chosen per class with the `codec` class keyword.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Literal, final, override
+
+type CodecName = Literal["canonical", "hex", "base32", "base58", "base62"]
+
+_UUID_BITS = 128
+_HEX_DIGIT = "[0-9a-fA-F]"
+_VARIANT_DIGIT = "[89abAB]"
+_CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_CROCKFORD_ALIASES = {"I": "1", "L": "1", "O": "0"}
+# `int(..., 32)` digits, Crockford symbols are translated to them before decoding
+_BASE32HEX_DIGITS = "0123456789abcdefghijklmnopqrstuv"
+_INVALID_DIGIT = ord("!")
+_BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+class PUUIDCodec(ABC):
+    """
+    Abstract string codec of the 128-bit UUID value of a pUUID.
+
+    Implementations must produce bodies of a fixed length that never contain the
+    prefix separator `_`.
+    """
+
+    name: str
+    """Name of the codec."""
+    length: int
+    """Number of characters of an encoded value."""
+
+    @abstractmethod
+    def encode(self, value: int) -> str:
+        """
+        Encode a 128-bit UUID value.
+
+        Parameters
+        ----------
+        value : int
+            The UUID as integer.
+
+        Returns
+        -------
+        str
+            The encoded body of `length` characters.
+        """
+
+    @abstractmethod
+    def decode(self, body: str) -> int:
+        """
+        Decode a body created by `encode`.
+
+        Parameters
+        ----------
+        body : str
+            The encoded UUID.
+
+        Returns
+        -------
+        int
+            The UUID as integer.
+
+        Raises
+        ------
+        ValueError
+            If `body` is not a valid encoding of a 128-bit value.
+        """
+
+    @abstractmethod
+    def pattern(self, version: int | None) -> str:
+        """
+        Return a regular expression (without anchors) matching encoded bodies.
+
+        Parameters
+        ----------
+        version : int | None
+            UUID version to match, if the codec can express it.
+
+        Returns
+        -------
+        str
+            The regular expression.
+        """
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, length={self.length})"
+
+
+@final
+class CanonicalCodec(PUUIDCodec):
+    """Canonical dashed hex form of RFC 9562 (e.g., `550e8400-e29b-41d4-...`)."""
+
+    name = "canonical"
+    length = 36
+
+    @override
+    def encode(self, value: int) -> str:
+        digits = f"{value:032x}"
+        return (
+            f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-"
+            f"{digits[16:20]}-{digits[20:]}"
+        )
+
+    @override
+    def decode(self, body: str) -> int:
+        if len(body) != self.length or not (
+            body[8] == body[13] == body[18] == body[23] == "-"
+        ):
+            raise ValueError(f"Not a canonical UUID: {body!r}")
+        raw = bytes.fromhex(body.replace("-", ""))
+        if len(raw) != 16:
+            raise ValueError(f"Not a canonical UUID: {body!r}")
+        return int.from_bytes(raw)
+
+    @override
+    def pattern(self, version: int | None) -> str:
+        digit = _HEX_DIGIT
+        version_digit = digit if version is None else str(version)
+        return (
+            f"{digit}{{8}}-{digit}{{4}}-{version_digit}{digit}{{3}}-"
+            f"{_VARIANT_DIGIT}{digit}{{3}}-{digit}{{12}}"
+        )
+
+
+@final
+class HexCodec(PUUIDCodec):
+    """32 lowercase hex digits without dashes."""
+
+    name = "hex"
+    length = 32
+
+    @override
+    def encode(self, value: int) -> str:
+        return f"{value:032x}"
+
+    @override
+    def decode(self, body: str) -> int:
+        raw = bytes.fromhex(body)
+        if len(body) != self.length or len(raw) != 16:
+            raise ValueError(f"Not a hex UUID: {body!r}")
+        return int.from_bytes(raw)
+
+    @override
+    def pattern(self, version: int | None) -> str:
+        digit = _HEX_DIGIT
+        version_digit = digit if version is None else str(version)
+        return f"{digit}{{12}}{version_digit}{digit}{{3}}{_VARIANT_DIGIT}{digit}{{15}}"
+
+
+def _crockford_pairs() -> tuple[str, ...]:
+    """All 1024 two-symbol strings, indexed by their 10-bit value."""
+    return tuple(
+        f"{high}{low}" for high in _CROCKFORD_ALPHABET for low in _CROCKFORD_ALPHABET
+    )
+
+
+def _crockford_translation() -> bytes:
+    """Byte table translating Crockford symbols (and aliases) to base32hex digits."""
+    table = bytearray([_INVALID_DIGIT]) * 256
+    symbols = dict(zip(_CROCKFORD_ALPHABET, _BASE32HEX_DIGITS))
+    for alias, symbol in _CROCKFORD_ALIASES.items():
+        symbols[alias] = symbols[symbol]
+    for symbol, digit in symbols.items():
+        table[ord(symbol)] = table[ord(symbol.lower())] = ord(digit)
+    return bytes(table)
+
+
+@final
+class Base32Codec(PUUIDCodec):
+    """
+    26 symbols of Crockford's base32 alphabet.
+
+    Encodes in uppercase, decodes case-insensitively and accepts the aliases `I`,
+    `L` (for `1`) and `O` (for `0`). The encoding preserves the sort order.
+    """
+
+    name = "base32"
+    length = 26
+
+    _pairs = _crockford_pairs()
+    _translation = _crockford_translation()
+    _shifts = tuple(range(_UUID_BITS - 8, -1, -10))
+
+    @override
+    def encode(self, value: int) -> str:
+        pairs = self._pairs
+        return "".join([pairs[(value >> shift) & 0x3FF] for shift in self._shifts])
+
+    @override
+    def decode(self, body: str) -> int:
+        if len(body) != self.length:
+            raise ValueError(f"Not a base32 UUID: {body!r}")
+        value = int(body.encode("ascii").translate(self._translation), 32)
+        if value >> _UUID_BITS:
+            raise ValueError(f"Not a base32 UUID: {body!r}")
+        return value
+
+    @override
+    def pattern(self, version: int | None) -> str:
+        return "[0-7IiLlOo][0-9A-TV-Za-tv-z]{25}"
+
+
+class _BaseNCodec(PUUIDCodec):
+    """
+    Fixed-length positional codec over an ASCII-ordered alphabet.
+
+    Two symbols are encoded and decoded per table lookup. The encoding preserves
+    the sort order.
+    """
+
+    def __init__(self, name: str, alphabet: str, length: int, symbols: str) -> None:
+        self.name = name
+        self.length = length
+        self._symbols = symbols
+        self._pair_base = len(alphabet) ** 2
+        self._pairs = tuple(f"{high}{low}" for high in alphabet for low in alphabet)
+        self._pair_values = {pair: value for value, pair in enumerate(self._pairs)}
+
+    @override
+    def encode(self, value: int) -> str:
+        pairs, pair_base = self._pairs, self._pair_base
+        chunks: list[str] = []
+        for _ in range(self.length // 2):
+            value, chunk = divmod(value, pair_base)
+            chunks.append(pairs[chunk])
+        return "".join(reversed(chunks))
+
+    @override
+    def decode(self, body: str) -> int:
+        if len(body) != self.length:
+            raise ValueError(f"Not a {self.name} UUID: {body!r}")
+        pair_values, pair_base = self._pair_values, self._pair_base
+        value = 0
+        try:
+            for start in range(0, self.length, 2):
+                value = value * pair_base + pair_values[body[start : start + 2]]
+        except KeyError:
+            raise ValueError(f"Not a {self.name} UUID: {body!r}") from None
+        if value >> _UUID_BITS:
+            raise ValueError(f"Not a {self.name} UUID: {body!r}")
+        return value
+
+    @override
+    def pattern(self, version: int | None) -> str:
+        return f"{self._symbols}{{{self.length}}}"
+
+
+CANONICAL: PUUIDCodec = CanonicalCodec()
+"""Default codec, `<prefix>_550e8400-e29b-41d4-a716-446655440000`."""
+
+CODECS: Mapping[CodecName, PUUIDCodec] = {
+    "canonical": CANONICAL,
+    "hex": HexCodec(),
+    "base32": Base32Codec(),
+    "base58": _BaseNCodec("base58", _BASE58_ALPHABET, 22, "[1-9A-HJ-NP-Za-km-z]"),
+    "base62": _BaseNCodec("base62", _BASE62_ALPHABET, 22, "[0-9A-Za-z]"),
+}
+"""Built-in codecs by name."""
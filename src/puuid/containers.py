@@ -0,0 +1,752 @@
+"""
+pUUID Containers.
+
+Provides compact containers for large collections of pUUIDs sharing one class.
+"""
+
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSet,
+)
+from collections.abc import Set as AbstractSet
+from typing import NoReturn, Self, overload, override
+
+from puuid.base import ERR_MSG, PUUIDBase, PUUIDError
+
+_ITEM_SIZE = 16
+_VARIANT_BYTE = 8
+_VERSION_BYTE = 6
+
+
+def _invalid_item_table(version: int) -> bytes:
+    """Translation table mapping the version byte of valid items to 0, others to 1."""
+    return bytes(0 if byte >> 4 == version else 1 for byte in range(256))
+
+
+_INVALID_VARIANT_TABLE = bytes(0 if byte & 0xC0 == 0x80 else 1 for byte in range(256))
+
+
+def _find_invalid_item(data: memoryview, version: int | None) -> int:
+    """Return the index of the first item with a wrong version/variant or -1."""
+    if version is None:
+        return -1
+    versions = data[_VERSION_BYTE::_ITEM_SIZE].tobytes()
+    variants = data[_VARIANT_BYTE::_ITEM_SIZE].tobytes()
+    invalid_versions = versions.translate(_invalid_item_table(version))
+    invalid_variants = variants.translate(_INVALID_VARIANT_TABLE)
+    invalid = int.from_bytes(invalid_versions) | int.from_bytes(invalid_variants)
+    return invalid.to_bytes(len(versions)).find(1)
+
+
+def _raise_foreign_item(
+    container: object, puuid_cls: type[PUUIDBase[str]], value: object
+) -> NoReturn:
+    raise PUUIDError(
+        ERR_MSG.ARRAY_ITEM_TYPE_MISMATCH.format(
+            classname=type(container).__name__,
+            expected=puuid_cls.__name__,
+            actual=type(value).__name__,
+        )
+    )
+
+
+def _check_item(
+    container: object, puuid_cls: type[PUUIDBase[str]], value: object
+) -> None:
+    if not isinstance(value, puuid_cls):
+        _raise_foreign_item(container, puuid_cls, value)
+
+
+def _parse_int(puuid_cls: type[PUUIDBase[str]], serial_puuid: str) -> int:
+    """Parse a serialized pUUID to its integer, without an instance on the fast path."""
+    value = puuid_cls._decode_serial(serial_puuid)
+    return puuid_cls.from_string(serial_puuid)._int if value is None else value
+
+
+class PUUIDArray[T: PUUIDBase[str]]:
+    """
+    Contiguous array of pUUIDs of a single class.
+
+    Stores the raw 128-bit values back to back (16 bytes per item) and creates
+    pUUID instances only when items are accessed. Slices with a step of 1 are
+    views sharing the memory of the original array. The array supports the buffer
+    protocol, so its memory can be handed to I/O without copying.
+
+    Notes
+    -----
+    Like `bytearray`, an array can not grow or shrink while a slice view or an
+    exported buffer (e.g. a `memoryview`) of it is alive.
+    """
+
+    __slots__ = ("_buffer", "_puuid_cls")
+
+    _buffer: bytearray | memoryview
+    _puuid_cls: type[T]
+
+    def __init__(self, puuid_cls: type[T], items: Iterable[T] = ()) -> None:
+        """
+        Initialize a PUUIDArray.
+
+        Parameters
+        ----------
+        puuid_cls : type[T]
+            The pUUID class (e.g., `PUUIDv7[Literal["user"]]`) of the items.
+        items : Iterable[T], optional
+            Initial items of the array.
+
+        Raises
+        ------
+        PUUIDError
+            If an item is not an instance of `puuid_cls`.
+        """
+        self._puuid_cls = puuid_cls
+        self._buffer = bytearray()
+        self.extend(items)
+
+    @classmethod
+    def _from_buffer(cls, puuid_cls: type[T], buffer: bytearray | memoryview) -> Self:
+        array = cls.__new__(cls)
+        array._puuid_cls = puuid_cls
+        array._buffer = buffer
+        return array
+
+    @classmethod
+    def from_buffer(
+        cls, puuid_cls: type[T], data: bytes | bytearray | memoryview
+    ) -> Self:
+        """
+        Create an array from raw, big-endian 16-byte UUID values.
+
+        The data is copied into a new, resizable array.
+
+        Parameters
+        ----------
+        puuid_cls : type[T]
+            The pUUID class of the items.
+        data : bytes | bytearray | memoryview
+            Concatenated 16-byte UUID values.
+
+        Returns
+        -------
+        Self
+            The new array.
+
+        Raises
+        ------
+        PUUIDError
+            If the data length is not a multiple of 16 or an item does not match the
+            UUID version of `puuid_cls`.
+        """
+        view = memoryview(data).cast("B")
+        if len(view) % _ITEM_SIZE:
+            raise PUUIDError(
+                ERR_MSG.ARRAY_BUFFER_LENGTH.format(
+                    length=len(view), item_size=_ITEM_SIZE
+                )
+            )
+        index = _find_invalid_item(view, puuid_cls._version)
+        if index != -1:
+            raise PUUIDError(
+                ERR_MSG.ARRAY_BUFFER_VERSION_MISMATCH.format(
+                    index=index, version=puuid_cls._version
+                )
+            )
+        return cls._from_buffer(puuid_cls, bytearray(view))
+
+    @classmethod
+    def from_strings(cls, puuid_cls: type[T], serial_puuids: Iterable[str]) -> Self:
+        """
+        Create an array from serialized pUUIDs.
+
+        Parameters
+        ----------
+        puuid_cls : type[T]
+            The pUUID class of the items.
+        serial_puuids : Iterable[str]
+            Prefixed UUID strings (e.g., `user_550e8400-e29b...`).
+
+        Returns
+        -------
+        Self
+            The new array.
+
+        Raises
+        ------
+        PUUIDError
+            If a string is malformed or the prefix does not match.
+        """
+        return cls(puuid_cls, map(puuid_cls.from_string, serial_puuids))
+
+    def to_strings(self) -> list[str]:
+        """
+        Return the string representations of all items.
+
+        Returns
+        -------
+        list[str]
+            The formatted strings (e.g., `<prefix>_<uuid-hex-string>`).
+        """
+        return [item.to_string() for item in self]
+
+    @property
+    def puuid_cls(self) -> type[T]:
+        """
+        Return the pUUID class of the items.
+
+        Returns
+        -------
+        type[T]
+            The pUUID class.
+        """
+        return self._puuid_cls
+
+    def _check_item(self, value: T) -> None:
+        _check_item(self, self._puuid_cls, value)
+
+    def _resizable_buffer(self) -> bytearray:
+        buffer = self._buffer
+        if isinstance(buffer, memoryview):
+            raise PUUIDError(
+                ERR_MSG.ARRAY_VIEW_NOT_RESIZABLE.format(classname=type(self).__name__)
+            )
+        return buffer
+
+    def append(self, value: T) -> None:
+        """
+        Append a pUUID to the end of the array.
+
+        Parameters
+        ----------
+        value : T
+            The pUUID to append.
+
+        Raises
+        ------
+        PUUIDError
+            If `value` is not an instance of the array's pUUID class or the array is
+            a slice view.
+        """
+        self._check_item(value)
+        self._resizable_buffer().extend(value.to_bytes())
+
+    def extend(self, values: Iterable[T]) -> None:
+        """
+        Append all pUUIDs from an iterable to the end of the array.
+
+        Parameters
+        ----------
+        values : Iterable[T]
+            The pUUIDs to append.
+
+        Raises
+        ------
+        PUUIDError
+            If a value is not an instance of the array's pUUID class or the array is
+            a slice view.
+        """
+        buffer = self._resizable_buffer()
+        for value in values:
+            self._check_item(value)
+            buffer.extend(value.to_bytes())
+
+    def _item(self, index: int) -> T:
+        offset = index * _ITEM_SIZE
+        value = int.from_bytes(self._buffer[offset : offset + _ITEM_SIZE])
+        return self._puuid_cls._from_int(value)
+
+    def _normalize_index(self, index: int) -> int:
+        length = len(self)
+        normalized = index + length if index < 0 else index
+        if not 0 <= normalized < length:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return normalized
+
+    def _slice(self, index: slice) -> Self:
+        start, stop, step = index.indices(len(self))
+        if step == 1:
+            view = memoryview(self._buffer)[
+                start * _ITEM_SIZE : max(start, stop) * _ITEM_SIZE
+            ]
+            return self._from_buffer(self._puuid_cls, view)
+        buffer = bytearray()
+        for position in range(start, stop, step):
+            buffer.extend(
+                self._buffer[position * _ITEM_SIZE : (position + 1) * _ITEM_SIZE]
+            )
+        return self._from_buffer(self._puuid_cls, buffer)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+    def __getitem__(self, index: int | slice) -> T | Self:
+        if isinstance(index, slice):
+            return self._slice(index)
+        return self._item(self._normalize_index(index))
+
+    def __setitem__(self, index: int, value: T) -> None:
+        self._check_item(value)
+        offset = self._normalize_index(index) * _ITEM_SIZE
+        self._buffer[offset : offset + _ITEM_SIZE] = value.to_bytes()
+
+    def __len__(self) -> int:
+        return len(self._buffer) // _ITEM_SIZE
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._item, range(len(self)))
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, self._puuid_cls):
+            return False
+        needle = value.to_bytes()
+        buffer = self._buffer
+        data = buffer if isinstance(buffer, bytearray) else buffer.tobytes()
+        offset = data.find(needle)
+        while offset != -1 and offset % _ITEM_SIZE:
+            offset = data.find(needle, offset + 1)
+        return offset != -1
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return memoryview(self._buffer)
+
+    def tobytes(self) -> bytes:
+        """
+        Return a copy of the raw, big-endian 16-byte UUID values.
+
+        Returns
+        -------
+        bytes
+            The concatenated UUID values.
+        """
+        return bytes(self._buffer)
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PUUIDArray):
+            return NotImplemented
+        return self._puuid_cls is other._puuid_cls and self._buffer == other._buffer
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._puuid_cls.__name__}, len={len(self)})"
+
+
+class PUUIDSet[T: PUUIDBase[str]](MutableSet[T]):
+    """
+    Set of pUUIDs of a single class.
+
+    Stores the 128-bit values as `int` in a built-in set, so membership tests,
+    inserts and set algebra hash plain integers instead of pUUID instances.
+    Instances are only created when iterating. Operations with another `PUUIDSet`
+    of the same class work on the integer sets directly.
+    """
+
+    __slots__ = ("_ints", "_puuid_cls")
+
+    _ints: set[int]
+    _puuid_cls: type[T]
+
+    def __init__(self, puuid_cls: type[T], items: Iterable[T] = ()) -> None:
+        """
+        Initialize a PUUIDSet.
+
+        Parameters
+        ----------
+        puuid_cls : type[T]
+            The pUUID class (e.g., `PUUIDv7[Literal["user"]]`) of the items.
+        items : Iterable[T], optional
+            Initial items of the set.
+
+        Raises
+        ------
+        PUUIDError
+            If an item is not an instance of `puuid_cls`.
+        """
+        self._puuid_cls = puuid_cls
+        self._ints = set()
+        self.update(items)
+
+    @classmethod
+    def from_strings(cls, puuid_cls: type[T], serial_puuids: Iterable[str]) -> Self:
+        """
+        Create a set from serialized pUUIDs.
+
+        Parameters
+        ----------
+        puuid_cls : type[T]
+            The pUUID class of the items.
+        serial_puuids : Iterable[str]
+            Prefixed UUID strings (e.g., `user_550e8400-e29b...`).
+
+        Returns
+        -------
+        Self
+            The new set.
+
+        Raises
+        ------
+        PUUIDError
+            If a string is malformed or the prefix does not match.
+        """
+        puuid_set = cls(puuid_cls)
+        puuid_set.update_from_strings(serial_puuids)
+        return puuid_set
+
+    def _with_ints(self, ints: set[int]) -> Self:
+        puuid_set = type(self).__new__(type(self))
+        puuid_set._puuid_cls = self._puuid_cls
+        puuid_set._ints = ints
+        return puuid_set
+
+    def _from_iterable(self, values: Iterable[T]) -> Self:
+        # used by the `AbstractSet` mixins, e.g. `__rsub__`
+        return type(self)(self._puuid_cls, values)
+
+    @property
+    def puuid_cls(self) -> type[T]:
+        """
+        Return the pUUID class of the items.
+
+        Returns
+        -------
+        type[T]
+            The pUUID class.
+        """
+        return self._puuid_cls
+
+    def update_from_strings(self, serial_puuids: Iterable[str]) -> None:
+        """
+        Add serialized pUUIDs without creating pUUID instances.
+
+        Parameters
+        ----------
+        serial_puuids : Iterable[str]
+            Prefixed UUID strings (e.g., `user_550e8400-e29b...`).
+
+        Raises
+        ------
+        PUUIDError
+            If a string is malformed or the prefix does not match.
+        """
+        puuid_cls = self._puuid_cls
+        self._ints.update(_parse_int(puuid_cls, serial) for serial in serial_puuids)
+
+    def to_strings(self) -> list[str]:
+        """
+        Return the string representations of all items.
+
+        Returns
+        -------
+        list[str]
+            The formatted strings (e.g., `<prefix>_<uuid-hex-string>`).
+        """
+        return [item.to_string() for item in self]
+
+    def _same_class_ints(self, other: object) -> set[int] | None:
+        if isinstance(other, PUUIDSet) and other._puuid_cls is self._puuid_cls:
+            return other._ints
+        return None
+
+    def _checked_ints(self, values: Iterable[object]) -> set[int]:
+        ints = self._same_class_ints(values)
+        if ints is not None:
+            return ints
+        puuid_cls = self._puuid_cls
+        checked: set[int] = set()
+        add = checked.add
+        # a single pass with an exact type check is faster than separate passes
+        for value in values:
+            if type(value) is not puuid_cls and not isinstance(value, puuid_cls):
+                _raise_foreign_item(self, puuid_cls, value)
+            add(value._int)
+        return checked
+
+    def _member_ints(self, values: Iterable[object]) -> set[int]:
+        """Integers of the values that can be members, foreign values are skipped."""
+        ints = self._same_class_ints(values)
+        if ints is not None:
+            return ints
+        puuid_cls = self._puuid_cls
+        return {value._int for value in values if isinstance(value, puuid_cls)}
+
+    @override
+    def add(self, value: T) -> None:
+        """
+        Add a pUUID to the set.
+
+        Parameters
+        ----------
+        value : T
+            The pUUID to add.
+
+        Raises
+        ------
+        PUUIDError
+            If `value` is not an instance of the set's pUUID class.
+        """
+        _check_item(self, self._puuid_cls, value)
+        self._ints.add(value._int)
+
+    def update(self, values: Iterable[T]) -> None:
+        """
+        Add all pUUIDs from an iterable to the set.
+
+        Parameters
+        ----------
+        values : Iterable[T]
+            The pUUIDs to add.
+
+        Raises
+        ------
+        PUUIDError
+            If a value is not an instance of the set's pUUID class.
+        """
+        self._ints.update(self._checked_ints(values))
+
+    @override
+    def discard(self, value: T) -> None:
+        if isinstance(value, self._puuid_cls):
+            self._ints.discard(value._int)
+
+    @override
+    def clear(self) -> None:
+        self._ints.clear()
+
+    @override
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, self._puuid_cls) and value._int in self._ints
+
+    @override
+    def __len__(self) -> int:
+        return len(self._ints)
+
+    @override
+    def __iter__(self) -> Iterator[T]:
+        return map(self._puuid_cls._from_int, self._ints)
+
+    @override
+    def __and__(self, other: AbstractSet[object]) -> Self:
+        if not isinstance(other, AbstractSet):
+            return NotImplemented
+        return self._with_ints(self._ints & self._member_ints(other))
+
+    @override
+    def __or__(self, other: AbstractSet[object]) -> Self:
+        if not isinstance(other, AbstractSet):
+            return NotImplemented
+        return self._with_ints(self._ints | self._checked_ints(other))
+
+    @override
+    def __sub__(self, other: AbstractSet[object]) -> Self:
+        if not isinstance(other, AbstractSet):
+            return NotImplemented
+        return self._with_ints(self._ints - self._member_ints(other))
+
+    @override
+    def __xor__(self, other: AbstractSet[object]) -> Self:
+        if not isinstance(other, AbstractSet):
+            return NotImplemented
+        return self._with_ints(self._ints ^ self._checked_ints(other))
+
+    @override
+    def __iand__(self, values: Iterable[object]) -> Self:
+        self._ints &= self._member_ints(values)
+        return self
+
+    @override
+    def __ior__(self, values: Iterable[object]) -> Self:
+        self._ints |= self._checked_ints(values)
+        return self
+
+    @override
+    def __isub__(self, values: Iterable[object]) -> Self:
+        self._ints -= self._member_ints(values)
+        return self
+
+    @override
+    def __ixor__(self, values: Iterable[object]) -> Self:
+        self._ints ^= self._checked_ints(values)
+        return self
+
+    @override
+    def __le__(self, other: AbstractSet[object]) -> bool:
+        ints = self._same_class_ints(other)
+        return super().__le__(other) if ints is None else self._ints <= ints
+
+    @override
+    def __ge__(self, other: AbstractSet[object]) -> bool:
+        ints = self._same_class_ints(other)
+        return super().__ge__(other) if ints is None else self._ints >= ints
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        ints = self._same_class_ints(other)
+        return super().__eq__(other) if ints is None else self._ints == ints
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._puuid_cls.__name__}, len={len(self)})"
+
+
+class PUUIDDict[K: PUUIDBase[str], V](MutableMapping[K, V]):
+    """
+    Dictionary keyed by pUUIDs of a single class.
+
+    Stores the 128-bit values of the keys as `int` in a built-in dict, so lookups
+    and inserts hash plain integers instead of pUUID instances. Key instances are
+    only created when iterating.
+    """
+
+    __slots__ = ("_puuid_cls", "_values")
+
+    _puuid_cls: type[K]
+    _values: dict[int, V]
+
+    def __init__(
+        self,
+        puuid_cls: type[K],
+        items: Mapping[K, V] | Iterable[tuple[K, V]] = (),
+    ) -> None:
+        """
+        Initialize a PUUIDDict.
+
+        Parameters
+        ----------
+        puuid_cls : type[K]
+            The pUUID class (e.g., `PUUIDv7[Literal["user"]]`) of the keys.
+        items : Mapping[K, V] | Iterable[tuple[K, V]], optional
+            Initial items of the dictionary.
+
+        Raises
+        ------
+        PUUIDError
+            If a key is not an instance of `puuid_cls`.
+        """
+        self._puuid_cls = puuid_cls
+        self._values = {}
+        self._update_items(items)
+
+    def _update_items(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        pairs = items.items() if isinstance(items, Mapping) else items
+        puuid_cls, values = self._puuid_cls, self._values
+        for key, value in pairs:
+            if type(key) is not puuid_cls and not isinstance(key, puuid_cls):
+                _raise_foreign_item(self, puuid_cls, key)
+            values[key._int] = value
+
+    @classmethod
+    def from_strings(
+        cls,
+        puuid_cls: type[K],
+        items: Mapping[str, V] | Iterable[tuple[str, V]],
+    ) -> Self:
+        """
+        Create a dictionary from items keyed by serialized pUUIDs.
+
+        Parameters
+        ----------
+        puuid_cls : type[K]
+            The pUUID class of the keys.
+        items : Mapping[str, V] | Iterable[tuple[str, V]]
+            Items keyed by prefixed UUID strings (e.g., `user_550e8400-e29b...`).
+
+        Returns
+        -------
+        Self
+            The new dictionary.
+
+        Raises
+        ------
+        PUUIDError
+            If a key is malformed or its prefix does not match.
+        """
+        puuid_dict = cls(puuid_cls)
+        puuid_dict.update_from_strings(items)
+        return puuid_dict
+
+    @property
+    def puuid_cls(self) -> type[K]:
+        """
+        Return the pUUID class of the keys.
+
+        Returns
+        -------
+        type[K]
+            The pUUID class.
+        """
+        return self._puuid_cls
+
+    def update_from_strings(
+        self, items: Mapping[str, V] | Iterable[tuple[str, V]]
+    ) -> None:
+        """
+        Insert items keyed by serialized pUUIDs without creating pUUID instances.
+
+        Parameters
+        ----------
+        items : Mapping[str, V] | Iterable[tuple[str, V]]
+            Items keyed by prefixed UUID strings (e.g., `user_550e8400-e29b...`).
+
+        Raises
+        ------
+        PUUIDError
+            If a key is malformed or its prefix does not match.
+        """
+        puuid_cls = self._puuid_cls
+        pairs = items.items() if isinstance(items, Mapping) else items
+        self._values.update(
+            (_parse_int(puuid_cls, serial), value) for serial, value in pairs
+        )
+
+    @override
+    def __getitem__(self, key: K) -> V:
+        if isinstance(key, self._puuid_cls):
+            try:
+                return self._values[key._int]
+            except KeyError:
+                pass
+        raise KeyError(key)
+
+    @override
+    def __setitem__(self, key: K, value: V) -> None:
+        _check_item(self, self._puuid_cls, key)
+        self._values[key._int] = value
+
+    @override
+    def __delitem__(self, key: K) -> None:
+        if isinstance(key, self._puuid_cls):
+            try:
+                del self._values[key._int]
+                return
+            except KeyError:
+                pass
+        raise KeyError(key)
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, self._puuid_cls) and key._int in self._values
+
+    @override
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @override
+    def __iter__(self) -> Iterator[K]:
+        return map(self._puuid_cls._from_int, self._values)
+
+    @override
+    def clear(self) -> None:
+        self._values.clear()
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PUUIDDict) and other._puuid_cls is self._puuid_cls:
+            return self._values == other._values
+        return super().__eq__(other)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._puuid_cls.__name__}, len={len(self)})"
@@ -0,0 +1,256 @@
+"""
+pUUID Generators.
+
+Provides stateful generators for strictly monotonic pUUIDs.
+"""
+
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable, Mapping
+from typing import Literal, TypeAliasType, get_args, override
+
+from puuid.base import (
+    ERR_MSG,
+    PUUIDError,
+    PUUIDv7,
+    _check_batch_size,
+    _spread_payload,
+    _version_flags,
+)
+
+type V7Method = Literal["counter", "precision"]
+type ClockRegressionPolicy = Literal["stall", "borrow", "raise"]
+
+# UUIDv7 bits besides version and variant: 48 bit ms timestamp, rand_a and rand_b
+_FIELD_BITS = 122
+_RAND_A_BITS = 12
+_MS_BITS = 48
+_NS_PER_MS = 1_000_000
+_WORD_BYTES = 8
+
+_V7_FLAGS = _version_flags(7)
+_COUNTER_BITS_RANGE: Mapping[V7Method, range] = {
+    "counter": range(12, 43),
+    # at least one random bit is left, so forked processes diverge within a tick
+    "precision": range(62),
+}
+_DEFAULT_COUNTER_BITS: Mapping[V7Method, int] = {"counter": 42, "precision": 16}
+# number of sub-millisecond timestamp bits stored in `rand_a`
+_FRACTION_BITS: Mapping[V7Method, int] = {"counter": 0, "precision": _RAND_A_BITS}
+
+
+def _check_option(
+    generator: str, option: str, value: str, choices: TypeAliasType
+) -> None:
+    valid = get_args(choices.__value__)
+    if value not in valid:
+        raise PUUIDError(
+            ERR_MSG.UNKNOWN_GENERATOR_OPTION.format(
+                option=option, value=value, generator=generator, choices=list(valid)
+            )
+        )
+
+
+def _check_counter_bits(method: V7Method, counter_bits: int | None) -> int:
+    bits = _DEFAULT_COUNTER_BITS[method] if counter_bits is None else counter_bits
+    valid = _COUNTER_BITS_RANGE[method]
+    if bits not in valid:
+        raise PUUIDError(
+            ERR_MSG.INVALID_COUNTER_BITS.format(
+                method=method, low=valid[0], high=valid[-1], counter_bits=bits
+            )
+        )
+    return bits
+
+
+class PUUIDv7Generator[T: PUUIDv7[str]]:
+    """
+    Strictly monotonic generator for pUUIDs of version 7.
+
+    Implements the monotonicity methods of RFC 9562 (section 6.2):
+
+    - `"counter"` (method 1): a counter of `counter_bits` (12-42) bits follows the
+      millisecond timestamp. It is seeded randomly with its most significant bit
+      cleared whenever the millisecond changes and incremented otherwise.
+    - `"precision"` (method 3): `rand_a` holds the sub-millisecond fraction of the
+      timestamp (~244 ns resolution), followed by a counter of `counter_bits`
+      (0-61) bits.
+
+    The remaining bits are random. A counter overflow carries into the timestamp,
+    so IDs of one generator are strictly increasing. Generators are thread-safe
+    and reseed their counter in the child process after `fork()`.
+
+    Parameters
+    ----------
+    puuid_cls : type[T]
+        The pUUID class (e.g., `PUUIDv7[Literal["user"]]`) to generate.
+    method : V7Method, optional
+        Either `"counter"` (default) or `"precision"`.
+    counter_bits : int | None, optional
+        Width of the counter, defaults to 42 bits for `"counter"` and 16 bits for
+        `"precision"`.
+    on_clock_regression : ClockRegressionPolicy, optional
+        Behaviour if the clock moves backwards: `"borrow"` (default) keeps the
+        last timestamp and increments the counter, `"stall"` sleeps until the
+        clock caught up and `"raise"` raises a `PUUIDError`.
+    clock : Callable[[], int], optional
+        Source of the current time in nanoseconds since the Unix epoch.
+
+    Raises
+    ------
+    PUUIDError
+        If `puuid_cls` is not a `PUUIDv7` class, `method` or `on_clock_regression`
+        is unknown or `counter_bits` is out of range.
+    """
+
+    def __init__(
+        self,
+        puuid_cls: type[T],
+        *,
+        method: V7Method = "counter",
+        counter_bits: int | None = None,
+        on_clock_regression: ClockRegressionPolicy = "borrow",
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        generator = type(self).__name__
+        if not issubclass(puuid_cls, PUUIDv7):
+            raise PUUIDError(
+                ERR_MSG.GENERATOR_CLASS_MISMATCH.format(
+                    generator=generator,
+                    expected=PUUIDv7.__name__,
+                    classname=puuid_cls.__name__,
+                )
+            )
+        _check_option(generator, "method", method, V7Method)
+        _check_option(
+            generator, "on_clock_regression", on_clock_regression, ClockRegressionPolicy
+        )
+        self._puuid_cls = puuid_cls
+        self._counter_bits = _check_counter_bits(method, counter_bits)
+        self._fraction_bits = _FRACTION_BITS[method]
+        self._random_bits = (
+            _FIELD_BITS - _MS_BITS - self._fraction_bits - self._counter_bits
+        )
+        self._on_clock_regression = on_clock_regression
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_tick = -1
+        self._last_state = -1
+        _GENERATORS.add(self)
+
+    @property
+    def puuid_cls(self) -> type[T]:
+        """
+        Return the generated pUUID class.
+
+        Returns
+        -------
+        type[T]
+            The pUUID class.
+        """
+        return self._puuid_cls
+
+    def _tick(self) -> int:
+        """Read the clock in units of the timestamp resolution."""
+        ms, ns = divmod(self._clock(), _NS_PER_MS)
+        fraction = (ns << self._fraction_bits) // _NS_PER_MS
+        return ms << self._fraction_bits | fraction
+
+    def _tick_seconds(self, ticks: int) -> float:
+        return ticks / (1000 << self._fraction_bits)
+
+    def _stall(self) -> int:
+        tick = self._tick()
+        while tick < self._last_tick:
+            time.sleep(self._tick_seconds(self._last_tick - tick))
+            tick = self._tick()
+        return tick
+
+    def _current_tick(self) -> int:
+        tick = self._tick()
+        if tick >= self._last_tick or self._on_clock_regression == "borrow":
+            return tick
+        if self._on_clock_regression == "stall":
+            return self._stall()
+        raise PUUIDError(
+            ERR_MSG.CLOCK_REGRESSION.format(
+                delta_ms=f"{self._tick_seconds(self._last_tick - tick) * 1000:.3f}",
+                classname=self._puuid_cls.__name__,
+            )
+        )
+
+    def _reserve(self, n: int, seed: int) -> int:
+        """Reserve `n` consecutive states, return the first one."""
+        tick = self._current_tick()
+        if tick > self._last_tick:
+            counter = seed & ((1 << max(self._counter_bits - 1, 0)) - 1)
+            first = max(tick << self._counter_bits | counter, self._last_state + 1)
+        else:
+            first = self._last_state + 1
+        self._last_tick = max(tick, self._last_tick)
+        self._last_state = first + n - 1
+        return first
+
+    def factory(self) -> T:
+        """
+        Create the next pUUID.
+
+        Returns
+        -------
+        T
+            A new pUUID, greater than all previously generated ones.
+        """
+        return self.factory_many(1)[0]
+
+    def factory_many(self, n: int) -> list[T]:
+        """
+        Create the next `n` pUUIDs in a single batch.
+
+        Parameters
+        ----------
+        n : int
+            Number of pUUIDs to create.
+
+        Returns
+        -------
+        list[T]
+            The new pUUIDs in strictly increasing order.
+        """
+        _check_batch_size(n)
+        if not n:
+            return []
+        words = memoryview(os.urandom(_WORD_BYTES * (n + 1))).cast("Q")
+        with self._lock:
+            first = self._reserve(n, words[0])
+        random_bits = self._random_bits
+        random_mask = (1 << random_bits) - 1
+        return [
+            self._puuid_cls._from_int(
+                _spread_payload(state << random_bits | word & random_mask) | _V7_FLAGS
+            )
+            for state, word in zip(range(first, first + n), words[1:])
+        ]
+
+    def _reseed(self) -> None:
+        """Advance the counter by a random step, so a forked child diverges."""
+        self._lock = threading.Lock()
+        step = int.from_bytes(os.urandom(_WORD_BYTES))
+        self._last_state += 1 + (step & ((1 << max(self._counter_bits - 1, 0)) - 1))
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._puuid_cls.__name__})"
+
+
+_GENERATORS: weakref.WeakSet[PUUIDv7Generator[PUUIDv7[str]]] = weakref.WeakSet()
+
+
+def _reseed_generators_after_fork() -> None:
+    for generator in _GENERATORS:
+        generator._reseed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_generators_after_fork)
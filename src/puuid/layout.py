@@ -0,0 +1,353 @@
+"""
+pUUID Layouts.
+
+Provides a Snowflake-style layout packing a timestamp, a shard and a sequence
+number into the 122 custom bits of a `PUUIDv8`.
+"""
+
+import os
+import time
+from collections.abc import Callable
+from typing import NamedTuple, override
+
+from puuid.base import (
+    ERR_MSG,
+    PUUIDError,
+    PUUIDv8,
+    _check_batch_size,
+    _gather_payload,
+    _spread_payload,
+    _version_flags,
+)
+
+_PAYLOAD_BITS = 122
+_NS_PER_MS = 1_000_000
+_V8_FLAGS = _version_flags(8)
+
+
+class SnowflakeFields(NamedTuple):
+    """Fields of a `PUUIDv8` decoded with a `SnowflakeLayout`."""
+
+    timestamp_ms: int
+    """Milliseconds since the Unix epoch."""
+    shard: int
+    """Shard (or worker) ID of the generator."""
+    sequence: int
+    """Sequence number within the millisecond."""
+
+
+class SnowflakeLayout:
+    """
+    Declarative Snowflake-style layout of the 122 custom bits of a `PUUIDv8`.
+
+    From the most significant bit on, the layout holds the milliseconds since
+    `epoch_ms`, the shard, a per-shard sequence number and random bits filling the
+    remainder. IDs are therefore roughly time-sorted across shards and strictly
+    increasing per generator.
+
+    Parameters
+    ----------
+    shard_bits : int, optional
+        Width of the shard (or worker) ID.
+    sequence_bits : int, optional
+        Width of the sequence number within one millisecond.
+    timestamp_bits : int, optional
+        Width of the millisecond timestamp.
+    epoch_ms : int, optional
+        Custom epoch in milliseconds since the Unix epoch.
+
+    Raises
+    ------
+    PUUIDError
+        If a width is negative, the timestamp has no bits or the fields need more
+        than 122 bits.
+    """
+
+    __slots__ = ("_epoch_ms", "_sequence_bits", "_shard_bits", "_timestamp_bits")
+
+    def __init__(
+        self,
+        *,
+        shard_bits: int = 10,
+        sequence_bits: int = 12,
+        timestamp_bits: int = 48,
+        epoch_ms: int = 0,
+    ) -> None:
+        widths = (timestamp_bits, shard_bits, sequence_bits)
+        if timestamp_bits < 1 or min(widths) < 0 or sum(widths) > _PAYLOAD_BITS:
+            raise PUUIDError(
+                ERR_MSG.INVALID_SNOWFLAKE_LAYOUT.format(
+                    timestamp_bits=timestamp_bits,
+                    shard_bits=shard_bits,
+                    sequence_bits=sequence_bits,
+                )
+            )
+        self._timestamp_bits = timestamp_bits
+        self._shard_bits = shard_bits
+        self._sequence_bits = sequence_bits
+        self._epoch_ms = epoch_ms
+
+    @property
+    def timestamp_bits(self) -> int:
+        """Width of the millisecond timestamp."""
+        return self._timestamp_bits
+
+    @property
+    def shard_bits(self) -> int:
+        """Width of the shard ID."""
+        return self._shard_bits
+
+    @property
+    def sequence_bits(self) -> int:
+        """Width of the sequence number."""
+        return self._sequence_bits
+
+    @property
+    def random_bits(self) -> int:
+        """Width of the random remainder."""
+        return (
+            _PAYLOAD_BITS
+            - self._timestamp_bits
+            - self._shard_bits
+            - self._sequence_bits
+        )
+
+    @property
+    def epoch_ms(self) -> int:
+        """Custom epoch in milliseconds since the Unix epoch."""
+        return self._epoch_ms
+
+    def generator[T: PUUIDv8[str]](
+        self,
+        puuid_cls: type[T],
+        shard: int,
+        *,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> SnowflakeGenerator[T]:
+        """
+        Create a generator for one shard.
+
+        Parameters
+        ----------
+        puuid_cls : type[T]
+            The pUUID class (e.g., `PUUIDv8[Literal["order"]]`) to generate.
+        shard : int
+            The shard (or worker) ID encoded in every generated ID.
+        clock : Callable[[], int], optional
+            Source of the current time in nanoseconds since the Unix epoch.
+
+        Returns
+        -------
+        SnowflakeGenerator[T]
+            The generator.
+
+        Raises
+        ------
+        PUUIDError
+            If `puuid_cls` is not a `PUUIDv8` class or `shard` does not fit.
+        """
+        return SnowflakeGenerator(self, puuid_cls, shard, clock=clock)
+
+    def _pack(self, elapsed_ms: int, shard: int, sequence: int, remainder: int) -> int:
+        """Pack the fields into the 128-bit integer of a UUIDv8."""
+        sequence_shift = self.random_bits
+        shard_shift = sequence_shift + self._sequence_bits
+        timestamp_shift = shard_shift + self._shard_bits
+        payload = (
+            elapsed_ms << timestamp_shift
+            | shard << shard_shift
+            | sequence << sequence_shift
+            | remainder
+        )
+        return _spread_payload(payload) | _V8_FLAGS
+
+    def decode(self, puuid: PUUIDv8[str]) -> SnowflakeFields:
+        """
+        Decode the fields of a pUUID created with this layout.
+
+        Parameters
+        ----------
+        puuid : PUUIDv8[str]
+            The pUUID to decode.
+
+        Returns
+        -------
+        SnowflakeFields
+            The timestamp, shard and sequence number.
+        """
+        payload = _gather_payload(puuid._int) >> self.random_bits
+        sequence = payload & ((1 << self._sequence_bits) - 1)
+        shard = (payload >> self._sequence_bits) & ((1 << self._shard_bits) - 1)
+        elapsed_ms = payload >> (self._sequence_bits + self._shard_bits)
+        return SnowflakeFields(elapsed_ms + self._epoch_ms, shard, sequence)
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(shard_bits={self._shard_bits}, "
+            f"sequence_bits={self._sequence_bits}, "
+            f"timestamp_bits={self._timestamp_bits}, epoch_ms={self._epoch_ms})"
+        )
+
+
+class SnowflakeGenerator[T: PUUIDv8[str]]:
+    """
+    Generator of `PUUIDv8` IDs for a single shard of a `SnowflakeLayout`.
+
+    The sequence number restarts at 0 every millisecond. If it overflows, or the
+    clock moves backwards, the generator continues with the last timestamp and
+    carries into it, so its IDs are strictly increasing.
+
+    The generator is lock-free: it must not be shared between threads. Use one
+    generator (and shard) per worker instead, then IDs are globally unique without
+    coordination.
+
+    Parameters
+    ----------
+    layout : SnowflakeLayout
+        The layout of the generated IDs.
+    puuid_cls : type[T]
+        The pUUID class to generate.
+    shard : int
+        The shard (or worker) ID encoded in every generated ID.
+    clock : Callable[[], int], optional
+        Source of the current time in nanoseconds since the Unix epoch.
+
+    Raises
+    ------
+    PUUIDError
+        If `puuid_cls` is not a `PUUIDv8` class or `shard` does not fit.
+    """
+
+    def __init__(
+        self,
+        layout: SnowflakeLayout,
+        puuid_cls: type[T],
+        shard: int,
+        *,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        _check_generator_args(self, layout, puuid_cls, shard)
+        self._layout = layout
+        self._puuid_cls = puuid_cls
+        self._shard = shard
+        self._clock = clock
+        self._last_state = -1
+
+    @property
+    def layout(self) -> SnowflakeLayout:
+        """Layout of the generated IDs."""
+        return self._layout
+
+    @property
+    def shard(self) -> int:
+        """Shard ID encoded in the generated IDs."""
+        return self._shard
+
+    def _check_elapsed_ms(self, elapsed_ms: int) -> None:
+        layout = self._layout
+        if not 0 <= elapsed_ms < 1 << layout.timestamp_bits:
+            raise PUUIDError(
+                ERR_MSG.SNOWFLAKE_TIMESTAMP_OVERFLOW.format(
+                    timestamp_ms=elapsed_ms + layout.epoch_ms,
+                    timestamp_bits=layout.timestamp_bits,
+                    epoch_ms=layout.epoch_ms,
+                )
+            )
+
+    def _elapsed_ms(self) -> int:
+        elapsed_ms = self._clock() // _NS_PER_MS - self._layout.epoch_ms
+        self._check_elapsed_ms(elapsed_ms)
+        return elapsed_ms
+
+    def _reserve(self, n: int) -> int:
+        """Reserve `n` consecutive timestamp/sequence states, return the first."""
+        sequence_bits = self._layout.sequence_bits
+        first = max(self._elapsed_ms() << sequence_bits, self._last_state + 1)
+        last = first + n - 1
+        # sequence overflows carry into the timestamp, which must still fit
+        self._check_elapsed_ms(last >> sequence_bits)
+        self._last_state = last
+        return first
+
+    def factory(self) -> T:
+        """
+        Create the next pUUID.
+
+        Returns
+        -------
+        T
+            A new pUUID, greater than all previously generated ones.
+        """
+        return self.factory_many(1)[0]
+
+    def factory_many(self, n: int) -> list[T]:
+        """
+        Create the next `n` pUUIDs in a single batch.
+
+        Parameters
+        ----------
+        n : int
+            Number of pUUIDs to create.
+
+        Returns
+        -------
+        list[T]
+            The new pUUIDs in strictly increasing order.
+        """
+        _check_batch_size(n)
+        first = self._reserve(n)
+        pack = self._layout._pack
+        sequence_bits = self._layout.sequence_bits
+        sequence_mask = (1 << sequence_bits) - 1
+        remainders = _random_remainders(n, self._layout.random_bits)
+        return [
+            self._puuid_cls._from_int(
+                pack(
+                    state >> sequence_bits,
+                    self._shard,
+                    state & sequence_mask,
+                    remainder,
+                )
+            )
+            for state, remainder in zip(range(first, first + n), remainders)
+        ]
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self._puuid_cls.__name__}, "
+            f"shard={self._shard}, layout={self._layout!r})"
+        )
+
+
+def _check_generator_args[T: PUUIDv8[str]](
+    generator: SnowflakeGenerator[T],
+    layout: SnowflakeLayout,
+    puuid_cls: type[T],
+    shard: int,
+) -> None:
+    if not issubclass(puuid_cls, PUUIDv8):
+        raise PUUIDError(
+            ERR_MSG.GENERATOR_CLASS_MISMATCH.format(
+                generator=type(generator).__name__,
+                expected=PUUIDv8.__name__,
+                classname=puuid_cls.__name__,
+            )
+        )
+    if not 0 <= shard < 1 << layout.shard_bits:
+        raise PUUIDError(
+            ERR_MSG.INVALID_SHARD.format(shard=shard, shard_bits=layout.shard_bits)
+        )
+
+
+def _random_remainders(n: int, random_bits: int) -> list[int]:
+    if not random_bits:
+        return [0] * n
+    size = (random_bits + 7) // 8
+    entropy = os.urandom(size * n)
+    mask = (1 << random_bits) - 1
+    return [
+        int.from_bytes(entropy[offset : offset + size]) & mask
+        for offset in range(0, size * n, size)
+    ]
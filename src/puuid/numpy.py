@@ -0,0 +1,257 @@
+"""
+pUUID NumPy Support.
+
+Vectorized conversion between arrays of serialized pUUIDs and their raw 16-byte
+UUID values, and extraction of their embedded creation times. Requires the optional
+`numpy` dependency.
+"""
+
+from typing import Literal, NamedTuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from puuid.base import _GREGORIAN_OFFSET, ERR_MSG, PUUIDBase, PUUIDError
+from puuid.codec import CANONICAL
+
+_UUID_BYTES = 16
+_UUID_LENGTH = 36
+_DASH_POSITIONS = [8, 13, 18, 23]
+# (start, stop) of the hex digit groups within the canonical UUID string
+_HEX_GROUPS = ((0, 8), (9, 13), (14, 18), (19, 23), (24, 36))
+# offsets of the same groups within the 32 undashed hex digits
+_DIGIT_OFFSETS = (0, 8, 12, 16, 20)
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+_INVALID_NIBBLE = 0xFF
+
+
+def _hex_value_table() -> NDArray[np.uint8]:
+    table = np.full(256, _INVALID_NIBBLE, dtype=np.uint8)
+    for value, digit in enumerate("0123456789abcdef"):
+        table[ord(digit)] = value
+        table[ord(digit.upper())] = value
+    return table
+
+
+_HEX_VALUES = _hex_value_table()
+
+
+class ParseResult(NamedTuple):
+    """Result of `parse_strings`."""
+
+    uuids: NDArray[np.uint8]
+    """Raw big-endian UUID values with shape `(N, 16)`, zeroed for invalid rows."""
+    invalid: NDArray[np.intp]
+    """Indices of the rows that are not valid serialized pUUIDs of the class."""
+
+
+def _serial_head(puuid_cls: type[PUUIDBase[str]], function: str) -> str:
+    codec = puuid_cls.codec()
+    if codec is not CANONICAL:
+        raise PUUIDError(
+            ERR_MSG.CODEC_UNSUPPORTED.format(
+                function=function, classname=puuid_cls.__name__, codec=codec.name
+            )
+        )
+    return f"{puuid_cls.prefix()}_"
+
+
+def _code_units(serials: NDArray[np.str_] | NDArray[np.bytes_]) -> NDArray[np.uint32]:
+    """View a fixed-width string array as a `(N, width)` matrix of code units."""
+    width = serials.dtype.itemsize
+    if serials.dtype.kind == "U":
+        return serials.view(np.uint32).reshape(len(serials), width // 4)
+    return serials.view(np.uint8).reshape(len(serials), width).astype(np.uint32)
+
+
+def _as_serial_array(
+    serials: NDArray[np.str_] | NDArray[np.bytes_] | NDArray[np.object_],
+) -> NDArray[np.str_] | NDArray[np.bytes_]:
+    array = np.ascontiguousarray(serials).ravel()
+    if array.dtype.kind in "US":
+        return array
+    return array.astype(np.str_)
+
+
+def _head_units(head: str, kind: Literal["U", "S"]) -> NDArray[np.uint32]:
+    units = [ord(char) for char in head] if kind == "U" else list(head.encode())
+    return np.array(units, dtype=np.uint32)
+
+
+def _decode_hex(
+    body: NDArray[np.uint32],
+) -> tuple[NDArray[np.uint8], NDArray[np.bool_]]:
+    """Decode `(N, 36)` canonical UUID code units, return bytes and a validity mask."""
+    digits = np.concatenate([body[:, start:stop] for start, stop in _HEX_GROUPS], 1)
+    nibbles = _HEX_VALUES[np.minimum(digits, 0xFF)]
+    valid = (nibbles != _INVALID_NIBBLE).all(axis=1)
+    valid &= (body[:, _DASH_POSITIONS] == ord("-")).all(axis=1)
+    uuids = np.ascontiguousarray((nibbles[:, 0::2] << 4) | nibbles[:, 1::2])
+    return uuids, valid
+
+
+def _version_mask(uuids: NDArray[np.uint8], version: int | None) -> NDArray[np.bool_]:
+    valid = (uuids[:, 8] & 0xC0) == 0x80
+    if version is not None:
+        valid &= (uuids[:, 6] >> 4) == version
+    return valid
+
+
+def parse_strings(
+    serials: NDArray[np.str_] | NDArray[np.bytes_] | NDArray[np.object_],
+    puuid_cls: type[PUUIDBase[str]],
+) -> ParseResult:
+    """
+    Parse an array of serialized pUUIDs in vectorized passes.
+
+    The prefix, separator, UUID format and UUID version of all rows are checked at
+    once. Instead of raising on the first malformed row, the indices of all invalid
+    rows are reported.
+
+    Parameters
+    ----------
+    serials : NDArray[np.str_] | NDArray[np.bytes_] | NDArray[np.object_]
+        Serialized pUUIDs (e.g., `user_550e8400-e29b...`) as unicode, fixed-width
+        bytes or object array.
+    puuid_cls : type[PUUIDBase[str]]
+        The pUUID class (e.g., `PUUIDv7[Literal["user"]]`) of the serialized IDs.
+
+    Returns
+    -------
+    ParseResult
+        The raw UUID values with shape `(N, 16)` and the indices of invalid rows.
+
+    Raises
+    ------
+    PUUIDError
+        If the class does not use the canonical codec.
+    """
+    serial_head = _serial_head(puuid_cls, "parse_strings")
+    array = _as_serial_array(serials)
+    units = _code_units(array)
+    head = _head_units(serial_head, "U" if array.dtype.kind == "U" else "S")
+    length = len(head) + _UUID_LENGTH
+    if units.shape[1] < length:
+        units = np.pad(units, ((0, 0), (0, length - units.shape[1])))
+
+    uuids, valid = _decode_hex(units[:, len(head) : length])
+    valid &= (units[:, : len(head)] == head).all(axis=1)
+    valid &= (units[:, length:] == 0).all(axis=1)
+    valid &= _version_mask(uuids, puuid_cls._version)
+    uuids[~valid] = 0
+    return ParseResult(uuids=uuids, invalid=np.flatnonzero(~valid))
+
+
+def _as_uuid_matrix(uuids: NDArray[np.uint8] | NDArray[np.void]) -> NDArray[np.uint8]:
+    array = np.ascontiguousarray(uuids)
+    if array.dtype.itemsize == _UUID_BYTES:
+        return array.view(np.uint8).reshape(-1, _UUID_BYTES)
+    return array.reshape(-1, _UUID_BYTES).astype(np.uint8, copy=False)
+
+
+def format_strings(
+    uuids: NDArray[np.uint8] | NDArray[np.void],
+    puuid_cls: type[PUUIDBase[str]],
+) -> NDArray[np.str_]:
+    """
+    Format raw UUID values as serialized pUUIDs in vectorized passes.
+
+    Parameters
+    ----------
+    uuids : NDArray[np.uint8] | NDArray[np.void]
+        Raw big-endian UUID values, either as `(N, 16)` uint8 array or as array of
+        16-byte items (e.g., `V16` or a structured dtype).
+    puuid_cls : type[PUUIDBase[str]]
+        The pUUID class (e.g., `PUUIDv7[Literal["user"]]`) providing the prefix.
+
+    Returns
+    -------
+    NDArray[np.str_]
+        The formatted strings (e.g., `<prefix>_<uuid-hex-string>`).
+
+    Raises
+    ------
+    PUUIDError
+        If the class does not use the canonical codec.
+    """
+    head = _head_units(_serial_head(puuid_cls, "format_strings"), "U")
+    matrix = _as_uuid_matrix(uuids)
+    length = len(head) + _UUID_LENGTH
+
+    units = np.empty((len(matrix), length), dtype=np.uint32)
+    units[:, : len(head)] = head
+    body = units[:, len(head) :]
+    body[:, _DASH_POSITIONS] = ord("-")
+    nibbles = np.stack((matrix >> 4, matrix & 0x0F), axis=-1).reshape(-1, 32)
+    digits = _HEX_DIGITS[nibbles]
+    for (start, stop), offset in zip(_HEX_GROUPS, _DIGIT_OFFSETS):
+        body[:, start:stop] = digits[:, offset : offset + stop - start]
+    return units.view(np.dtype((np.str_, length))).ravel()
+
+
+def _big_endian(matrix: NDArray[np.uint8], start: int, stop: int) -> NDArray[np.int64]:
+    """Combine the byte columns `[start, stop)` into big-endian integers."""
+    value = np.zeros(len(matrix), dtype=np.int64)
+    for column in range(start, stop):
+        value = (value << 8) | matrix[:, column]
+    return value
+
+
+def _v1_datetimes(matrix: NDArray[np.uint8]) -> NDArray[np.datetime64]:
+    tick = (
+        (_big_endian(matrix, 6, 8) & 0x0FFF) << 48
+        | _big_endian(matrix, 4, 6) << 32
+        | _big_endian(matrix, 0, 4)
+    )
+    return ((tick - _GREGORIAN_OFFSET) // 10).view("datetime64[us]")
+
+
+def _v6_datetimes(matrix: NDArray[np.uint8]) -> NDArray[np.datetime64]:
+    tick = _big_endian(matrix, 0, 6) << 12 | _big_endian(matrix, 6, 8) & 0x0FFF
+    return ((tick - _GREGORIAN_OFFSET) // 10).view("datetime64[us]")
+
+
+def _v7_datetimes(matrix: NDArray[np.uint8]) -> NDArray[np.datetime64]:
+    return _big_endian(matrix, 0, 6).view("datetime64[ms]")
+
+
+_DATETIME_EXTRACTORS = {1: _v1_datetimes, 6: _v6_datetimes, 7: _v7_datetimes}
+
+
+def extract_datetimes(
+    uuids: NDArray[np.uint8] | NDArray[np.void],
+    puuid_cls: type[PUUIDBase[str]],
+) -> NDArray[np.datetime64]:
+    """
+    Extract the embedded creation times of raw UUID values in vectorized passes.
+
+    The vectorized counterpart of the `datetime` property, e.g., applied to the
+    `uuids` of `parse_strings`. The result has the same resolution: `datetime64[ms]`
+    for PUUIDv7 and `datetime64[us]` for PUUIDv1 and PUUIDv6, both in UTC.
+
+    Parameters
+    ----------
+    uuids : NDArray[np.uint8] | NDArray[np.void]
+        Raw big-endian UUID values, either as `(N, 16)` uint8 array or as array of
+        16-byte items (e.g., `V16` or a structured dtype).
+    puuid_cls : type[PUUIDBase[str]]
+        The time-based pUUID class (e.g., `PUUIDv7[Literal["event"]]`) of the IDs.
+
+    Returns
+    -------
+    NDArray[np.datetime64]
+        The creation times.
+
+    Raises
+    ------
+    PUUIDError
+        If the class is not a PUUIDv1, PUUIDv6 or PUUIDv7 class.
+    """
+    extractor = _DATETIME_EXTRACTORS.get(puuid_cls._version or 0)
+    if extractor is None:
+        raise PUUIDError(
+            ERR_MSG.TIMESTAMP_UNSUPPORTED.format(
+                function="extract_datetimes", classname=puuid_cls.__name__
+            )
+        )
+    return extractor(_as_uuid_matrix(uuids))
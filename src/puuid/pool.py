@@ -0,0 +1,261 @@
+"""
+pUUID Pools.
+
+Provides pre-filled pools handing out pUUIDs without generating them on the
+request path.
+"""
+
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from types import TracebackType
+from typing import Self, override
+
+from puuid.base import ERR_MSG, PUUIDBase, PUUIDError, _check_batch_size
+
+_NS_PER_MS = 1_000_000
+# UUIDv7 stores its millisecond timestamp in the 48 most significant bits
+_V7_TIMESTAMP_SHIFT = 80
+
+
+class PUUIDPool[T: PUUIDBase[str]]:
+    """
+    Pool of pre-generated pUUIDs with a background refill.
+
+    `take` and `take_many` pop from a buffer in O(1) per item. Whenever the buffer
+    drops below `low_watermark`, a daemon thread tops it up to `size` with a single
+    `factory_many` batch, so entropy reads and clock handling happen off the
+    request path. If the buffer runs dry, the missing IDs are generated inline.
+
+    For `PUUIDv7` classes, IDs older than `max_age` seconds are discarded instead
+    of being handed out, which bounds how far the pool can skew the ordering.
+
+    After `fork()` the child process discards the inherited buffer and starts its
+    own refill thread on first use. The refill thread only holds a weak reference
+    to the pool and stops with `close()` or once the pool is garbage collected.
+
+    Parameters
+    ----------
+    puuid_cls : type[T]
+        The pUUID class to generate, must support `factory_many` (v1, v4, v6, v7
+        and v8).
+    size : int, optional
+        Number of IDs held after a refill.
+    low_watermark : int | None, optional
+        Buffer length below which a refill is triggered, defaults to `size // 4`.
+    max_age : float, optional
+        Maximum age in seconds of handed out `PUUIDv7` IDs.
+
+    Raises
+    ------
+    PUUIDError
+        If `puuid_cls` does not support `factory_many` or the sizes are invalid.
+    """
+
+    def __init__(
+        self,
+        puuid_cls: type[T],
+        size: int = 1024,
+        low_watermark: int | None = None,
+        *,
+        max_age: float = 1.0,
+    ) -> None:
+        low = size // 4 if low_watermark is None else low_watermark
+        if size <= 0 or not 0 <= low < size:
+            raise PUUIDError(
+                ERR_MSG.INVALID_POOL_SIZE.format(size=size, low_watermark=low)
+            )
+        _ = puuid_cls.factory_many(0)  # raises for classes without bulk generation
+        self._puuid_cls = puuid_cls
+        self._size = size
+        self._low_watermark = low
+        self._max_age_ms = max_age * 1000 if puuid_cls._version == 7 else None
+        self._closed = False
+        self._reset()
+        self._refill()
+        _POOLS.add(self)
+
+    def _reset(self) -> None:
+        """Start with an empty buffer, fresh locks and no refill thread."""
+        self._buffer: deque[T] = deque()
+        self._lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._refill_needed = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    @property
+    def puuid_cls(self) -> type[T]:
+        """
+        Return the pUUID class of the pool.
+
+        Returns
+        -------
+        type[T]
+            The pUUID class.
+        """
+        return self._puuid_cls
+
+    def _refill(self) -> None:
+        """Top the buffer up to `size` with a single batch."""
+        with self._refill_lock:
+            missing = self._size - len(self._buffer)
+            if missing > 0:
+                batch = self._puuid_cls.factory_many(missing)
+                with self._lock:
+                    # `close` may have run while the batch was generated
+                    if not self._closed:
+                        self._buffer.extend(batch)
+
+    def _ensure_worker(self) -> None:
+        if self._closed:
+            raise PUUIDError(
+                ERR_MSG.POOL_CLOSED.format(
+                    classname=type(self).__name__,
+                    puuid_cls=self._puuid_cls.__name__,
+                )
+            )
+        if self._worker is None:
+            refill_needed = self._refill_needed
+            self._worker = threading.Thread(
+                target=_run_refills,
+                args=(weakref.ref(self), refill_needed),
+                name=f"{type(self).__name__}-{self._puuid_cls.__name__}",
+                daemon=True,
+            )
+            self._worker.start()
+            # wake the refill thread to stop once the pool is collected
+            _ = weakref.finalize(self, refill_needed.set)
+
+    def _discard_stale(self) -> None:
+        if self._max_age_ms is None:
+            return
+        oldest_ms = time.time_ns() / _NS_PER_MS - self._max_age_ms
+        buffer = self._buffer
+        while buffer and buffer[0]._int >> _V7_TIMESTAMP_SHIFT < oldest_ms:
+            _ = buffer.popleft()
+
+    def _pop(self, n: int) -> list[T]:
+        buffer = self._buffer
+        with self._lock:
+            self._discard_stale()
+            taken = [buffer.popleft() for _ in range(min(n, len(buffer)))]
+        if len(buffer) < self._low_watermark:
+            self._refill_needed.set()
+        return taken
+
+    def _complete(self, taken: list[T], n: int) -> list[T]:
+        """Fill `taken` up to `n` IDs, generating the missing ones inline."""
+        # refills generate and add their batch under this lock, so a batch in
+        # progress is handed out first and inline IDs are newer than all buffered
+        with self._refill_lock:
+            taken.extend(self._pop(n - len(taken)))
+            taken.extend(self._puuid_cls.factory_many(n - len(taken)))
+        return taken
+
+    def take(self) -> T:
+        """
+        Take a single pUUID from the pool.
+
+        Returns
+        -------
+        T
+            A pUUID that has not been handed out before.
+
+        Raises
+        ------
+        PUUIDError
+            If the pool is closed.
+        """
+        self._ensure_worker()
+        buffer = self._buffer
+        with self._lock:
+            self._discard_stale()
+            item = buffer.popleft() if buffer else None
+        if len(buffer) < self._low_watermark:
+            self._refill_needed.set()
+        return self._complete([], 1)[0] if item is None else item
+
+    def take_many(self, n: int) -> list[T]:
+        """
+        Take `n` pUUIDs from the pool.
+
+        Parameters
+        ----------
+        n : int
+            Number of pUUIDs to take. IDs missing in the buffer are generated
+            inline.
+
+        Returns
+        -------
+        list[T]
+            The pUUIDs in generation order.
+
+        Raises
+        ------
+        PUUIDError
+            If the pool is closed or `n` is negative.
+        """
+        _check_batch_size(n)
+        self._ensure_worker()
+        taken = self._pop(n)
+        if len(taken) < n:
+            return self._complete(taken, n)
+        return taken
+
+    def close(self) -> None:
+        """Stop the refill thread and discard the buffered pUUIDs."""
+        with self._lock:
+            self._closed = True
+            self._buffer.clear()
+        self._refill_needed.set()
+        if self._worker is not None:
+            self._worker.join()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}({self._puuid_cls.__name__}, "
+            f"size={self._size}, low_watermark={self._low_watermark})"
+        )
+
+
+_POOLS: weakref.WeakSet[PUUIDPool[PUUIDBase[str]]] = weakref.WeakSet()
+
+
+def _run_refills[T: PUUIDBase[str]](
+    pool_ref: weakref.ref[PUUIDPool[T]], refill_needed: threading.Event
+) -> None:
+    """Refill loop of the worker, holding the pool only while refilling."""
+    while True:
+        _ = refill_needed.wait()
+        refill_needed.clear()
+        pool = pool_ref()
+        if pool is None or pool._closed:
+            return
+        pool._refill()
+        del pool
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in _POOLS:
+        pool._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
@@ -1,12 +1,110 @@
-from typing import final, override
+import datetime as dt
+from typing import cast, final, override
+from uuid import UUID
 
 from sqlalchemy.engine.interfaces import Dialect
-from sqlalchemy.types import String, TypeDecorator
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.types import LargeBinary, String, TypeDecorator, TypeEngine, Uuid
 
-from puuid.base import PUUIDBase
+from puuid.base import ERR_MSG, PUUIDBase, PUUIDError, PUUIDv6, PUUIDv7
 
-_SEPARATOR_LENGTH = 1
-_UUID_LENGTH = 36
+_UUID_BYTES = 16
+
+
+class SqlPUUIDComparator[TPrefix: str](TypeDecorator.Comparator[PUUIDBase[TPrefix]]):
+    """
+    Column operators of `SqlPUUID` columns.
+
+    The creation time filters of `PUUIDv6` and `PUUIDv7` columns compare the column
+    with the boundary IDs of `min_for` and `max_for`. Both the prefixed strings
+    and the raw bytes sort like the IDs, so the filters become range scans on the
+    column's index (e.g., the primary key) instead of requiring a separate
+    timestamp column. String columns need a collation that orders the symbols of
+    the codec like ASCII, e.g., `"C"` for the case-sensitive base58 and base62
+    codecs.
+    """
+
+    __slots__ = ()
+
+    def _time_ordered_cls(self, function: str) -> type[PUUIDv6[str] | PUUIDv7[str]]:
+        puuid_cls = cast(SqlPUUID[TPrefix], self.type).puuid_cls
+        if not issubclass(puuid_cls, (PUUIDv6, PUUIDv7)):
+            raise PUUIDError(
+                ERR_MSG.TIME_RANGE_UNSUPPORTED.format(
+                    function=function, classname=puuid_cls.__name__
+                )
+            )
+        return puuid_cls
+
+    def created_between(
+        self, start: dt.datetime, end: dt.datetime
+    ) -> ColumnElement[bool]:
+        """
+        Filter IDs created from `start` to `end`, both inclusive.
+
+        Parameters
+        ----------
+        start : datetime.datetime
+            The earliest creation time.
+        end : datetime.datetime
+            The latest creation time.
+
+        Returns
+        -------
+        ColumnElement[bool]
+            A `BETWEEN` expression on the stored representation.
+
+        Raises
+        ------
+        PUUIDError
+            If the column does not hold `PUUIDv6` or `PUUIDv7` IDs.
+        """
+        puuid_cls = self._time_ordered_cls("created_between")
+        return self.expr.between(puuid_cls.min_for(start), puuid_cls.max_for(end))
+
+    def created_after(self, instant: dt.datetime) -> ColumnElement[bool]:
+        """
+        Filter IDs created after `instant`, at the resolution of the ID.
+
+        Parameters
+        ----------
+        instant : datetime.datetime
+            The creation time to exclude IDs up to.
+
+        Returns
+        -------
+        ColumnElement[bool]
+            A `>` expression on the stored representation.
+
+        Raises
+        ------
+        PUUIDError
+            If the column does not hold `PUUIDv6` or `PUUIDv7` IDs.
+        """
+        puuid_cls = self._time_ordered_cls("created_after")
+        return self.expr > puuid_cls.max_for(instant)
+
+    def created_before(self, instant: dt.datetime) -> ColumnElement[bool]:
+        """
+        Filter IDs created before `instant`, at the resolution of the ID.
+
+        Parameters
+        ----------
+        instant : datetime.datetime
+            The creation time to exclude IDs from.
+
+        Returns
+        -------
+        ColumnElement[bool]
+            A `<` expression on the stored representation.
+
+        Raises
+        ------
+        PUUIDError
+            If the column does not hold `PUUIDv6` or `PUUIDv7` IDs.
+        """
+        puuid_cls = self._time_ordered_cls("created_before")
+        return self.expr < puuid_cls.min_for(instant)
 
 
 @final
@@ -15,15 +113,34 @@ class SqlPUUID[TPrefix: str](TypeDecorator[PUUIDBase[TPrefix]]):
     SQLAlchemy type for storing Prefixed UUIDs.
 
     Maps a `PUUID` instance to a `VARCHAR` column in the database and
-    reconstructs the specific `PUUID` subclass on retrieval.
+    reconstructs the specific `PUUID` subclass on retrieval. The column length
+    follows the codec of the pUUID class.
+
+    With `binary=True` only the 16 raw UUID bytes are stored, using the native
+    `UUID` type of dialects that have one (e.g. PostgreSQL) and `LargeBinary(16)`
+    otherwise. The prefix is implied by the column's pUUID class.
+
+    Columns of `PUUIDv6` and `PUUIDv7` classes can be filtered by creation time,
+    e.g., `UserORM.id.created_between(start, end)` (see `SqlPUUIDComparator`).
+
+    With `trusted=True` loaded values are not validated again, for columns only
+    written through this type (see `PUUIDBase.from_string`).
     """
 
     impl = String
     cache_ok = True
+    comparator_factory = SqlPUUIDComparator
 
     puuid_cls: type[PUUIDBase[TPrefix]]
+    binary: bool
+    trusted: bool
 
-    def __init__(self, puuid_cls: type[PUUIDBase[TPrefix]]) -> None:
+    def __init__(
+        self,
+        puuid_cls: type[PUUIDBase[TPrefix]],
+        binary: bool = False,
+        trusted: bool = False,
+    ) -> None:
         """
         Initialize the SqlPUUID type.
 
@@ -32,23 +149,52 @@ class SqlPUUID[TPrefix: str](TypeDecorator[PUUIDBase[TPrefix]]):
         puuid_cls : type[PUUIDBase[TPrefix]]
             The pUUID class (e.g., `PUUIDv4[Literal["user"]]`) to associate with this
             column.
+        binary : bool, optional
+            Store the 16 raw UUID bytes instead of the prefixed string. Changing this
+            for an existing column requires a migration.
+        trusted : bool, optional
+            Skip the version check of the UUID when loading values. Only enable it
+            for columns exclusively written by `SqlPUUID` of the same pUUID class.
         """
         self.puuid_cls = puuid_cls
-        varchar_length = len(puuid_cls.prefix()) + _SEPARATOR_LENGTH + _UUID_LENGTH
+        self.binary = binary
+        self.trusted = trusted
+        # fits the legacy canonical form too if the class still accepts it
+        _, varchar_length = puuid_cls._serial_length_range()
         super().__init__(length=varchar_length)
 
+    @override
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[object]:
+        if not self.binary:
+            return self.impl_instance
+        if dialect.supports_native_uuid:
+            return dialect.type_descriptor(Uuid(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(_UUID_BYTES))
+
     @override
     def process_bind_param(
         self, value: PUUIDBase[TPrefix] | None, dialect: Dialect
-    ) -> str | None:
+    ) -> str | bytes | UUID | None:
         if value is None:
             return None
-        return value.to_string()
+        if not self.binary:
+            return value.to_string()
+        if dialect.supports_native_uuid:
+            return value.uuid
+        return value.to_bytes()
 
     @override
     def process_result_value(
-        self, value: str | None, dialect: Dialect
+        self, value: str | bytes | UUID | None, dialect: Dialect
     ) -> PUUIDBase[TPrefix] | None:
         if value is None:
             return None
-        return self.puuid_cls.from_string(value)
+        if isinstance(value, str):
+            return self.puuid_cls.from_string(value, trusted=self.trusted)
+        if self.trusted:
+            if isinstance(value, UUID):
+                return self.puuid_cls._from_uuid(value)
+            return self.puuid_cls._from_int(int.from_bytes(value))
+        if isinstance(value, UUID):
+            return self.puuid_cls(uuid=value)
+        return self.puuid_cls.from_bytes(value)
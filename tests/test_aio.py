@@ -0,0 +1,103 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDError, PUUIDv4, PUUIDv5, PUUIDv7
+from puuid.aio import AsyncPUUIDSource
+
+UserUUID = PUUIDv4[Literal["user"]]
+EventUUID = PUUIDv7[Literal["event"]]
+
+
+async def _next_many(source: AsyncPUUIDSource[UserUUID], n: int) -> list[UserUUID]:
+    return [await source.next() for _ in range(n)]
+
+
+async def _iterate(source: AsyncPUUIDSource[EventUUID], n: int) -> list[EventUUID]:
+    ids: list[EventUUID] = []
+    async for puuid in source:
+        ids.append(puuid)
+        if len(ids) == n:
+            break
+    return ids
+
+
+def test_next() -> None:
+    source = AsyncPUUIDSource(UserUUID, batch_size=16)
+    ids = asyncio.run(_next_many(source, 100))
+
+    assert all(type(puuid) is UserUUID for puuid in ids)
+    assert len(set(ids)) == 100
+    assert source.puuid_cls is UserUUID
+
+
+async def _next_then_reserve(
+    source: AsyncPUUIDSource[UserUUID], n: int
+) -> list[UserUUID]:
+    return [await source.next(), *await source.reserve(n)]
+
+
+def test_reserve() -> None:
+    source = AsyncPUUIDSource(UserUUID, batch_size=16)
+    ids = asyncio.run(_next_then_reserve(source, 50))
+
+    assert len(set(ids)) == 51
+    assert asyncio.run(source.reserve(0)) == []
+
+
+def test_async_iteration_is_ordered_for_v7() -> None:
+    source = AsyncPUUIDSource(EventUUID, batch_size=8)
+    ids = asyncio.run(_iterate(source, 40))
+
+    assert ids == sorted(ids, key=lambda puuid: puuid.uuid)
+
+
+async def _consume_concurrently(
+    source: AsyncPUUIDSource[UserUUID],
+) -> list[list[UserUUID]]:
+    return await asyncio.gather(*(_next_many(source, 50) for _ in range(4)))
+
+
+def test_concurrent_consumers() -> None:
+    source = AsyncPUUIDSource(UserUUID, batch_size=8)
+    results = asyncio.run(_consume_concurrently(source))
+
+    assert len({puuid for ids in results for puuid in ids}) == 200
+
+
+async def _generate_limited(n: int) -> list[UserUUID]:
+    limit = asyncio.Semaphore(1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async with AsyncPUUIDSource(
+            UserUUID, batch_size=4, limit=limit, executor=executor
+        ) as source:
+            return await _next_many(source, n)
+
+
+def test_limit_and_executor() -> None:
+    assert len(set(asyncio.run(_generate_limited(20)))) == 20
+
+
+async def _buffered_after_pause(source: AsyncPUUIDSource[UserUUID]) -> int:
+    _ = await _next_many(source, 5)
+    await asyncio.sleep(0.1)
+    return len(source._buffer)
+
+
+def test_prefetch_runs_in_background() -> None:
+    source = AsyncPUUIDSource(UserUUID, batch_size=8)
+
+    assert asyncio.run(_buffered_after_pause(source)) == 3 + 8
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_invalid_batch_size(batch_size: int) -> None:
+    with pytest.raises(PUUIDError):
+        _ = AsyncPUUIDSource(UserUUID, batch_size=batch_size)
+
+
+def test_reject_class_without_bulk_generation() -> None:
+    with pytest.raises(PUUIDError):
+        _ = AsyncPUUIDSource(PUUIDv5[Literal["user"]])
@@ -0,0 +1,127 @@
+from array import array
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDBase, PUUIDError, PUUIDv4, PUUIDv7, register_puuid
+from puuid.base import ERR_MSG
+
+UserUUID = PUUIDv4[Literal["user"]]
+EventUUID = PUUIDv7[Literal["evt"]]
+AccountV4UUID = PUUIDv4[Literal["account"]]
+AccountV7UUID = PUUIDv7[Literal["account"]]
+LongUUID = PUUIDv4[Literal["x" * 256]]
+
+
+@register_puuid
+class TeamUUID(PUUIDv7[Literal["team"]]): ...
+
+
+def test_raw_round_trip() -> None:
+    user_id = UserUUID.factory()
+    raw = user_id.to_bytes()
+
+    assert raw == user_id.uuid.bytes
+    assert UserUUID.from_bytes(raw) == user_id
+    assert UserUUID.from_bytes(bytearray(raw)) == user_id
+
+
+def test_from_bytes_reads_memoryview_at_offset() -> None:
+    ids = UserUUID.factory_many(3)
+    buffer = memoryview(b"".join(user_id.to_bytes() for user_id in ids))
+
+    assert [UserUUID.from_bytes(buffer, 16 * i) for i in range(3)] == ids
+
+
+def test_from_bytes_casts_non_byte_views() -> None:
+    user_id = UserUUID.factory()
+    words = array("Q", user_id.to_bytes())
+
+    assert UserUUID.from_bytes(memoryview(words)) == user_id
+
+
+@pytest.mark.parametrize("offset", [-1, 1, 17])
+def test_from_bytes_too_short(offset: int) -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = UserUUID.from_bytes(UserUUID.factory().to_bytes(), offset)
+    assert err.value.message == ERR_MSG.BYTES_TOO_SHORT.format(
+        needed=16, offset=offset, length=16
+    )
+
+
+def test_from_bytes_version_mismatch() -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = UserUUID.from_bytes(EventUUID.factory().to_bytes())
+    assert err.value.message == ERR_MSG.BYTES_VERSION_MISMATCH.format(
+        offset=0, version=4, classname=UserUUID.__name__
+    )
+
+
+def test_tagged_round_trip() -> None:
+    event_id = EventUUID.factory()
+    tagged = event_id.to_bytes(tagged=True)
+
+    assert tagged == b"\x03evt" + event_id.to_bytes()
+    assert PUUIDBase.unpack_tagged(tagged) == (event_id, len(tagged))
+    assert EventUUID.unpack_tagged(tagged)[0] == event_id
+
+
+def test_unpack_consecutive_tagged_ids() -> None:
+    ids = [UserUUID.factory(), EventUUID.factory(), TeamUUID.factory()]
+    buffer = memoryview(b"".join(puuid.to_bytes(tagged=True) for puuid in ids))
+
+    offset = 0
+    unpacked: list[PUUIDBase[str]] = []
+    while offset < len(buffer):
+        puuid, offset = PUUIDBase.unpack_tagged(buffer, offset)
+        unpacked.append(puuid)
+
+    assert unpacked == ids
+    assert type(unpacked[2]) is TeamUUID
+
+
+def test_unpack_tagged_selects_version() -> None:
+    v4_id, v7_id = AccountV4UUID.factory(), AccountV7UUID.factory()
+
+    assert type(PUUIDBase.unpack_tagged(v4_id.to_bytes(tagged=True))[0]) is (
+        AccountV4UUID
+    )
+    assert type(PUUIDBase.unpack_tagged(v7_id.to_bytes(tagged=True))[0]) is (
+        AccountV7UUID
+    )
+
+
+def test_unpack_tagged_restricted_to_subclasses() -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = PUUIDv4.unpack_tagged(EventUUID.factory().to_bytes(tagged=True))
+    assert err.value.message == ERR_MSG.TAGGED_CLASS_MISMATCH.format(
+        prefix="evt", registered=EventUUID.__name__, classname="PUUIDv4"
+    )
+
+
+def test_unpack_tagged_unknown_prefix() -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = PUUIDBase.unpack_tagged(b"\x07unknown" + UserUUID.factory().to_bytes())
+    assert err.value.message == ERR_MSG.UNKNOWN_BYTES_TAG.format(
+        version=4, prefix="unknown"
+    )
+
+
+@pytest.mark.parametrize("data", [b"", b"\x04user", b"\x04user" + bytes(15)])
+def test_unpack_tagged_too_short(data: bytes) -> None:
+    with pytest.raises(PUUIDError):
+        _ = PUUIDBase.unpack_tagged(data)
+
+
+def test_unpack_tagged_invalid_utf8() -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = PUUIDBase.unpack_tagged(b"\x01\xff" + UserUUID.factory().to_bytes())
+    assert err.value.message == ERR_MSG.INVALID_BYTES_TAG.format(offset=0)
+
+
+def test_prefix_too_long_for_tag() -> None:
+    long_id = LongUUID.factory()
+
+    assert LongUUID.from_bytes(long_id.to_bytes()) == long_id
+    with pytest.raises(PUUIDError):
+        _ = long_id.to_bytes(tagged=True)
@@ -0,0 +1,125 @@
+import threading
+from collections.abc import Generator
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDBase, PUUIDError, PUUIDv4, PUUIDv7
+from puuid.cache import CacheInfo
+
+TenantUUID = PUUIDv7[Literal["tenant"]]
+ProductUUID = PUUIDv4[Literal["product"]]
+
+
+class PremiumTenantUUID(TenantUUID): ...
+
+
+@pytest.fixture(autouse=True)
+def disable_caches() -> Generator[None, None, None]:
+    yield
+    for puuid_cls in (TenantUUID, ProductUUID, PremiumTenantUUID):
+        puuid_cls.disable_cache()
+
+
+def test_cache_disabled_by_default() -> None:
+    serial = TenantUUID.factory().to_string()
+
+    assert TenantUUID.cache_info() is None
+    assert TenantUUID.from_string(serial) is not TenantUUID.from_string(serial)
+
+
+def test_repeated_strings_share_instances() -> None:
+    TenantUUID.enable_cache(maxsize=8)
+    serial = TenantUUID.factory().to_string()
+
+    first = TenantUUID.from_string(serial)
+
+    assert TenantUUID.from_string(serial) is first
+    assert TenantUUID.cache_info() == CacheInfo(hits=1, misses=1, maxsize=8, currsize=1)
+
+
+def test_least_recently_used_is_evicted() -> None:
+    TenantUUID.enable_cache(maxsize=2)
+    a, b, c = (tenant_id.to_string() for tenant_id in TenantUUID.factory_many(3))
+    cached_a = TenantUUID.from_string(a)
+    _ = TenantUUID.from_string(b)
+    _ = TenantUUID.from_string(a)  # b is now the least recently used
+    _ = TenantUUID.from_string(c)
+
+    assert TenantUUID.from_string(a) is cached_a
+    assert TenantUUID.cache_info() == CacheInfo(hits=2, misses=3, maxsize=2, currsize=2)
+
+
+def test_resize_at_runtime() -> None:
+    TenantUUID.enable_cache(maxsize=4)
+    for tenant_id in TenantUUID.factory_many(4):
+        _ = TenantUUID.from_string(tenant_id.to_string())
+
+    TenantUUID.enable_cache(maxsize=1)
+    info = TenantUUID.cache_info()
+
+    assert info is not None and (info.maxsize, info.currsize) == (1, 1)
+
+
+def test_cache_clear() -> None:
+    TenantUUID.enable_cache()
+    _ = TenantUUID.from_string(TenantUUID.factory().to_string())
+
+    TenantUUID.cache_clear()
+
+    assert TenantUUID.cache_info() == CacheInfo(0, 0, 1024, 0)
+
+
+def test_caches_are_per_class() -> None:
+    TenantUUID.enable_cache()
+
+    assert PremiumTenantUUID.cache_info() is None
+    assert ProductUUID.cache_info() is None
+
+
+def test_parse_errors_are_not_cached() -> None:
+    TenantUUID.enable_cache()
+
+    for _ in range(2):
+        with pytest.raises(PUUIDError):
+            _ = TenantUUID.from_string("tenant_invalid")
+
+    assert TenantUUID.cache_info() == CacheInfo(0, 2, 1024, 0)
+
+
+def test_parse_any_uses_cache() -> None:
+    ProductUUID.enable_cache()
+    serial = ProductUUID.factory().to_string()
+
+    assert PUUIDBase.parse_any(serial) is ProductUUID.from_string(serial)
+
+
+@pytest.mark.parametrize("maxsize", [0, -1, True, 1.5])
+def test_invalid_cache_size(maxsize: int) -> None:
+    with pytest.raises(PUUIDError):
+        TenantUUID.enable_cache(maxsize)
+
+
+def _parse_repeatedly(serials: list[str], results: list[TenantUUID]) -> None:
+    for _ in range(50):
+        results.extend(TenantUUID.from_string(serial) for serial in serials)
+
+
+def test_thread_safety() -> None:
+    TenantUUID.enable_cache(maxsize=16)
+    serials = [tenant_id.to_string() for tenant_id in TenantUUID.factory_many(32)]
+    results: list[TenantUUID] = []
+    threads = [
+        threading.Thread(target=_parse_repeatedly, args=(serials, results))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = TenantUUID.cache_info()
+    assert info is not None
+    assert info.hits + info.misses == len(results) == 4 * 50 * 32
+    assert info.currsize == 16
+    assert {result.to_string() for result in results} == set(serials)
@@ -0,0 +1,168 @@
+from typing import Literal, override
+from uuid import UUID
+
+import pytest
+
+from puuid import PUUIDBase, PUUIDError, PUUIDv4, PUUIDv7, register_puuid
+from puuid.codec import CANONICAL, CODECS, CodecName, PUUIDCodec
+
+_MAX_UUID = (1 << 128) - 1
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_BASE58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE62 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+class TokenUUID(PUUIDv7[Literal["tok"]], codec="base62"): ...
+
+
+class ChildTokenUUID(TokenUUID): ...
+
+
+class LegacyTokenUUID(
+    PUUIDv7[Literal["ltok"]], codec="base32", accept_canonical=True
+): ...
+
+
+@register_puuid
+class ShortUUID(PUUIDv4[Literal["short"]], codec="base58"): ...
+
+
+@register_puuid
+class ShortV7UUID(PUUIDv7[Literal["short"]], codec="base58"): ...
+
+
+def _reference_encode(value: int, alphabet: str, length: int) -> str:
+    digits: list[str] = []
+    for _ in range(length):
+        value, digit = divmod(value, len(alphabet))
+        digits.append(alphabet[digit])
+    return "".join(reversed(digits))
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+@pytest.mark.parametrize("value", [0, 1, 0xABCD << 64, _MAX_UUID])
+def test_round_trip(name: CodecName, value: int) -> None:
+    codec = CODECS[name]
+    body = codec.encode(value)
+
+    assert len(body) == codec.length
+    assert codec.decode(body) == value
+
+
+@pytest.mark.parametrize("name", list(CODECS))
+def test_encoding_preserves_order(name: CodecName) -> None:
+    ids = TokenUUID.factory_many(200)
+    bodies = [CODECS[name].encode(token_id.uuid.int) for token_id in ids]
+
+    assert bodies == sorted(bodies)
+
+
+def test_reference_encodings() -> None:
+    value = UUID("1a3e0e89-a2d8-7950-bafa-24020e09b2a5").int
+
+    assert CANONICAL.encode(value) == "1a3e0e89-a2d8-7950-bafa-24020e09b2a5"
+    assert CODECS["hex"].encode(value) == "1a3e0e89a2d87950bafa24020e09b2a5"
+    assert CODECS["base32"].encode(value) == _reference_encode(value, _CROCKFORD, 26)
+    assert CODECS["base58"].encode(value) == _reference_encode(value, _BASE58, 22)
+    assert CODECS["base62"].encode(value) == _reference_encode(value, _BASE62, 22)
+
+
+def test_base32_is_case_insensitive_with_aliases() -> None:
+    codec = CODECS["base32"]
+    body = codec.encode(0x0123_4567_89AB_CDEF << 64)
+
+    assert codec.decode(body.lower()) == codec.decode(body)
+    assert codec.decode("O" * 25 + "I") == codec.decode("0" * 25 + "1") == 1
+    assert codec.decode("o" * 25 + "l") == 1
+
+
+@pytest.mark.parametrize("name", ["hex", "base32", "base58", "base62"])
+@pytest.mark.parametrize("body", ["", "_", "~" * 22, "~" * 26, "-" * 32])
+def test_decode_rejects_malformed_bodies(name: CodecName, body: str) -> None:
+    with pytest.raises(ValueError):
+        _ = CODECS[name].decode(body)
+
+
+@pytest.mark.parametrize(
+    "name, last_symbol", [("base32", "Z"), ("base58", "z"), ("base62", "z")]
+)
+def test_decode_rejects_overflow(name: CodecName, last_symbol: str) -> None:
+    codec = CODECS[name]
+    with pytest.raises(ValueError):
+        _ = codec.decode(last_symbol * codec.length)
+
+
+def test_class_codec() -> None:
+    token_id = TokenUUID.factory()
+    serial = token_id.to_string()
+
+    assert TokenUUID.codec() is CODECS["base62"]
+    assert len(serial) == len("tok_") + 22
+    assert TokenUUID.from_string(serial) == token_id
+    assert str(token_id) == serial
+
+
+def test_codec_is_inherited() -> None:
+    assert ChildTokenUUID.codec() is TokenUUID.codec()
+    assert PUUIDv7[Literal["tok"]].codec() is CANONICAL
+
+
+def test_compact_codec_rejects_canonical_input() -> None:
+    canonical = f"tok_{TokenUUID.factory().uuid}"
+
+    with pytest.raises(PUUIDError):
+        _ = TokenUUID.from_string(canonical)
+
+
+def test_accept_canonical_during_migration() -> None:
+    token_id = LegacyTokenUUID.factory()
+
+    assert LegacyTokenUUID.from_string(f"ltok_{token_id.uuid}") == token_id
+    assert LegacyTokenUUID.from_string(token_id.to_string()) == token_id
+    assert len(token_id.to_string()) == len("ltok_") + 26
+
+
+def test_version_mismatch_in_compact_codec() -> None:
+    serial = f"tok_{CODECS['base62'].encode(PUUIDv4[Literal['tok']]().uuid.int)}"
+
+    with pytest.raises(PUUIDError):
+        _ = TokenUUID.from_string(serial)
+
+
+def test_parse_any_selects_version_by_codec() -> None:
+    v4_id, v7_id = ShortUUID.factory(), ShortV7UUID.factory()
+
+    assert type(PUUIDBase.parse_any(v4_id.to_string())) is ShortUUID
+    assert type(PUUIDBase.parse_any(v7_id.to_string())) is ShortV7UUID
+
+
+class _ReversedHexCodec(PUUIDCodec):
+    name = "reversed-hex"
+    length = 32
+
+    @override
+    def encode(self, value: int) -> str:
+        return f"{value:032x}"[::-1]
+
+    @override
+    def decode(self, body: str) -> int:
+        return CODECS["hex"].decode(body[::-1])
+
+    @override
+    def pattern(self, version: int | None) -> str:
+        return "[0-9a-f]{32}"
+
+
+class ReversedUUID(PUUIDv4[Literal["rev"]], codec=_ReversedHexCodec()): ...
+
+
+def test_custom_codec() -> None:
+    rev_id = ReversedUUID.factory()
+
+    assert rev_id.to_string() == f"rev_{rev_id.uuid.hex[::-1]}"
+    assert ReversedUUID.from_string(rev_id.to_string()) == rev_id
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(PUUIDError):
+        _ = type("UnknownUUID", (PUUIDv4[Literal["tok"]],), {}, codec="base64")
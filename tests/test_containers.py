@@ -0,0 +1,283 @@
+from typing import Literal
+from uuid import uuid4
+
+import pytest
+
+from puuid import PUUIDError, PUUIDv4, PUUIDv7
+from puuid.base import ERR_MSG
+from puuid.containers import PUUIDArray, PUUIDDict, PUUIDSet
+
+UserUUID = PUUIDv7[Literal["user"]]
+OrgUUID = PUUIDv7[Literal["org"]]
+
+################################################################################
+#### PUUIDArray
+################################################################################
+
+
+def test_append_extend_and_index() -> None:
+    ids = UserUUID.factory_many(10)
+    array = PUUIDArray(UserUUID, ids[:5])
+    array.append(ids[5])
+    array.extend(ids[6:])
+
+    assert len(array) == 10
+    assert list(array) == ids
+    assert array[0] == ids[0]
+    assert array[-1] == ids[-1]
+    assert type(array[3]) is UserUUID
+    assert len(bytes(array)) == 16 * 10
+
+
+def test_index_out_of_range() -> None:
+    array = PUUIDArray(UserUUID, UserUUID.factory_many(2))
+    with pytest.raises(IndexError):
+        _ = array[2]
+    with pytest.raises(IndexError):
+        _ = array[-3]
+
+
+def test_reject_foreign_items() -> None:
+    array = PUUIDArray(UserUUID)
+    with pytest.raises(PUUIDError) as err:
+        array.append(OrgUUID())  # type: ignore[arg-type]
+    assert err.value.message == ERR_MSG.ARRAY_ITEM_TYPE_MISMATCH.format(
+        classname="PUUIDArray", expected=UserUUID.__name__, actual=OrgUUID.__name__
+    )
+
+
+def test_slice_is_a_view() -> None:
+    ids = UserUUID.factory_many(6)
+    array = PUUIDArray(UserUUID, ids)
+
+    view = array[1:4]
+    assert list(view) == ids[1:4]
+
+    replacement = UserUUID()
+    view[0] = replacement
+    assert array[1] == replacement
+
+    with pytest.raises(PUUIDError):
+        view.append(UserUUID())
+
+
+def test_slice_with_step_is_a_copy() -> None:
+    ids = UserUUID.factory_many(6)
+    array = PUUIDArray(UserUUID, ids)
+
+    every_other = array[::2]
+    assert list(every_other) == ids[::2]
+    assert list(array[::-1]) == ids[::-1]
+
+    every_other.append(UserUUID())
+    assert len(array) == 6
+
+
+def test_buffer_protocol() -> None:
+    ids = UserUUID.factory_many(3)
+    array = PUUIDArray(UserUUID, ids)
+
+    with memoryview(array) as view:
+        assert view.nbytes == 48
+        assert view[:16].tobytes() == ids[0].uuid.bytes
+
+    assert PUUIDArray.from_buffer(UserUUID, array) == array
+    assert PUUIDArray.from_buffer(UserUUID, array.tobytes()) == array
+
+
+@pytest.mark.parametrize(
+    "data, err_msg",
+    [
+        (b"\x00" * 17, ERR_MSG.ARRAY_BUFFER_LENGTH.format(length=17, item_size=16)),
+        (
+            UserUUID().uuid.bytes + uuid4().bytes,
+            ERR_MSG.ARRAY_BUFFER_VERSION_MISMATCH.format(index=1, version=7),
+        ),
+        (
+            b"\x00" * 16,
+            ERR_MSG.ARRAY_BUFFER_VERSION_MISMATCH.format(index=0, version=7),
+        ),
+    ],
+)
+def test_from_invalid_buffer(data: bytes, err_msg: str) -> None:
+    with pytest.raises(PUUIDError) as err:
+        PUUIDArray.from_buffer(UserUUID, data)
+    assert err.value.message == err_msg
+
+
+def test_strings_round_trip() -> None:
+    ids = UserUUID.factory_many(4)
+    serials = [user_id.to_string() for user_id in ids]
+
+    array = PUUIDArray.from_strings(UserUUID, serials)
+
+    assert list(array) == ids
+    assert array.to_strings() == serials
+
+
+def test_contains() -> None:
+    ids = UserUUID.factory_many(4)
+    array = PUUIDArray(UserUUID, ids)
+
+    assert ids[2] in array
+    assert ids[2] in array[1:]
+    assert ids[0] not in array[1:]
+    assert UserUUID() not in array
+    assert PUUIDv4[Literal["user"]]() not in array
+
+
+def test_repr() -> None:
+    array = PUUIDArray(UserUUID, UserUUID.factory_many(2))
+    assert repr(array) == f"PUUIDArray({UserUUID.__name__}, len=2)"
+
+
+################################################################################
+#### PUUIDSet
+################################################################################
+
+
+def test_set_membership_and_dedup() -> None:
+    ids = UserUUID.factory_many(5)
+    puuid_set = PUUIDSet(UserUUID, ids + ids[:2])
+    puuid_set.add(ids[0])
+
+    assert len(puuid_set) == 5
+    assert set(puuid_set) == set(ids)
+    assert ids[3] in puuid_set
+    assert UserUUID() not in puuid_set
+    assert PUUIDv4[Literal["user"]]() not in puuid_set
+    assert "user" not in puuid_set
+
+
+def test_set_update_from_generator() -> None:
+    ids = UserUUID.factory_many(3)
+    puuid_set = PUUIDSet(UserUUID)
+    puuid_set.update(user_id for user_id in ids)
+
+    assert set(puuid_set) == set(ids)
+
+
+def test_set_discard_and_remove() -> None:
+    ids = UserUUID.factory_many(3)
+    puuid_set = PUUIDSet(UserUUID, ids)
+    puuid_set.discard(ids[0])
+    puuid_set.discard(OrgUUID())  # type: ignore[arg-type]
+    puuid_set.remove(ids[1])
+
+    assert list(puuid_set) == [ids[2]]
+    with pytest.raises(KeyError):
+        puuid_set.remove(ids[0])
+
+
+def test_set_algebra() -> None:
+    ids = UserUUID.factory_many(6)
+    first, second = PUUIDSet(UserUUID, ids[:4]), PUUIDSet(UserUUID, ids[2:])
+
+    assert set(first & second) == set(ids[2:4])
+    assert set(first | second) == set(ids)
+    assert set(first - second) == set(ids[:2])
+    assert set(first ^ second) == {*ids[:2], *ids[4:]}
+    assert type(first & second) is PUUIDSet
+    assert set(first & set(ids[:1])) == {ids[0]}
+    assert set(set(ids[:3]) - first) == set()
+
+
+def test_set_in_place_algebra() -> None:
+    ids = UserUUID.factory_many(4)
+    puuid_set = PUUIDSet(UserUUID, ids[:2])
+    puuid_set |= PUUIDSet(UserUUID, ids[2:])
+    puuid_set -= [ids[0]]
+    puuid_set &= {ids[1], ids[2]}
+
+    assert set(puuid_set) == {ids[1], ids[2]}
+
+
+def test_set_comparisons() -> None:
+    ids = UserUUID.factory_many(3)
+    small, large = PUUIDSet(UserUUID, ids[:2]), PUUIDSet(UserUUID, ids)
+
+    assert small < large and small <= large and large >= small
+    assert small == PUUIDSet(UserUUID, ids[:2]) == set(ids[:2])
+    assert small != PUUIDSet(OrgUUID)
+    assert small.isdisjoint(PUUIDSet(UserUUID, ids[2:]))
+
+
+def test_set_rejects_foreign_items() -> None:
+    puuid_set = PUUIDSet(UserUUID)
+    with pytest.raises(PUUIDError) as err:
+        puuid_set.add(OrgUUID())  # type: ignore[arg-type]
+    assert err.value.message == ERR_MSG.ARRAY_ITEM_TYPE_MISMATCH.format(
+        classname="PUUIDSet", expected=UserUUID.__name__, actual=OrgUUID.__name__
+    )
+    with pytest.raises(PUUIDError):
+        _ = puuid_set | {OrgUUID()}
+
+
+def test_set_strings() -> None:
+    ids = UserUUID.factory_many(4)
+    serials = [user_id.to_string() for user_id in ids]
+
+    puuid_set = PUUIDSet.from_strings(UserUUID, serials[:2])
+    puuid_set.update_from_strings(serials)
+
+    assert set(puuid_set) == set(ids)
+    assert sorted(puuid_set.to_strings()) == sorted(serials)
+    with pytest.raises(PUUIDError):
+        puuid_set.update_from_strings([OrgUUID().to_string()])
+
+
+def test_set_repr() -> None:
+    puuid_set = PUUIDSet(UserUUID, UserUUID.factory_many(2))
+    assert repr(puuid_set) == f"PUUIDSet({UserUUID.__name__}, len=2)"
+
+
+################################################################################
+#### PUUIDDict
+################################################################################
+
+
+def test_dict_mapping_interface() -> None:
+    ids = UserUUID.factory_many(3)
+    puuid_dict = PUUIDDict(UserUUID, {ids[0]: "a", ids[1]: "b"})
+    puuid_dict[ids[2]] = "c"
+    del puuid_dict[ids[0]]
+
+    assert len(puuid_dict) == 2
+    assert dict(puuid_dict) == {ids[1]: "b", ids[2]: "c"}
+    assert puuid_dict[ids[1]] == "b"
+    assert puuid_dict.get(ids[0]) is None
+    assert ids[2] in puuid_dict and ids[0] not in puuid_dict
+    assert type(next(iter(puuid_dict))) is UserUUID
+
+
+@pytest.mark.parametrize("key", [UserUUID(), OrgUUID(), "user"])
+def test_dict_missing_key(key: UserUUID) -> None:
+    puuid_dict = PUUIDDict(UserUUID, [(UserUUID(), 1)])
+
+    with pytest.raises(KeyError):
+        _ = puuid_dict[key]
+    with pytest.raises(KeyError):
+        del puuid_dict[key]
+
+
+def test_dict_rejects_foreign_keys() -> None:
+    puuid_dict: PUUIDDict[UserUUID, int] = PUUIDDict(UserUUID)
+    with pytest.raises(PUUIDError):
+        puuid_dict[OrgUUID()] = 1  # type: ignore[index]
+
+
+def test_dict_strings() -> None:
+    ids = UserUUID.factory_many(3)
+
+    puuid_dict = PUUIDDict.from_strings(UserUUID, {ids[0].to_string(): 0})
+    puuid_dict.update_from_strings(
+        (user_id.to_string(), i) for i, user_id in enumerate(ids)
+    )
+
+    assert dict(puuid_dict) == {user_id: i for i, user_id in enumerate(ids)}
+    assert puuid_dict == PUUIDDict(UserUUID, dict(puuid_dict))
+
+
+def test_dict_repr() -> None:
+    puuid_dict = PUUIDDict(UserUUID, [(UserUUID(), 1)])
+    assert repr(puuid_dict) == f"PUUIDDict({UserUUID.__name__}, len=1)"
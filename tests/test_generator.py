@@ -0,0 +1,188 @@
+import threading
+from collections.abc import Iterable
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDError, PUUIDv4, PUUIDv7, PUUIDv7Generator
+from puuid.generator import _reseed_generators_after_fork
+
+UserUUID = PUUIDv7[Literal["user"]]
+
+_NOW_NS = 1_750_000_000_123_456_789
+_NOW_MS = _NOW_NS // 1_000_000
+
+
+class _Clock:
+    """Clock returning the given times, repeating the last one."""
+
+    def __init__(self, *times_ns: int) -> None:
+        self._times = iter(times_ns)
+        self._last = times_ns[0]
+
+    def __call__(self) -> int:
+        self._last = next(self._times, self._last)
+        return self._last
+
+
+def _timestamps_ms(ids: Iterable[PUUIDv7[str]]) -> list[int]:
+    return [puuid.uuid.int >> 80 for puuid in ids]
+
+
+def _is_strictly_increasing(ids: list[UserUUID]) -> bool:
+    return all(a.uuid.int < b.uuid.int for a, b in zip(ids, ids[1:]))
+
+
+def test_factory_types_and_version() -> None:
+    generator = PUUIDv7Generator(UserUUID)
+    puuid = generator.factory()
+
+    assert type(puuid) is UserUUID
+    assert puuid.uuid.version == 7
+    assert puuid.uuid.variant == "specified in RFC 4122"
+    assert generator.puuid_cls is UserUUID
+    assert UserUUID.from_string(puuid.to_string()) == puuid
+
+
+def test_strictly_increasing_within_one_millisecond() -> None:
+    generator = PUUIDv7Generator(UserUUID, clock=_Clock(_NOW_NS))
+    ids = [generator.factory() for _ in range(1000)] + generator.factory_many(1000)
+
+    assert _is_strictly_increasing(ids)
+    assert set(_timestamps_ms(ids)) == {_NOW_MS}
+
+
+def test_counter_overflow_carries_into_timestamp() -> None:
+    generator = PUUIDv7Generator(UserUUID, counter_bits=12, clock=_Clock(_NOW_NS))
+    ids = generator.factory_many(5000)
+
+    assert _is_strictly_increasing(ids)
+    assert _timestamps_ms(ids)[-1] > _NOW_MS
+
+
+def test_counter_is_reseeded_per_millisecond() -> None:
+    generator = PUUIDv7Generator(
+        UserUUID, clock=_Clock(_NOW_NS, _NOW_NS + 1_000_000, _NOW_NS + 2_000_000)
+    )
+    ids = [generator.factory() for _ in range(3)]
+
+    assert _timestamps_ms(ids) == [_NOW_MS, _NOW_MS + 1, _NOW_MS + 2]
+    # the most significant counter bit is cleared on reseed
+    assert all(not (puuid.uuid.int >> 75) & 1 for puuid in ids)
+
+
+def test_precision_method_stores_sub_millisecond_fraction() -> None:
+    half_ms = _NOW_MS * 1_000_000 + 500_000
+    generator = PUUIDv7Generator(UserUUID, method="precision", clock=_Clock(half_ms))
+    puuid = generator.factory()
+
+    assert _timestamps_ms([puuid]) == [_NOW_MS]
+    assert (puuid.uuid.int >> 64) & 0x0FFF == 2048
+
+
+def test_precision_method_without_counter() -> None:
+    generator = PUUIDv7Generator(
+        UserUUID, method="precision", counter_bits=0, clock=_Clock(_NOW_NS)
+    )
+
+    assert _is_strictly_increasing(generator.factory_many(100))
+
+
+@pytest.mark.parametrize(
+    "method, counter_bits",
+    [("counter", 11), ("counter", 43), ("precision", -1), ("precision", 62)],
+)
+def test_invalid_counter_bits(
+    method: Literal["counter", "precision"], counter_bits: int
+) -> None:
+    with pytest.raises(PUUIDError):
+        _ = PUUIDv7Generator(UserUUID, method=method, counter_bits=counter_bits)
+
+
+@pytest.mark.parametrize(
+    "option, value",
+    [("method", "count"), ("method", ""), ("on_clock_regression", "stal")],
+)
+def test_unknown_option(option: str, value: str) -> None:
+    with pytest.raises(PUUIDError, match=f"Unknown {option} '{value}'"):
+        _ = PUUIDv7Generator(UserUUID, **{option: value})  # type: ignore[arg-type]
+
+
+def test_reject_non_v7_class() -> None:
+    with pytest.raises(PUUIDError):
+        _ = PUUIDv7Generator(PUUIDv4[Literal["user"]])  # type: ignore[type-var]
+
+
+def test_clock_regression_borrow() -> None:
+    generator = PUUIDv7Generator(
+        UserUUID, clock=_Clock(_NOW_NS, _NOW_NS - 5_000_000, _NOW_NS + 1_000_000)
+    )
+    ids = [generator.factory() for _ in range(3)]
+
+    assert _is_strictly_increasing(ids)
+    assert _timestamps_ms(ids) == [_NOW_MS, _NOW_MS, _NOW_MS + 1]
+
+
+def test_clock_regression_raise() -> None:
+    generator = PUUIDv7Generator(
+        UserUUID,
+        on_clock_regression="raise",
+        clock=_Clock(_NOW_NS, _NOW_NS - 5_000_000),
+    )
+    _ = generator.factory()
+
+    with pytest.raises(PUUIDError, match="Clock moved backwards by '5.000' ms"):
+        _ = generator.factory()
+
+
+def test_clock_regression_stall() -> None:
+    clock = _Clock(_NOW_NS, _NOW_NS - 2_000_000, _NOW_NS - 2_000_000, _NOW_NS)
+    generator = PUUIDv7Generator(UserUUID, on_clock_regression="stall", clock=clock)
+    ids = [generator.factory() for _ in range(2)]
+
+    assert _is_strictly_increasing(ids)
+    assert _timestamps_ms(ids) == [_NOW_MS, _NOW_MS]
+
+
+def _generate(generator: PUUIDv7Generator[UserUUID], ids: list[UserUUID]) -> None:
+    ids.extend(generator.factory() for _ in range(1000))
+
+
+def test_thread_safety() -> None:
+    generator = PUUIDv7Generator(UserUUID)
+    results: list[list[UserUUID]] = [[] for _ in range(4)]
+    threads = [
+        threading.Thread(target=_generate, args=(generator, ids)) for ids in results
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(_is_strictly_increasing(ids) for ids in results)
+    assert len({puuid for ids in results for puuid in ids}) == 4000
+
+
+def test_reseed_after_fork_keeps_order() -> None:
+    generator = PUUIDv7Generator(UserUUID, clock=_Clock(_NOW_NS))
+    before = generator.factory()
+    state = generator._last_state
+
+    _reseed_generators_after_fork()
+
+    assert generator._last_state > state
+    assert generator.factory().uuid.int > before.uuid.int
+
+
+def test_reseed_after_fork_with_widest_counter() -> None:
+    generator = PUUIDv7Generator(
+        UserUUID, method="precision", counter_bits=61, clock=_Clock(_NOW_NS)
+    )
+    _ = generator.factory()
+    state = generator._last_tick, generator._last_state
+    parent_ids = generator.factory_many(100)
+    generator._last_tick, generator._last_state = state
+
+    generator._reseed()  # as in the child after `fork()`
+
+    assert not set(parent_ids) & set(generator.factory_many(100))
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+
+import pytest
+
+# optional dependencies and heavy modules that `import puuid` must not load
+DEFERRED_MODULES = ("pydantic", "pydantic_core", "sqlalchemy", "numpy", "asyncio")
+# generous bound against accidental eager imports, not a benchmark of the machine
+MAX_IMPORT_TIME_US = 500_000
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Cumulative import time in microseconds per module from `-X importtime`."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_optional_dependencies_are_not_imported() -> None:
+    modules = _import_times("import puuid")
+
+    assert "puuid" in modules
+    assert not [
+        module for module in modules if module.split(".")[0] in DEFERRED_MODULES
+    ]
+
+
+def test_import_time_bound() -> None:
+    assert _import_times("import puuid")["puuid"] < MAX_IMPORT_TIME_US
+
+
+def test_pydantic_is_imported_on_first_schema() -> None:
+    _ = pytest.importorskip(
+        "pydantic_core", reason="pydantic is an optional dependency"
+    )
+    script = (
+        "import sys; from typing import Literal; from puuid import PUUIDv4\n"
+        "UserUUID = PUUIDv4[Literal['user']]\n"
+        "print('pydantic_core' in sys.modules)\n"
+        "UserUUID.__get_pydantic_core_schema__(UserUUID, None)\n"
+        "print('pydantic_core' in sys.modules)"
+    )
+
+    process = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    )
+
+    assert process.stdout.split() == ["False", "True"]
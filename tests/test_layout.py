@@ -0,0 +1,157 @@
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDError, PUUIDv7, PUUIDv8
+from puuid.layout import SnowflakeFields, SnowflakeGenerator, SnowflakeLayout
+
+OrderUUID = PUUIDv8[Literal["order"]]
+
+_NOW_MS = 1_750_000_000_123
+_NOW_NS = _NOW_MS * 1_000_000
+
+
+class _Clock:
+    """Clock returning the given times, repeating the last one."""
+
+    def __init__(self, *times_ns: int) -> None:
+        self._times = iter(times_ns)
+        self._last = times_ns[0]
+
+    def __call__(self) -> int:
+        self._last = next(self._times, self._last)
+        return self._last
+
+
+def test_generate_and_decode() -> None:
+    layout = SnowflakeLayout(shard_bits=10, sequence_bits=12)
+    generator = layout.generator(OrderUUID, shard=513, clock=_Clock(_NOW_NS))
+    ids = generator.factory_many(3)
+
+    assert all(type(puuid) is OrderUUID for puuid in ids)
+    assert all(puuid.uuid.version == 8 for puuid in ids)
+    assert [layout.decode(puuid) for puuid in ids] == [
+        SnowflakeFields(timestamp_ms=_NOW_MS, shard=513, sequence=sequence)
+        for sequence in range(3)
+    ]
+
+
+def test_sequence_restarts_every_millisecond() -> None:
+    layout = SnowflakeLayout()
+    clock = _Clock(_NOW_NS, _NOW_NS, _NOW_NS + 1_000_000)
+    generator = layout.generator(OrderUUID, shard=1, clock=clock)
+    fields = [layout.decode(generator.factory()) for _ in range(3)]
+
+    assert [(field.timestamp_ms, field.sequence) for field in fields] == [
+        (_NOW_MS, 0),
+        (_NOW_MS, 1),
+        (_NOW_MS + 1, 0),
+    ]
+
+
+def test_sequence_overflow_carries_into_timestamp() -> None:
+    layout = SnowflakeLayout(sequence_bits=2)
+    generator = layout.generator(OrderUUID, shard=0, clock=_Clock(_NOW_NS))
+    ids = generator.factory_many(6)
+
+    assert ids == sorted(ids, key=lambda puuid: puuid.uuid)
+    assert layout.decode(ids[-1]) == SnowflakeFields(_NOW_MS + 1, 0, 1)
+
+
+def test_clock_regression_keeps_order() -> None:
+    layout = SnowflakeLayout()
+    clock = _Clock(_NOW_NS, _NOW_NS - 5_000_000)
+    generator = layout.generator(OrderUUID, shard=0, clock=clock)
+    first, second = generator.factory(), generator.factory()
+
+    assert first.uuid < second.uuid
+    assert layout.decode(second) == SnowflakeFields(_NOW_MS, 0, 1)
+
+
+def test_ids_of_shards_differ_and_sort_by_time() -> None:
+    layout = SnowflakeLayout()
+    early = layout.generator(OrderUUID, shard=7, clock=_Clock(_NOW_NS)).factory()
+    late = layout.generator(OrderUUID, shard=1, clock=_Clock(_NOW_NS + 10**6))
+
+    assert early.uuid < late.factory().uuid
+
+
+def test_custom_epoch_and_no_random_bits() -> None:
+    layout = SnowflakeLayout(
+        shard_bits=30, sequence_bits=52, timestamp_bits=40, epoch_ms=_NOW_MS - 5
+    )
+    generator = layout.generator(OrderUUID, shard=3, clock=_Clock(_NOW_NS))
+    puuid = generator.factory()
+
+    assert layout.random_bits == 0
+    assert layout.decode(puuid) == SnowflakeFields(_NOW_MS, 3, 0)
+    assert puuid.uuid.int >> 80 == 5 << 8
+
+
+def test_decode_roundtrip_after_serialization() -> None:
+    layout = SnowflakeLayout()
+    puuid = layout.generator(OrderUUID, shard=42).factory()
+
+    assert layout.decode(OrderUUID.from_string(puuid.to_string())).shard == 42
+
+
+@pytest.mark.parametrize(
+    "timestamp_bits, shard_bits, sequence_bits",
+    [(0, 10, 12), (48, -1, 12), (48, 40, 40)],
+)
+def test_invalid_layout(
+    timestamp_bits: int, shard_bits: int, sequence_bits: int
+) -> None:
+    with pytest.raises(PUUIDError):
+        _ = SnowflakeLayout(
+            timestamp_bits=timestamp_bits,
+            shard_bits=shard_bits,
+            sequence_bits=sequence_bits,
+        )
+
+
+@pytest.mark.parametrize("shard", [-1, 1024])
+def test_invalid_shard(shard: int) -> None:
+    with pytest.raises(PUUIDError):
+        _ = SnowflakeLayout(shard_bits=10).generator(OrderUUID, shard=shard)
+
+
+def test_reject_non_v8_class() -> None:
+    with pytest.raises(PUUIDError):
+        _ = SnowflakeGenerator(
+            SnowflakeLayout(), PUUIDv7[Literal["order"]], 0  # type: ignore[type-var]
+        )
+
+
+def test_timestamp_overflow() -> None:
+    layout = SnowflakeLayout(timestamp_bits=8, epoch_ms=_NOW_MS)
+    generator = layout.generator(
+        OrderUUID, shard=0, clock=_Clock(_NOW_NS + 256 * 10**6)
+    )
+
+    with pytest.raises(PUUIDError):
+        _ = generator.factory()
+
+
+def test_sequence_carry_overflows_timestamp() -> None:
+    layout = SnowflakeLayout(sequence_bits=2, timestamp_bits=8, epoch_ms=_NOW_MS)
+    # last millisecond of the layout, four sequence numbers left
+    generator = layout.generator(
+        OrderUUID, shard=0, clock=_Clock(_NOW_NS + 255 * 10**6)
+    )
+
+    with pytest.raises(PUUIDError):
+        _ = generator.factory_many(5)
+    ids = generator.factory_many(4)
+
+    assert layout.decode(ids[-1]) == SnowflakeFields(_NOW_MS + 255, 0, 3)
+    with pytest.raises(PUUIDError):
+        _ = generator.factory()
+
+
+def test_timestamp_before_epoch() -> None:
+    layout = SnowflakeLayout(epoch_ms=_NOW_MS + 1)
+    generator = layout.generator(OrderUUID, shard=0, clock=_Clock(_NOW_NS))
+
+    with pytest.raises(PUUIDError):
+        _ = generator.factory()
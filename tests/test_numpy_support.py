@@ -0,0 +1,116 @@
+from typing import Literal
+from uuid import uuid4
+
+import pytest
+
+np = pytest.importorskip("numpy", reason="numpy is an optional dependency")
+
+from puuid import PUUIDArray, PUUIDError, PUUIDv1, PUUIDv4, PUUIDv6, PUUIDv7
+from puuid.numpy import extract_datetimes, format_strings, parse_strings
+
+UserUUID = PUUIDv7[Literal["user"]]
+
+
+class TokenUUID(PUUIDv7[Literal["tok"]], codec="base62"): ...
+
+
+def test_parse_strings() -> None:
+    ids = UserUUID.factory_many(8)
+    serials = np.array([user_id.to_string() for user_id in ids])
+
+    result = parse_strings(serials, UserUUID)
+
+    assert result.uuids.shape == (8, 16)
+    assert result.uuids.tobytes() == b"".join(user_id.uuid.bytes for user_id in ids)
+    assert result.invalid.size == 0
+
+
+@pytest.mark.parametrize("dtype", [np.str_, np.bytes_, np.object_])
+def test_parse_strings_reports_invalid_rows(dtype: type) -> None:
+    valid = UserUUID().to_string()
+    serials = np.array(
+        [
+            valid,
+            f"org_{UserUUID().uuid}",
+            f"user_{uuid4()}",
+            "user_1a3e0e89-a2d8-7950-3afa-24020e09b2a5",
+            "user_1a3e0e89-a2d8-7950-bafa-24020e09b2ag",
+            "user_1a3e0e89_a2d8-7950-bafa-24020e09b2a5",
+            f"{valid}0",
+            valid[:-1],
+            "user",
+            "",
+            valid.upper().replace("USER", "user"),
+        ],
+        dtype=dtype,
+    )
+
+    result = parse_strings(serials, UserUUID)
+
+    assert result.invalid.tolist() == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    assert not result.uuids[result.invalid].any()
+    assert result.uuids[0].tobytes() == UserUUID.from_string(valid).uuid.bytes
+
+
+def test_format_strings() -> None:
+    ids = UserUUID.factory_many(8)
+    uuids = np.frombuffer(PUUIDArray(UserUUID, ids), dtype=np.uint8).reshape(-1, 16)
+
+    serials = format_strings(uuids, UserUUID)
+
+    assert serials.tolist() == [user_id.to_string() for user_id in ids]
+    assert (format_strings(uuids.view("V16").ravel(), UserUUID) == serials).all()
+
+
+def test_round_trip_non_ascii_prefix() -> None:
+    uuid_cls = PUUIDv4[Literal["ünïcode"]]
+    serials = np.array([uuid_cls().to_string() for _ in range(4)])
+
+    result = parse_strings(serials, uuid_cls)
+
+    assert result.invalid.size == 0
+    assert (format_strings(result.uuids, uuid_cls) == serials).all()
+
+
+def test_reject_non_canonical_codec() -> None:
+    with pytest.raises(PUUIDError):
+        _ = parse_strings(np.array([TokenUUID.factory().to_string()]), TokenUUID)
+    with pytest.raises(PUUIDError):
+        _ = format_strings(np.zeros((1, 16), dtype=np.uint8), TokenUUID)
+
+
+@pytest.mark.parametrize(
+    ("puuid_cls", "unit"),
+    [
+        (UserUUID, "ms"),
+        (PUUIDv6[Literal["user"]], "us"),
+        (PUUIDv1[Literal["user"]], "us"),
+    ],
+)
+def test_extract_datetimes(
+    puuid_cls: type[PUUIDv7[str] | PUUIDv6[str] | PUUIDv1[str]], unit: str
+) -> None:
+    ids = puuid_cls.factory_many(8)
+    uuids = np.frombuffer(PUUIDArray(puuid_cls, ids), dtype=np.uint8).reshape(-1, 16)
+
+    datetimes = extract_datetimes(uuids, puuid_cls)
+
+    assert datetimes.dtype == np.dtype(f"datetime64[{unit}]")
+    expected = [puuid.datetime.replace(tzinfo=None) for puuid in ids]
+    assert datetimes.astype("datetime64[us]").tolist() == expected
+
+
+def test_extract_datetimes_of_parsed_strings() -> None:
+    ids = UserUUID.factory_many(4)
+    result = parse_strings(np.array([user_id.to_string() for user_id in ids]), UserUUID)
+
+    datetimes = extract_datetimes(result.uuids, UserUUID)
+
+    assert (datetimes[:-1] <= datetimes[1:]).all()
+
+
+def test_extract_datetimes_requires_time_based_class() -> None:
+    with pytest.raises(PUUIDError):
+        _ = extract_datetimes(
+            np.zeros((1, 16), dtype=np.uint8), PUUIDv4[Literal["user"]]
+        )
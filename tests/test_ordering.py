@@ -0,0 +1,64 @@
+import bisect
+import heapq
+import random
+from operator import attrgetter
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDv4, PUUIDv6, PUUIDv7
+
+EventUUID = PUUIDv7[Literal["evt"]]
+LegacyEventUUID = PUUIDv6[Literal["evt"]]
+UserUUID = PUUIDv7[Literal["user"]]
+
+
+def test_sort_v7_by_creation() -> None:
+    ids = EventUUID.factory_many(100)
+    shuffled = random.sample(ids, len(ids))
+
+    assert sorted(shuffled) == ids
+    assert sorted(shuffled, key=attrgetter("sort_key")) == ids
+    assert min(shuffled) == ids[0] and max(shuffled) == ids[-1]
+
+
+def test_sort_v6_by_creation() -> None:
+    ids = LegacyEventUUID.factory_many(100)
+
+    assert sorted(reversed(ids)) == ids
+
+
+def test_rich_comparisons() -> None:
+    first, second = EventUUID.factory_many(2)
+    same = EventUUID.from_string(first.to_string())
+
+    assert first < second and first <= second and first <= same
+    assert second > first and second >= first and first >= same
+    assert not first < same and not first > same
+
+
+def test_same_prefix_across_versions() -> None:
+    v6_id, v7_id = LegacyEventUUID.factory(), EventUUID.factory()
+
+    assert (v6_id < v7_id) == (v6_id.sort_key < v7_id.sort_key)
+
+
+@pytest.mark.parametrize("other", [UserUUID.factory(), "evt_", 1, None])
+def test_different_prefix_is_not_orderable(other: object) -> None:
+    with pytest.raises(TypeError):
+        _ = EventUUID.factory() < other  # type: ignore[operator]
+
+
+def test_heapq_merge_and_bisect() -> None:
+    ids = EventUUID.factory_many(60)
+    runs = [ids[0::3], ids[1::3], ids[2::3]]
+
+    assert list(heapq.merge(*runs)) == ids
+    assert bisect.bisect_left(ids, ids[42]) == 42
+    assert bisect.bisect_left(ids, ids[42].sort_key, key=attrgetter("sort_key")) == 42
+
+
+def test_sort_key_is_uuid_int() -> None:
+    user_id = PUUIDv4[Literal["user"]].factory()
+
+    assert user_id.sort_key == user_id.uuid.int
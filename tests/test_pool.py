@@ -0,0 +1,178 @@
+import gc
+import threading
+import time
+from typing import Literal
+from unittest.mock import patch
+
+import pytest
+
+from puuid import PUUIDError, PUUIDv4, PUUIDv5, PUUIDv7
+from puuid.pool import PUUIDPool, _reset_pools_after_fork
+
+UserUUID = PUUIDv4[Literal["user"]]
+EventUUID = PUUIDv7[Literal["event"]]
+
+
+def _wait_for_length(pool: PUUIDPool[UserUUID], length: int) -> None:
+    deadline = time.monotonic() + 5
+    while len(pool) < length and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_prefilled_on_creation() -> None:
+    with PUUIDPool(UserUUID, size=64) as pool:
+        assert len(pool) == 64
+        assert pool.puuid_cls is UserUUID
+
+
+def test_take_and_take_many() -> None:
+    with PUUIDPool(UserUUID, size=64, low_watermark=8) as pool:
+        first = pool.take()
+        batch = pool.take_many(10)
+
+        assert type(first) is UserUUID
+        assert len(batch) == 10
+        assert len({first, *batch}) == 11
+        assert pool.take_many(0) == []
+
+
+def test_background_refill() -> None:
+    with PUUIDPool(UserUUID, size=64, low_watermark=32) as pool:
+        _ = pool.take_many(40)
+        _wait_for_length(pool, 64)
+
+        assert len(pool) == 64
+
+
+def test_take_more_than_buffered() -> None:
+    with PUUIDPool(UserUUID, size=16, low_watermark=4) as pool:
+        ids = pool.take_many(100)
+
+        assert len(set(ids)) == 100
+
+
+def test_concurrent_takes_are_unique() -> None:
+    results: list[list[UserUUID]] = [[] for _ in range(4)]
+    with PUUIDPool(UserUUID, size=128, low_watermark=32) as pool:
+        threads = [
+            threading.Thread(target=_take_repeatedly, args=(pool, ids))
+            for ids in results
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len({puuid for ids in results for puuid in ids}) == 4000
+
+
+def _take_repeatedly(pool: PUUIDPool[UserUUID], ids: list[UserUUID]) -> None:
+    ids.extend(pool.take() for _ in range(1000))
+
+
+def test_v7_ids_are_ordered() -> None:
+    with PUUIDPool(EventUUID, size=64, low_watermark=16) as pool:
+        ids = pool.take_many(32)
+
+    assert ids == sorted(ids, key=lambda puuid: puuid.uuid)
+
+
+def test_take_from_empty_pool_keeps_order() -> None:
+    with PUUIDPool(EventUUID, size=8, low_watermark=0) as pool:
+        buffered = pool.take_many(8)
+        with patch.object(EventUUID, "factory", side_effect=AssertionError):
+            inline = pool.take()
+
+    assert buffered[-1] < inline
+
+
+def test_stale_v7_ids_are_discarded() -> None:
+    with PUUIDPool(EventUUID, size=8, low_watermark=0, max_age=0.5) as pool:
+        stale = {puuid.uuid for puuid in pool._buffer}
+        later_ns = time.time_ns() + 1_000_000_000
+        with patch("puuid.pool.time.time_ns", return_value=later_ns):
+            fresh = pool.take()
+
+    assert fresh.uuid not in stale
+
+
+def test_stale_check_only_for_v7() -> None:
+    with PUUIDPool(UserUUID, size=8, low_watermark=0, max_age=0) as pool:
+        buffered = pool._buffer[0]
+
+        assert pool.take() is buffered
+
+
+@pytest.mark.parametrize("size, low_watermark", [(0, None), (8, 8), (8, -1)])
+def test_invalid_sizes(size: int, low_watermark: int | None) -> None:
+    with pytest.raises(PUUIDError):
+        _ = PUUIDPool(UserUUID, size=size, low_watermark=low_watermark)
+
+
+def test_reject_class_without_bulk_generation() -> None:
+    with pytest.raises(PUUIDError):
+        _ = PUUIDPool(PUUIDv5[Literal["user"]])
+
+
+def test_take_after_close() -> None:
+    pool = PUUIDPool(UserUUID, size=8)
+    pool.close()
+
+    with pytest.raises(PUUIDError):
+        _ = pool.take()
+
+
+def _take_into(pool: PUUIDPool[EventUUID], ids: list[EventUUID]) -> None:
+    ids.append(pool.take())
+
+
+def test_take_from_empty_pool_waits_for_running_refill() -> None:
+    with PUUIDPool(EventUUID, size=8, low_watermark=0) as pool:
+        _ = pool.take_many(8)
+        ids: list[EventUUID] = []
+        taker = threading.Thread(target=_take_into, args=(pool, ids))
+        with pool._refill_lock:  # a refill adding an older batch meanwhile
+            batch = EventUUID.factory_many(4)
+            taker.start()
+            time.sleep(0.05)
+            pool._buffer.extend(batch)
+        taker.join()
+        ids.append(pool.take())
+
+    assert ids == batch[:2]
+
+
+def test_worker_stops_when_pool_is_collected() -> None:
+    pool = PUUIDPool(UserUUID, size=8)
+    _ = pool.take()
+    worker = pool._worker
+    assert worker is not None
+
+    del pool
+    _ = gc.collect()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+
+
+def test_refill_after_close_is_dropped() -> None:
+    pool = PUUIDPool(UserUUID, size=8)
+    pool.close()
+
+    pool._refill()  # e.g., a refill that was already running during `close`
+
+    assert len(pool) == 0
+
+
+def test_fork_discards_buffer() -> None:
+    with PUUIDPool(UserUUID, size=8, low_watermark=0) as pool:
+        inherited = set(pool._buffer)
+        _reset_pools_after_fork()
+
+        assert len(pool) == 0
+        assert pool.take() not in inherited
+
+
+def test_repr() -> None:
+    with PUUIDPool(UserUUID, size=8, low_watermark=2) as pool:
+        assert repr(pool) == "PUUIDPool(PUUIDv4_user, size=8, low_watermark=2)"
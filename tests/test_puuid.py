@@ -1,6 +1,12 @@
+import pickle
 import random
+import subprocess
+import sys
+import threading
+import time
 from types import GenericAlias
 from typing import Literal, TypeVar
+from unittest.mock import patch
 from uuid import NAMESPACE_DNS, UUID, uuid1, uuid3, uuid4, uuid5, uuid6, uuid7, uuid8
 
 import pytest
@@ -16,7 +22,8 @@ from puuid import (
     PUUIDv7,
     PUUIDv8,
 )
-from puuid.base import ERR_MSG
+from puuid.base import ERR_MSG, _build_specialized_puuid_class
+from puuid.cache import CacheInfo
 
 UserUUID = PUUIDv4[Literal["user"]]
 Version1UUID = PUUIDv1[Literal["ver1"]]
@@ -36,6 +43,18 @@ class Version3UUIDBack(PUUIDv3[Literal["ver3b"]]):
     _prefix = "ver3b"  # <- type no longer in sync with `Literal["ver3b"]` as in v1.0.0
 
 
+class SlottedUUID(PUUIDv7[Literal["slot"]]):
+    __slots__ = ()
+
+
+class VersionlessUUID(PUUIDBase[Literal["nover"]]):
+    __slots__ = ()
+
+    def __init__(self, *, uuid: UUID) -> None:
+        self._int = uuid.int
+        self._serial = None
+
+
 def test_class_getitem_typevar_returns_generic_alias() -> None:
     T = TypeVar("T", bound=str)
     res = PUUIDv4[T]
@@ -127,6 +146,44 @@ def test_type_identity_caching() -> None:
     assert user_b is user_c
 
 
+def test_repeated_subscription_skips_normalization() -> None:
+    item = Literal["front"]
+    specialized = PUUIDv4[item]
+
+    with patch("puuid.base._puuid_class_getitem_runtime") as slow_path:
+        assert PUUIDv4[item] is specialized
+        assert PUUIDv4[Literal["front"]] is specialized
+    slow_path.assert_not_called()
+    assert PUUIDv7[item] is not specialized
+    assert PUUIDv7[item].prefix() == "front"
+
+
+def _slow_build(*args: object) -> object:
+    time.sleep(0.01)  # widen the window between the cache miss and the insert
+    return _build_specialized_puuid_class(*args)  # type: ignore[arg-type]
+
+
+def _subscribe(barrier: threading.Barrier, results: list[type]) -> None:
+    barrier.wait()
+    results.append(PUUIDv7[Literal["race"]])
+
+
+def test_concurrent_subscriptions_create_one_class() -> None:
+    barrier = threading.Barrier(8)
+    results: list[type] = []
+    threads = [
+        threading.Thread(target=_subscribe, args=(barrier, results)) for _ in range(8)
+    ]
+    with patch("puuid.base._build_specialized_puuid_class", side_effect=_slow_build):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(results) == 8
+    assert len(set(results)) == 1
+
+
 @pytest.mark.parametrize(
     "uuid_cls, uuid, err_msg",
     [
@@ -197,6 +254,53 @@ def test_init_failure_with_uuid_for_all_versions(
     assert err.value.message == err_msg
 
 
+@pytest.mark.parametrize(
+    "uuid_cls, version",
+    [
+        (Version1UUID, 1),
+        (Version1UUIDBack, 1),
+        (Version4UUID, 4),
+        (Version6UUID, 6),
+        (Version7UUID, 7),
+        (Version8UUID, 8),
+    ],
+)
+def test_factory_many_for_v1_v4_v6_v7_v8(
+    uuid_cls: type[PUUIDBase[Literal["vers"]]], version: int
+) -> None:
+    instances = uuid_cls.factory_many(64)
+
+    assert len(instances) == 64
+    assert len(set(instances)) == 64
+    for instance in instances:
+        assert type(instance) is uuid_cls
+        assert instance.uuid.version == version
+        assert uuid_cls.from_string(instance.to_string()) == instance
+
+
+@pytest.mark.parametrize("uuid_cls", [Version6UUID, Version7UUID])
+def test_factory_many_is_ordered_for_v6_v7(
+    uuid_cls: type[Version6UUID | Version7UUID],
+) -> None:
+    first_batch = uuid_cls.factory_many(1000)
+    second_batch = uuid_cls.factory_many(1000)
+
+    ints = [instance.uuid.int for instance in first_batch + second_batch]
+    assert ints == sorted(ints)
+    assert len(set(ints)) == len(ints)
+
+
+def test_factory_many_empty_batch() -> None:
+    assert Version7UUID.factory_many(0) == []
+
+
+@pytest.mark.parametrize("n", [-1, 2.5, True])
+def test_factory_many_invalid_batch_size(n: int) -> None:
+    with pytest.raises(PUUIDError) as err:
+        Version4UUID.factory_many(n)
+    assert err.value.message == ERR_MSG.INVALID_BATCH_SIZE.format(n=n)
+
+
 ################################################################################
 #### PUUID v1 & v6
 ################################################################################
@@ -382,6 +486,10 @@ def test_unsupported_factory(
         uuid_cls.factory()
     assert err.value.message == ERR_MSG.FACTORY_UNSUPPORTED
 
+    with pytest.raises(PUUIDError) as err:
+        uuid_cls.factory_many(8)
+    assert err.value.message == ERR_MSG.FACTORY_MANY_UNSUPPORTED
+
 
 ################################################################################
 #### PUUID v8
@@ -518,6 +626,125 @@ def test_create_from_invalid_str(serial_user_id: str) -> None:
     assert err.value.message == err_msg
 
 
+@pytest.mark.parametrize(
+    "serial_user_id",
+    [
+        "user_1A3E0E89-A2D8-4950-BAFA-24020E09B2A5",
+        "user_1a3e0e89a2d84950bafa24020e09b2a5",
+        "user_{1a3e0e89-a2d8-4950-bafa-24020e09b2a5}",
+        "user_urn:uuid:1a3e0e89-a2d8-4950-bafa-24020e09b2a5",
+    ],
+)
+def test_create_from_non_canonical_str(serial_user_id: str) -> None:
+    user_id = UserUUID.from_string(serial_user_id)
+    assert str(user_id) == "user_1a3e0e89-a2d8-4950-bafa-24020e09b2a5"
+
+
+@pytest.mark.parametrize(
+    "serial_user_id",
+    [
+        "user_1a3e0e8 -a2d8-4950-bafa-24020e09b2a5",
+        "user_1a3e0e89-a2d8-4950-bafa-24020e09b-a5",
+        "user_1a3e0e89-a2d8-4950_bafa-24020e09b2a5",
+        "usr__1a3e0e89-a2d8-4950-bafa-24020e09b2a5",
+    ],
+)
+def test_create_from_malformed_canonical_str(serial_user_id: str) -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = UserUUID.from_string(serial_user_id)
+    assert err.value.message == ERR_MSG.PREFIX_DESERIALIZATION_ERROR.format(
+        prefix="user", classname=UserUUID.__name__, serial_puuid=serial_user_id
+    )
+
+
+@pytest.mark.parametrize(
+    "serial_user_id, actual",
+    [
+        ("user_1a3e0e89-a2d8-7950-bafa-24020e09b2a5", 7),
+        ("user_1a3e0e89-a2d8-4950-3afa-24020e09b2a5", None),
+    ],
+)
+def test_create_from_str_with_wrong_version(
+    serial_user_id: str, actual: int | None
+) -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = UserUUID.from_string(serial_user_id)
+    assert err.value.message == ERR_MSG.UUID_VERSION_MISMATCH.format(
+        expected=4, actual=actual
+    )
+
+
+def test_create_from_str_skips_init() -> None:
+    serial_user_id = "user_1a3e0e89-a2d8-4950-bafa-24020e09b2a5"
+
+    with patch.object(PUUIDv4, "__init__", side_effect=AssertionError):
+        user_id = UserUUID.from_string(serial_user_id)
+
+    assert type(user_id) is UserUUID
+    assert user_id.uuid == UUID(serial_user_id.removeprefix("user_"))
+
+
+def test_create_from_trusted_str() -> None:
+    serial_user_id = UserUUID.factory().to_string()
+
+    user_id = UserUUID.from_string(serial_user_id, trusted=True)
+
+    assert type(user_id) is UserUUID
+    assert user_id == UserUUID.from_string(serial_user_id)
+    assert user_id.to_string() is serial_user_id
+
+
+def test_create_from_trusted_str_skips_checks() -> None:
+    serial_user_id = "user_1a3e0e89-a2d8-7950-bafa-24020e09b2a5"
+
+    with patch.object(UserUUID, "_decode_serial", side_effect=AssertionError):
+        user_id = UserUUID.from_string(serial_user_id, trusted=True)
+
+    assert user_id.uuid == UUID(serial_user_id.removeprefix("user_"))
+
+
+@pytest.mark.parametrize(
+    "serial_user_id",
+    [
+        "user_{1a3e0e89-a2d8-4950-bafa-24020e09b2a5}",
+        "user_1a3e0e89a2d84950bafa24020e09b2a5",
+    ],
+)
+def test_create_from_trusted_str_of_other_form(serial_user_id: str) -> None:
+    user_id = UserUUID.from_string(serial_user_id, trusted=True)
+
+    assert user_id.to_string() == "user_1a3e0e89-a2d8-4950-bafa-24020e09b2a5"
+
+
+def test_create_from_trusted_str_of_other_prefix() -> None:
+    serial_id = "abcd_1a3e0e89-a2d8-4950-bafa-24020e09b2a5"
+
+    with pytest.raises(PUUIDError):
+        _ = UserUUID.from_string(serial_id, trusted=True)
+
+
+def test_trusted_str_bypasses_interning_cache() -> None:
+    serial_v7_id = "user_1a3e0e89-a2d8-7950-bafa-24020e09b2a5"
+    UserUUID.enable_cache()
+    try:
+        _ = UserUUID.from_string(serial_v7_id, trusted=True)
+
+        with pytest.raises(PUUIDError):
+            _ = UserUUID.from_string(serial_v7_id)
+        assert UserUUID.cache_info() == CacheInfo(
+            hits=0, misses=1, maxsize=1024, currsize=0
+        )
+    finally:
+        UserUUID.disable_cache()
+
+
+def test_create_from_undecodable_trusted_str() -> None:
+    serial_user_id = "user_1a3e0e8 -a2d8-4950-bafa-24020e09b2a5"
+
+    with pytest.raises(PUUIDError):
+        _ = UserUUID.from_string(serial_user_id, trusted=True)
+
+
 def test_factory() -> None:
     user_id = UserUUID.factory()
     assert type(user_id) is UserUUID
@@ -566,3 +793,120 @@ def test_to_string_is_cached() -> None:
     s1 = user_id.to_string()
     s2 = user_id.to_string()
     assert s1 is s2  # second call returns the cached string object
+
+
+################################################################################
+#### PUUID memory layout
+################################################################################
+
+
+@pytest.mark.parametrize(
+    "uuid_cls",
+    [
+        PUUIDBase,
+        PUUIDv1,
+        PUUIDv3,
+        PUUIDv4,
+        PUUIDv5,
+        PUUIDv6,
+        PUUIDv7,
+        PUUIDv8,
+        Version1UUID,
+        Version3UUID,
+        Version4UUID,
+        Version5UUID,
+        Version6UUID,
+        Version7UUID,
+        Version8UUID,
+    ],
+)
+def test_slotted_layout(uuid_cls: type[PUUIDBase[str]]) -> None:
+    assert "__dict__" not in dir(uuid_cls)
+    assert "__slots__" in vars(uuid_cls)
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        Version1UUID(),
+        Version3UUID(namespace=NAMESPACE_DNS, name="digon.io"),
+        Version4UUID(),
+        Version5UUID(namespace=NAMESPACE_DNS, name="digon.io"),
+        Version6UUID(),
+        Version7UUID(),
+        Version8UUID(),
+    ],
+)
+def test_instances_have_no_dict(instance: PUUIDBase[str]) -> None:
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.custom_attribute = 1  # type: ignore[attr-defined]
+
+
+def test_pickle_slotted_subclass() -> None:
+    user_id = SlottedUUID()
+    _ = user_id.to_string()
+
+    restored = pickle.loads(pickle.dumps(user_id))
+
+    assert type(restored) is SlottedUUID
+    assert restored == user_id
+    assert restored.to_string() == user_id.to_string()
+
+
+def test_pickle_versionless_class() -> None:
+    any_id = VersionlessUUID(uuid=UUID(int=0x1A3E0E89A2D83950BAFA24020E09B2A5))
+
+    restored = pickle.loads(pickle.dumps(any_id))
+
+    assert type(restored) is VersionlessUUID
+    assert restored == any_id
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        Version1UUID(),
+        Version3UUID(namespace=NAMESPACE_DNS, name="digon.io"),
+        Version4UUID(),
+        Version5UUID(namespace=NAMESPACE_DNS, name="digon.io"),
+        Version6UUID(),
+        Version7UUID(),
+        Version8UUID(),
+    ],
+)
+def test_pickle_specialization(instance: PUUIDBase[str]) -> None:
+    _ = instance.to_string()
+
+    data = pickle.dumps(instance)
+    restored = pickle.loads(data)
+
+    assert type(restored) is type(instance)
+    assert restored == instance
+    assert instance.uuid.bytes in data
+    assert str(instance.uuid).encode() not in data
+
+
+def test_unpickle_specialization_in_fresh_interpreter() -> None:
+    user_id = PUUIDv7[Literal["fresh"]].factory()
+    script = "import pickle, sys; print(pickle.loads(sys.stdin.buffer.read()))"
+
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        input=pickle.dumps(user_id),
+        capture_output=True,
+        check=True,
+    )
+
+    assert result.stdout.decode().strip() == user_id.to_string()
+
+
+def test_uuid_is_created_on_access() -> None:
+    known_uuid = uuid7()
+    user_id = Version7UUID(known_uuid)
+
+    assert "_uuid" not in Version7UUID.__slots__ + PUUIDBase.__slots__
+    assert user_id.uuid == known_uuid
+    assert user_id.uuid is not known_uuid
+    assert user_id == Version7UUID.from_string(f"ver7_{known_uuid}")
+    assert hash(user_id) == hash(Version7UUID.from_string(f"ver7_{known_uuid}"))
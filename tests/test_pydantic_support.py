@@ -1,3 +1,4 @@
+import sys
 from typing import Literal
 from unittest.mock import patch
 
@@ -8,17 +9,25 @@ pytest.importorskip("pydantic_core", reason="pydantic is an optional dependency"
 from pydantic import BaseModel, ValidationError
 
 from puuid import PUUIDv4
+from puuid.base import ERR_MSG
 
 UserUUID = PUUIDv4[Literal["user"]]
 
 
+class TokenUUID(PUUIDv4[Literal["tok"]], codec="base62", accept_canonical=True): ...
+
+
 class User(BaseModel):
     user_id: UserUUID
 
 
+class ApiKey(BaseModel):
+    token: TokenUUID
+
+
 def test_pydantic_not_available_error() -> None:
     """Test that the property error is raised when pydantic is missing."""
-    with patch("puuid.base._PYDANTIC_AVAILABLE", False):
+    with patch.dict(sys.modules, {"pydantic_core": None}):
         with pytest.raises(ModuleNotFoundError) as excinfo:
             UserUUID.__get_pydantic_core_schema__(UserUUID, None)  # type: ignore
         assert "pip install 'pUUID[pydantic]'" in str(excinfo.value)
@@ -62,30 +71,82 @@ def test_deserialization_from_invalid_str(serial_id: str) -> None:
     with pytest.raises(ValidationError) as err:
         _ = User.model_validate_json(serial_json)
 
-    err_msg = (
-        "Value error, Unable to deserialize prefix 'user', separator '_' or UUID "
-        f"for '{UserUUID.__name__}' from '{serial_id}'!"
+    err_msg = ERR_MSG.PREFIX_DESERIALIZATION_ERROR.format(
+        prefix="user", classname=UserUUID.__name__, serial_puuid=serial_id
     )
-    assert err.value.errors()[0]["msg"] == err_msg
+    error = err.value.errors()[0]
+    assert error["msg"] == err_msg
+    assert error["type"] == "puuid_format"
+    assert error["input"] == serial_id
+    assert error["ctx"]["serial_puuid"] == serial_id
 
 
-@pytest.mark.parametrize(
-    "serial_id, serial_type",
-    [
-        ("123", "<class 'int'>"),
-        ("2.5", "<class 'float'>"),
-        ("[1, 2, 3]", "<class 'list'>"),
-    ],
-)
-def test_deserialization_from_invalid_type(serial_id: str, serial_type: str) -> None:
+@pytest.mark.parametrize("serial_id", ["123", "2.5", "[1, 2, 3]"])
+def test_deserialization_from_invalid_type(serial_id: str) -> None:
     serial_json = f'{{"user_id":{serial_id}}}'
 
     with pytest.raises(ValidationError) as err:
         _ = User.model_validate_json(serial_json)
 
-    err_msg = (
-        "Value error, "
-        f"'{UserUUID.__name__}' can not be created from invalid type "
-        f"'{serial_type}' with value '{serial_id}'!"
-    )
-    assert err.value.errors()[0]["msg"] == err_msg
+    assert err.value.errors()[0]["type"] == "string_type"
+
+
+def test_deserialization_from_wrong_version() -> None:
+    serial_id = "user_1a3e0e89-a2d8-7950-bafa-24020e09b2a5"
+
+    with pytest.raises(ValidationError) as err:
+        _ = User.model_validate_json(f'{{"user_id":"{serial_id}"}}')
+
+    assert err.value.errors()[0]["type"] == "puuid_format"
+
+
+def test_validation_of_instance() -> None:
+    user_id = UserUUID.factory()
+
+    assert User(user_id=user_id).user_id is user_id
+
+
+def test_validation_of_str_in_python_mode() -> None:
+    serial_id = "user_1a3e0e89-a2d8-4950-bafa-24020e09b2a5"
+
+    user = User.model_validate({"user_id": serial_id})
+
+    assert user.user_id == UserUUID.from_string(serial_id)
+
+
+def test_python_mode_dump() -> None:
+    user_id = UserUUID.factory()
+
+    assert User(user_id=user_id).model_dump() == {"user_id": user_id.to_string()}
+
+
+def test_json_schema() -> None:
+    schema = User.model_json_schema()["properties"]["user_id"]
+
+    assert schema["type"] == "string"
+    assert schema["minLength"] == schema["maxLength"] == len("user_") + 36
+    assert schema["pattern"].startswith("^user_")
+
+
+def test_codec_validation_and_schema() -> None:
+    token = TokenUUID.factory()
+    schema = ApiKey.model_json_schema()["properties"]["token"]
+
+    assert ApiKey.model_validate_json(f'{{"token":"{token}"}}').token == token
+    assert ApiKey(token=f"tok_{token.uuid}").token == token  # type: ignore[arg-type]
+    assert ApiKey(token=token).model_dump() == {"token": token.to_string()}
+    assert (schema["minLength"], schema["maxLength"]) == (4 + 22, 4 + 36)
+    with pytest.raises(ValidationError):
+        _ = ApiKey.model_validate({"token": "tok_" + "~" * 22})
+
+
+def test_validation_uses_interning_cache() -> None:
+    serial_id = UserUUID.factory().to_string()
+    UserUUID.enable_cache()
+    try:
+        first = User.model_validate({"user_id": serial_id}).user_id
+        second = User.model_validate_json(f'{{"user_id":"{serial_id}"}}').user_id
+    finally:
+        UserUUID.disable_cache()
+
+    assert first is second
@@ -0,0 +1,114 @@
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDBase, PUUIDError, PUUIDv4, PUUIDv7, register_puuid
+from puuid.base import ERR_MSG
+
+AccountV4UUID = PUUIDv4[Literal["acc"]]
+AccountV7UUID = PUUIDv7[Literal["acc"]]
+InvoiceUUID = PUUIDv7[Literal["inv"]]
+SnakeUUID = PUUIDv4[Literal["snake_case"]]
+
+
+@register_puuid
+class OrgUUID(PUUIDv7[Literal["org"]]): ...
+
+
+def test_peek_prefix() -> None:
+    assert PUUIDBase.peek_prefix("inv_not-even-a-uuid") == "inv"
+    assert PUUIDBase.peek_prefix(SnakeUUID().to_string()) == "snake_case"
+
+
+def test_peek_prefix_without_separator() -> None:
+    with pytest.raises(PUUIDError) as err:
+        PUUIDBase.peek_prefix("invoice")
+    assert err.value.message == ERR_MSG.MISSING_PREFIX_SEPARATOR.format(
+        serial_puuid="invoice"
+    )
+
+
+@pytest.mark.parametrize(
+    "uuid_cls", [InvoiceUUID, SnakeUUID, AccountV4UUID, AccountV7UUID, OrgUUID]
+)
+def test_parse_any(uuid_cls: type[PUUIDBase[str]]) -> None:
+    puuid = uuid_cls.factory()
+
+    parsed = PUUIDBase.parse_any(puuid.to_string())
+
+    assert type(parsed) is uuid_cls
+    assert parsed == puuid
+
+
+def test_parse_any_restricted_to_subclasses() -> None:
+    serial = InvoiceUUID().to_string()
+    assert type(PUUIDv7.parse_any(serial)) is InvoiceUUID
+
+    with pytest.raises(PUUIDError) as err:
+        PUUIDv4.parse_any(serial)
+    assert err.value.message == ERR_MSG.PARSE_ANY_CLASS_MISMATCH.format(
+        serial_puuid=serial, registered=InvoiceUUID.__name__, classname="PUUIDv4"
+    )
+
+
+def test_parse_any_unknown_prefix() -> None:
+    serial = "unknown_1a3e0e89-a2d8-4950-bafa-24020e09b2a5"
+    with pytest.raises(PUUIDError) as err:
+        PUUIDBase.parse_any(serial)
+    assert err.value.message == ERR_MSG.UNKNOWN_PREFIX.format(
+        prefix="unknown", serial_puuid=serial
+    )
+
+
+@pytest.mark.parametrize(
+    "serial, version",
+    [
+        ("acc_1a3e0e89-a2d8-1950-bafa-24020e09b2a5", 1),
+        ("acc_invalid", None),
+    ],
+)
+def test_parse_any_unknown_version(serial: str, version: int | None) -> None:
+    with pytest.raises(PUUIDError) as err:
+        PUUIDBase.parse_any(serial)
+    assert err.value.message == ERR_MSG.UNKNOWN_PREFIX_VERSION.format(
+        version=version, prefix="acc", serial_puuid=serial
+    )
+
+
+def test_register_conflicting_class() -> None:
+    class OtherInvoiceUUID(PUUIDv7[str]):
+        _prefix = "inv"
+
+    with pytest.raises(PUUIDError) as err:
+        register_puuid(OtherInvoiceUUID)
+    assert err.value.message == ERR_MSG.PREFIX_ALREADY_REGISTERED.format(
+        prefix="inv",
+        version=7,
+        registered=InvoiceUUID.__name__,
+        classname=OtherInvoiceUUID.__name__,
+    )
+
+
+class ScopedUUID[TPrefix: str](PUUIDv7[TPrefix]): ...
+
+
+def test_subscription_of_unrelated_generic_subclass() -> None:
+    scoped_cls = ScopedUUID[Literal["inv"]]
+
+    assert ScopedUUID[Literal["inv"]] is scoped_cls
+    assert type(PUUIDBase.parse_any(scoped_cls().to_string())) is InvoiceUUID
+    with pytest.raises(PUUIDError):
+        register_puuid(scoped_cls)
+
+
+def test_register_base_class_keeps_subclass() -> None:
+    register_puuid(PUUIDv7[Literal["org"]])
+    assert type(PUUIDBase.parse_any(OrgUUID().to_string())) is OrgUUID
+
+
+def test_register_empty_prefix() -> None:
+    with pytest.raises(PUUIDError) as err:
+        register_puuid(PUUIDv4)
+    assert err.value.message == ERR_MSG.EMPTY_PREFIX_DISALLOWED.format(
+        classname="PUUIDv4"
+    )
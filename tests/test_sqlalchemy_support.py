@@ -1,14 +1,21 @@
+import random
+from datetime import UTC, datetime
 from sqlite3 import Connection
 from typing import Generator, Literal
+from unittest.mock import patch
+from uuid import UUID
 
 import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.engine import Engine, create_engine
 from sqlalchemy.event import listen
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.sql.schema import ForeignKey
 
-from puuid import PUUIDv4
+from puuid import PUUIDError, PUUIDv4, PUUIDv6, PUUIDv7
 from puuid.sqlalchemy import SqlPUUID
 
 ################################################################################
@@ -42,6 +49,59 @@ class AddressORM(BaseORM):
     )
 
 
+DeviceUUID = PUUIDv7[Literal["device"]]
+
+
+class TokenUUID(PUUIDv7[Literal["tok"]], codec="base32"): ...
+
+
+class LegacyTokenUUID(TokenUUID, accept_canonical=True): ...
+
+
+class DeviceORM(BaseORM):
+    __tablename__ = "device_table"
+
+    id: Mapped[DeviceUUID] = mapped_column(
+        SqlPUUID(DeviceUUID, binary=True), primary_key=True, default=DeviceUUID.factory
+    )
+    user_id: Mapped[UserUUID | None] = mapped_column(
+        SqlPUUID(UserUUID, binary=True), default=None, nullable=True
+    )
+
+
+SessionUUID = PUUIDv7[Literal["session"]]
+
+
+class SessionORM(BaseORM):
+    __tablename__ = "session_table"
+
+    id: Mapped[SessionUUID] = mapped_column(
+        SqlPUUID(SessionUUID, trusted=True), primary_key=True
+    )
+    device_id: Mapped[DeviceUUID] = mapped_column(
+        SqlPUUID(DeviceUUID, binary=True, trusted=True)
+    )
+
+
+EventUUID = PUUIDv7[Literal["evt"]]
+LegacyEventUUID = PUUIDv6[Literal["evt"]]
+
+
+class CompactEventUUID(PUUIDv7[Literal["cevt"]], codec="base62"): ...
+
+
+class EventORM(BaseORM):
+    __tablename__ = "event_table"
+
+    id: Mapped[EventUUID] = mapped_column(SqlPUUID(EventUUID), primary_key=True)
+    legacy_id: Mapped[LegacyEventUUID] = mapped_column(SqlPUUID(LegacyEventUUID))
+    compact_id: Mapped[CompactEventUUID] = mapped_column(SqlPUUID(CompactEventUUID))
+    binary_id: Mapped[EventUUID] = mapped_column(SqlPUUID(EventUUID, binary=True))
+
+
+DAYS = [datetime(2024, 5, day, 12, tzinfo=UTC) for day in range(1, 8)]
+
+
 @pytest.fixture()
 def engine() -> Generator[Engine, None, None]:
     url = "sqlite:///:memory:"
@@ -105,6 +165,67 @@ def test_deserialize(db: Session) -> None:
     assert address_ref_2.user_id is None
 
 
+def test_binary_storage(db: Session) -> None:
+    device_id = DeviceUUID()
+    user_id = UserUUID()
+    db.add(DeviceORM(id=device_id, user_id=user_id))
+    db.add(DeviceORM(id=DeviceUUID()))
+    db.commit()
+    db.expunge_all()
+
+    device = db.get(DeviceORM, device_id)
+    assert device is not None
+    assert type(device.id) is DeviceUUID
+    assert device.id == device_id
+    assert device.user_id == user_id
+
+    found = db.scalars(select(DeviceORM).where(DeviceORM.user_id == user_id)).one()
+    assert found.id == device_id
+
+    raw = db.execute(
+        text(
+            "SELECT typeof(id), length(id), id FROM device_table WHERE user_id IS NOT NULL"
+        )
+    ).one()
+    assert tuple(raw) == ("blob", 16, device_id.uuid.bytes)
+
+
+def test_binary_storage_ddl() -> None:
+    table = DeviceORM.__table__
+    sqlite_ddl = str(CreateTable(table).compile(dialect=sqlite.dialect()))
+    postgresql_ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+    string_ddl = str(CreateTable(UserORM.__table__).compile(dialect=sqlite.dialect()))
+
+    assert "id BLOB NOT NULL" in sqlite_ddl
+    assert "id UUID NOT NULL" in postgresql_ddl
+    assert "id VARCHAR(41) NOT NULL" in string_ddl
+
+
+def test_binary_bind_param() -> None:
+    device_id = DeviceUUID()
+    column_type = SqlPUUID(DeviceUUID, binary=True)
+
+    assert column_type.process_bind_param(device_id, sqlite.dialect()) == (
+        device_id.uuid.bytes
+    )
+    assert column_type.process_bind_param(device_id, postgresql.dialect()) == (
+        device_id.uuid
+    )
+    assert column_type.process_result_value(device_id.uuid, postgresql.dialect()) == (
+        device_id
+    )
+
+
+@pytest.mark.parametrize(
+    "value", [b"\x00" * 15, DeviceUUID().uuid.bytes[:15] + b"\x00"]
+)
+def test_binary_result_value_is_validated(value: bytes) -> None:
+    column_type = SqlPUUID(UserUUID, binary=True)
+
+    with pytest.raises(PUUIDError):
+        _ = column_type.process_result_value(value, sqlite.dialect())
+
+
 ################################################################################
 #### Util
 ################################################################################
@@ -146,3 +267,121 @@ def set_sqlite_pragma(
     cursor.close()
 
     dbapi_connection.autocommit = ac
+
+
+def test_varchar_length_follows_codec() -> None:
+    assert SqlPUUID(TokenUUID).impl_instance.length == len("tok_") + 26
+    assert SqlPUUID(LegacyTokenUUID).impl_instance.length == len("tok_") + 36
+
+
+def test_result_value_uses_interning_cache() -> None:
+    serial_id = UserUUID.factory().to_string()
+    column_type = SqlPUUID(UserUUID)
+    UserUUID.enable_cache()
+    try:
+        first = column_type.process_result_value(serial_id, sqlite.dialect())
+        second = column_type.process_result_value(serial_id, sqlite.dialect())
+    finally:
+        UserUUID.disable_cache()
+
+    assert first is second
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_trusted_result_value(binary: bool) -> None:
+    device_id = DeviceUUID()
+    column_type = SqlPUUID(DeviceUUID, binary=binary, trusted=True)
+    dialect = sqlite.dialect()
+    stored = column_type.process_bind_param(device_id, dialect)
+
+    with patch.object(PUUIDv7, "__init__", side_effect=AssertionError):
+        loaded = column_type.process_result_value(stored, dialect)
+
+    assert type(loaded) is DeviceUUID
+    assert loaded == device_id
+    assert column_type.process_result_value(device_id.uuid, dialect) == device_id
+
+
+def test_trusted_orm_roundtrip(db: Session) -> None:
+    session_id, device_id = SessionUUID(), DeviceUUID()
+    db.add(SessionORM(id=session_id, device_id=device_id))
+    db.commit()
+    db.expunge_all()
+
+    session = db.scalars(select(SessionORM)).one()
+
+    assert type(session.id) is SessionUUID and session.id == session_id
+    assert type(session.device_id) is DeviceUUID and session.device_id == device_id
+
+
+################################################################################
+#### Creation Time Filters
+################################################################################
+
+
+def created_at[T: PUUIDv6[str] | PUUIDv7[str]](
+    puuid_cls: type[T], instant: datetime
+) -> T:
+    """Return a random ID of `puuid_cls` created at `instant`."""
+    low = puuid_cls.min_for(instant).sort_key
+    high = puuid_cls.max_for(instant).sort_key
+    return puuid_cls(uuid=UUID(int=low | random.getrandbits(128) & (low ^ high)))
+
+
+def add_events(db: Session) -> list[EventORM]:
+    events = [
+        EventORM(
+            id=created_at(EventUUID, day),
+            legacy_id=created_at(LegacyEventUUID, day),
+            compact_id=created_at(CompactEventUUID, day),
+            binary_id=created_at(EventUUID, day),
+        )
+        for day in random.sample(DAYS, len(DAYS))
+    ]
+    db.add_all(events)
+    db.commit()
+    return sorted(events, key=lambda event: event.id)
+
+
+@pytest.mark.parametrize(
+    "column",
+    [EventORM.id, EventORM.legacy_id, EventORM.compact_id, EventORM.binary_id],
+)
+def test_created_between(db: Session, column: Mapped[EventUUID]) -> None:
+    events = add_events(db)
+
+    found = db.scalars(
+        select(EventORM)
+        .where(column.created_between(DAYS[2], DAYS[4]))
+        .order_by(EventORM.id)
+    ).all()
+
+    assert found == events[2:5]
+
+
+@pytest.mark.parametrize(
+    "column",
+    [EventORM.id, EventORM.legacy_id, EventORM.compact_id, EventORM.binary_id],
+)
+def test_created_after_and_before(db: Session, column: Mapped[EventUUID]) -> None:
+    events = add_events(db)
+    query = select(EventORM).order_by(EventORM.id)
+
+    assert db.scalars(query.where(column.created_after(DAYS[4]))).all() == events[5:]
+    assert db.scalars(query.where(column.created_before(DAYS[2]))).all() == events[:2]
+
+
+def test_created_between_compiles_to_between() -> None:
+    expression = EventORM.id.created_between(DAYS[0], DAYS[1])
+    compiled = expression.compile(dialect=sqlite.dialect())
+
+    assert "event_table.id BETWEEN" in str(compiled)
+    assert list(compiled.params.values()) == [
+        EventUUID.min_for(DAYS[0]),
+        EventUUID.max_for(DAYS[1]),
+    ]
+
+
+def test_creation_time_filter_requires_time_ordered_ids() -> None:
+    with pytest.raises(PUUIDError):
+        _ = UserORM.id.created_after(DAYS[0])
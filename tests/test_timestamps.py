@@ -0,0 +1,122 @@
+import datetime as dt
+import time
+from typing import Literal
+
+import pytest
+
+from puuid import PUUIDError, PUUIDv1, PUUIDv6, PUUIDv7
+from puuid.base import ERR_MSG
+
+EventUUID = PUUIDv7[Literal["evt"]]
+LegacyEventUUID = PUUIDv6[Literal["evt"]]
+NodeEventUUID = PUUIDv1[Literal["evt"]]
+TIME_BASED = [EventUUID, LegacyEventUUID, NodeEventUUID]
+TIME_ORDERED = [EventUUID, LegacyEventUUID]
+INSTANT = dt.datetime(2024, 5, 17, 12, 30, 45, 123456, tzinfo=dt.UTC)
+
+
+@pytest.mark.parametrize("puuid_cls", TIME_BASED)
+def test_timestamp_of_new_ids(
+    puuid_cls: type[EventUUID | LegacyEventUUID | NodeEventUUID],
+) -> None:
+    before = time.time()
+    puuid = puuid_cls.factory()
+
+    # no upper bound, generators stay monotonic if the clock was ahead before
+    assert puuid.timestamp >= before - 0.002
+    assert puuid.datetime.tzinfo is dt.UTC
+    assert puuid.datetime.timestamp() == pytest.approx(puuid.timestamp, abs=1e-3)
+
+
+def test_v7_timestamp_resolution() -> None:
+    event_id = EventUUID.min_for(INSTANT)
+
+    assert event_id.datetime == INSTANT.replace(microsecond=123000)
+    assert event_id.timestamp == 1715949045.123
+
+
+def test_gregorian_timestamp_resolution() -> None:
+    node_event_id = NodeEventUUID.from_string(
+        "evt_48609f00-1449-11ef-8000-000000000000"
+    )
+
+    assert node_event_id.datetime == INSTANT
+    assert LegacyEventUUID.min_for(INSTANT).datetime == INSTANT
+    assert LegacyEventUUID.max_for(INSTANT).datetime == INSTANT
+
+
+def test_no_bounds_for_v1() -> None:
+    # the low timestamp bits come first, v1 integers are not time-ordered
+    assert not hasattr(NodeEventUUID, "min_for")
+    assert not hasattr(NodeEventUUID, "max_for")
+
+
+@pytest.mark.parametrize(
+    ("puuid_cls", "version"), [(EventUUID, 7), (LegacyEventUUID, 6)]
+)
+def test_bounds_are_valid_ids(
+    puuid_cls: type[EventUUID | LegacyEventUUID], version: int
+) -> None:
+    low, high = puuid_cls.min_for(INSTANT), puuid_cls.max_for(INSTANT)
+
+    for bound in (low, high):
+        assert bound.uuid.version == version
+        assert puuid_cls.from_string(bound.to_string()) == bound
+    assert low.sort_key < high.sort_key
+
+
+def test_v7_bounds_layout() -> None:
+    low, high = EventUUID.min_for(INSTANT), EventUUID.max_for(INSTANT)
+
+    assert low.to_string() == "evt_018f8688-8583-7000-8000-000000000000"
+    assert high.to_string() == "evt_018f8688-8583-7fff-bfff-ffffffffffff"
+
+
+@pytest.mark.parametrize("puuid_cls", TIME_ORDERED)
+def test_bounds_enclose_ids_of_same_instant(
+    puuid_cls: type[EventUUID | LegacyEventUUID],
+) -> None:
+    for puuid in puuid_cls.factory_many(50):
+        assert (
+            puuid_cls.min_for(puuid.datetime)
+            <= puuid
+            <= puuid_cls.max_for(puuid.datetime)
+        )
+
+
+def test_range_query_on_sorted_ids() -> None:
+    ids = EventUUID.factory_many(20)
+    start = ids[0].datetime
+
+    within = [
+        p for p in ids if EventUUID.min_for(start) <= p <= EventUUID.max_for(start)
+    ]
+
+    assert within == [p for p in ids if p.datetime == start]
+
+
+def test_naive_datetime_is_local_time() -> None:
+    naive = dt.datetime(2024, 5, 17, 12, 30, 45)
+
+    assert EventUUID.min_for(naive).timestamp == naive.timestamp()
+
+
+@pytest.mark.parametrize(
+    ("puuid_cls", "instant"),
+    [
+        (EventUUID, dt.datetime(1969, 12, 31, tzinfo=dt.UTC)),
+        (LegacyEventUUID, dt.datetime(1582, 10, 14, tzinfo=dt.UTC)),
+    ],
+)
+def test_instant_out_of_range(
+    puuid_cls: type[EventUUID | LegacyEventUUID],
+    instant: dt.datetime,
+) -> None:
+    with pytest.raises(PUUIDError) as err:
+        _ = puuid_cls.min_for(instant)
+    assert err.value.message == ERR_MSG.TIMESTAMP_OUT_OF_RANGE.format(
+        timestamp_ns=(instant - dt.datetime(1970, 1, 1, tzinfo=dt.UTC))
+        // dt.timedelta(microseconds=1)
+        * 1000,
+        classname=puuid_cls.__name__,
+    )